@@ -8,23 +8,36 @@ registers routes, and starts the application.
 from flask import Flask
 from flask_cors import CORS
 from flask_smorest import Api
+from commands import register_commands
 from database.db_setup import init_db
+from monitoring import init_monitoring
 from routes import register_routes
+from routes.pagination import NEXT_CURSOR_HEADER
+
+CORS_EXPOSE_HEADERS = [NEXT_CURSOR_HEADER, 'ETag']
 
 app = Flask(__name__)
-CORS(app, resources={r"/*": {"origins": "*"}}, supports_credentials=True)
+CORS(app, resources={r"/*": {"origins": "*"}}, supports_credentials=True,
+     expose_headers=CORS_EXPOSE_HEADERS)
 app.config['API_TITLE'] = 'Barber System'
 app.config['API_VERSION'] = '1.0'
 app.config['OPENAPI_VERSION'] = '3.0.2'
 app.config['OPENAPI_URL_PREFIX'] = '/api/docs'
 app.config['OPENAPI_SWAGGER_UI_PATH'] = '/swagger-ui'
 app.config['OPENAPI_SWAGGER_UI_URL'] = 'https://cdn.jsdelivr.net/npm/swagger-ui-dist/'
+app.config['FAST_SERIALIZATION'] = True
+app.config['MONITORING'] = True
+app.config['QUERY_PROFILING'] = True
 
 api = Api(app)
 
 init_db(app)
 
+init_monitoring(app)
+
 register_routes(api)
 
+register_commands(app)
+
 if __name__ == '__main__':
     app.run(debug=True)
@@ -0,0 +1,165 @@
+"""
+ASGI entry point for the async serving mode.
+
+The listing routes are served by async handlers with async database
+sessions, so a single process keeps many reads in flight while waiting on
+the database. Every other request is handed to the Flask app, run in a
+thread pool by asgiref. The Flask app served by `app.py` remains the
+default mode.
+
+Requires `pip install asgiref uvicorn` and the async driver of the database
+(`aiosqlite` or `asyncpg`), then run with:
+
+    uvicorn asgi:application
+"""
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from asgiref.wsgi import WsgiToAsgi
+from app import CORS_EXPOSE_HEADERS, app
+from database.async_setup import AsyncDatabase
+from database.config import DATABASE_REPLICA_URI, DATABASE_URI
+from monitoring import monitor_engine
+from monitoring.instrumentation import record_request_stats, start_request_stats
+from monitoring.profiler import profiled_route
+from routes.appointment_routes import get_appointments_async
+from routes.async_listing import AsyncRequest, AsyncResponse, error_response
+from routes.customer_routes import get_customers_async
+from routes.employee_routes import get_employees_async
+from routes.service_routes import get_services_async
+
+Scope = Dict[str, Any]
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+
+ASYNC_ROUTES = {
+    '/customers': get_customers_async,
+    '/employees': get_employees_async,
+    '/services': get_services_async,
+    '/appointments': get_appointments_async,
+}
+
+
+def _cors_headers(request: AsyncRequest) -> List[Tuple[str, str]]:
+    """
+    Builds the CORS headers Flask-CORS adds to the Flask app responses,
+    as configured in app.py.
+
+    Args:
+        request (AsyncRequest): The request.
+
+    Returns:
+        List[Tuple[str, str]]: The CORS headers, none if the request has no Origin.
+    """
+
+    origin = request.headers.get('origin')
+
+    if origin is None:
+        return []
+
+    return [('Access-Control-Allow-Origin', origin),
+            ('Access-Control-Expose-Headers', ', '.join(sorted(CORS_EXPOSE_HEADERS))),
+            ('Access-Control-Allow-Credentials', 'true'),
+            ('Vary', 'Origin')]
+
+
+class AsyncApplication():
+    """
+    ASGI application serving the async routes, and the Flask app for every other request.
+
+    Attributes:
+        routes (Dict[str, Callable]): The async route handlers of GET requests, by path.
+        wsgi (WsgiToAsgi): The Flask app, adapted to ASGI.
+        database (Optional[AsyncDatabase]): The async engines, created on startup.
+    """
+
+    def __init__(self, routes: Dict[str, Callable[..., Awaitable[AsyncResponse]]]) -> None:
+        self.routes = routes
+        self.wsgi = WsgiToAsgi(app)
+        self.database: Optional[AsyncDatabase] = None
+
+    def _get_database(self) -> AsyncDatabase:
+        """
+        Retrieves the async engines, created on first use when the server
+        does not send lifespan events.
+        """
+
+        if self.database is None:
+            self.database = AsyncDatabase(DATABASE_URI, DATABASE_REPLICA_URI)
+
+            # The cursor events of an async engine are dispatched by its sync engine.
+            for engine in self.database.engines:
+                monitor_engine(app, engine.sync_engine)
+
+        return self.database
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        """
+        Creates the async engines on startup and closes their connections on shutdown.
+        """
+
+        while True:
+            message = await receive()
+
+            if message['type'] == 'lifespan.startup':
+                self._get_database()
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                if self.database is not None:
+                    await self.database.dispose()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _respond(self, request: AsyncRequest,
+                       handler: Callable[..., Awaitable[AsyncResponse]]) -> AsyncResponse:
+        """
+        Runs an async route handler on a read replica session.
+
+        The request is recorded in the metrics registry under its path, which
+        is also its Flask route rule, when monitoring is enabled, and its slow
+        statements are attributed to the route. Unexpected errors are logged
+        and answered with the API's 500 error body.
+        """
+
+        monitoring = app.config.get('MONITORING', False)
+
+        if monitoring:
+            start_request_stats()
+
+        with profiled_route(f'{request.method} {request.path}'):
+            try:
+                async with self._get_database().replica_session() as session:
+                    response = await handler(request, session)
+            except Exception:  # pylint: disable=broad-exception-caught
+                app.logger.exception('Exception on %s [%s]', request.path, request.method)
+                response = error_response(500)
+
+        if monitoring:
+            record_request_stats(request.method, request.path, response.status)
+
+        return response
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+
+        handler = (self.routes.get(scope['path'])
+                   if scope['type'] == 'http' and scope['method'] == 'GET' else None)
+
+        if handler is None:
+            await self.wsgi(scope, receive, send)
+            return
+
+        request = AsyncRequest.from_scope(scope)
+        response = await self._respond(request, handler)
+
+        await send({
+            'type': 'http.response.start',
+            'status': response.status,
+            'headers': [(name.encode('latin-1'), value.encode('latin-1'))
+                        for name, value in [*response.headers, *_cors_headers(request)]],
+        })
+        await send({'type': 'http.response.body', 'body': response.body})
+
+
+application = AsyncApplication(ASYNC_ROUTES)
@@ -0,0 +1,166 @@
+"""
+Business module for the revenue, bookings and utilization reports.
+"""
+
+from collections import defaultdict
+from typing import Any, DefaultDict, Dict, List, Optional, Tuple
+from datetime import date, datetime, timedelta
+from repositories.analytics_repository import (
+    add_to_rollups, get_days_rollup, get_employees_rollup, get_services_rollup)
+from repositories.employee_repository import get_employees_count
+from validations.analytics_validation import AnalyticsValidation
+from validations.appointment_validation import AppointmentValidation
+
+# Minutes an employee can be booked per day, between opening and closing.
+DAY_CAPACITY_MINUTES = (
+    datetime.combine(date.min, AppointmentValidation.CLOSING_TIME)
+    - datetime.combine(date.min, AppointmentValidation.OPENING_TIME)
+) // timedelta(minutes=1)
+
+
+def _utilization(booked_minutes: int, capacity_minutes: int) -> float:
+    """
+    Computes the share of the capacity taken by the appointments.
+
+    Args:
+        booked_minutes (int): The appointments duration.
+        capacity_minutes (int): The bookable duration.
+
+    Returns:
+        float: The utilization, rounded to 4 decimals, or 0 without capacity.
+    """
+
+    return round(booked_minutes / capacity_minutes, 4) if capacity_minutes else 0.0
+
+
+def add_bookings_to_rollups(appointments: List[Dict[str, Any]]) -> None:
+    """
+    Adds new appointments to the employees and services daily rollups, in the
+    caller's transaction.
+
+    The appointments are first summed per day and employee or service, so a
+    batch updates each rollup row once.
+
+    Args:
+        appointments (List[Dict[str, Any]]): The appointments 'date', 'end_date',
+            'employee_id' and 'services', the list of their CatalogEntry.
+    """
+
+    employees: DefaultDict[Tuple[date, int], List[int]] = defaultdict(lambda: [0, 0, 0])
+    services: DefaultDict[Tuple[date, int], List[int]] = defaultdict(lambda: [0, 0])
+
+    for appointment in appointments:
+        day = appointment['date'].date()
+        totals = employees[day, appointment['employee_id']]
+        totals[0] += 1
+        totals[1] += sum(service.price for service in appointment['services'])
+        totals[2] += (appointment['end_date'] - appointment['date']) // timedelta(minutes=1)
+
+        for service in appointment['services']:
+            totals = services[day, service.id]
+            totals[0] += 1
+            totals[1] += service.price
+
+    add_to_rollups(
+        [{'day': day, 'employee_id': employee_id, 'bookings': bookings,
+          'revenue': revenue, 'booked_minutes': booked_minutes}
+         for (day, employee_id), (bookings, revenue, booked_minutes) in sorted(employees.items())],
+        [{'day': day, 'service_id': service_id, 'bookings': bookings, 'revenue': revenue}
+         for (day, service_id), (bookings, revenue) in sorted(services.items())])
+
+
+def get_days_report(start: date, end: Optional[date] = None,
+                    employee_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Retrieves the bookings, revenue and chair utilization of every day of a range.
+
+    The capacity of a day is DAY_CAPACITY_MINUTES per registered employee, or
+    for the given employee only.
+
+    Args:
+        start (date): The first day of the range.
+        end (Optional[date]): The last day of the range, included. Defaults to start.
+        employee_id (Optional[int]): Restricts the report to this employee.
+
+    Returns:
+        List[Dict[str, Any]]: The totals of each day, including the days
+        without appointments, in order.
+    """
+
+    end = end or start
+
+    AnalyticsValidation.validate_report(start, end, employee_id)
+
+    totals = {day: (bookings, revenue, booked_minutes)
+              for day, bookings, revenue, booked_minutes
+              in get_days_rollup(start, end, employee_id)}
+    capacity = DAY_CAPACITY_MINUTES * (1 if employee_id is not None else get_employees_count())
+    report = []
+
+    for offset in range((end - start).days + 1):
+        day = start + timedelta(days=offset)
+        bookings, revenue, booked_minutes = totals.get(day, (0, 0, 0))
+        report.append({
+            'day': day,
+            'bookings': bookings,
+            'revenue': revenue,
+            'booked_minutes': booked_minutes,
+            'capacity_minutes': capacity,
+            'utilization': _utilization(booked_minutes, capacity)
+        })
+
+    return report
+
+
+def get_employees_report(start: date, end: Optional[date] = None) -> List[Dict[str, Any]]:
+    """
+    Retrieves the bookings, revenue and chair utilization of every employee
+    with appointments over a range of days.
+
+    Args:
+        start (date): The first day of the range.
+        end (Optional[date]): The last day of the range, included. Defaults to start.
+
+    Returns:
+        List[Dict[str, Any]]: The totals of each employee, ordered by employee.
+    """
+
+    end = end or start
+
+    AnalyticsValidation.validate_report(start, end)
+
+    capacity = DAY_CAPACITY_MINUTES * ((end - start).days + 1)
+
+    return [
+        {
+            'employee_id': employee_id,
+            'bookings': bookings,
+            'revenue': revenue,
+            'booked_minutes': booked_minutes,
+            'capacity_minutes': capacity,
+            'utilization': _utilization(booked_minutes, capacity)
+        }
+        for employee_id, bookings, revenue, booked_minutes in get_employees_rollup(start, end)
+    ]
+
+
+def get_services_report(start: date, end: Optional[date] = None) -> List[Dict[str, Any]]:
+    """
+    Retrieves the bookings and revenue of every booked service over a range of days.
+
+    Args:
+        start (date): The first day of the range.
+        end (Optional[date]): The last day of the range, included. Defaults to start.
+
+    Returns:
+        List[Dict[str, Any]]: The totals of each service, ordered by service.
+    """
+
+    end = end or start
+
+    AnalyticsValidation.validate_report(start, end)
+
+    return [
+        {'service_id': service_id, 'bookings': bookings, 'revenue': revenue}
+        for service_id, bookings, revenue in get_services_rollup(start, end)
+    ]
@@ -2,12 +2,22 @@
 Business module for Appointment entities.
 """
 
-from typing import List
+from typing import Any, Dict, List
 from datetime import datetime
+from flask_smorest import abort
+from sqlalchemy.exc import IntegrityError
 from database.db_setup import db
 from database.models.appointment import Appointment
-from repositories.service_repository import get_service
+from business.analytics_business import add_bookings_to_rollups
+from business.bulk_business import build_batch_results
+from business.schedule_business import schedule_entry
+from repositories.appointment_repository import (
+    get_appointment, insert_appointment_if_available, insert_appointments)
+from repositories.schedule_repository import insert_schedule_entries
+from repositories.service_repository import get_services_by_services_ids
+from repositories.table_version_repository import bump_table_version
 from validations.appointment_validation import AppointmentValidation
+from validations.bulk_validation import BulkValidation
 
 
 def create_appointment(date: str, customer_id: int,
@@ -15,6 +25,13 @@ def create_appointment(date: str, customer_id: int,
     """
     Creates a new appointment.
 
+    The date availability is checked by the insert itself, backed by the
+    unique indexes and, on PostgreSQL, the exclusion constraints of the
+    appointment table, so concurrent bookings of the same employee or customer
+    cannot both succeed: the loser's IntegrityError is answered with a 409. The
+    appointment's schedule entry is inserted, the analytics rollups are
+    updated and the appointment table version is bumped in the same transaction.
+
     Args:
         date (str): The appointment's date.
         customer_id (int): The customer's ID who booked the service.
@@ -25,21 +42,96 @@ def create_appointment(date: str, customer_id: int,
         Appointment: Created appointment.
     """
 
-    date = datetime.strptime(date, '%Y-%m-%d %H:%M:%S')
-
-    AppointmentValidation.validate_appointment(date,
-                                               customer_id, employee_id, services_ids)
+    date = datetime.strptime(date, AppointmentValidation.DATE_FORMAT)
 
-    services = [get_service(service_id) for service_id in services_ids]
+    services = AppointmentValidation.validate_appointment(date,
+                                                          customer_id, employee_id, services_ids)
 
-    appointment = Appointment(date, services,
-                              employee_id, customer_id)
+    end_date = Appointment.get_end_date(date, services)
 
     try:
-        db.session.add(appointment)
+        appointment_id = insert_appointment_if_available(
+            date, end_date, AppointmentValidation.MAX_APPOINTMENT_DURATION,
+            customer_id, employee_id, services_ids)
+
+        if appointment_id is not None:
+            insert_schedule_entries([schedule_entry(
+                appointment_id, date, end_date, customer_id, employee_id, services)])
+            add_bookings_to_rollups([{'date': date, 'end_date': end_date,
+                                      'employee_id': employee_id, 'services': services}])
+            bump_table_version(Appointment.__tablename__)
+
         db.session.commit()
+    except IntegrityError:
+        # A unique index or, on PostgreSQL, an exclusion constraint rejected a
+        # booking made concurrently.
+        db.session.rollback()
+        appointment_id = None
+    except Exception as error:
+        db.session.rollback()
+        raise error
+
+    if appointment_id is None:
+        abort(409, errors={
+            'json': {
+                'date': ['Selecetd date is unavailable.']
+            }
+        })
+
+    return get_appointment(appointment_id)
+
+
+def create_appointments(appointments: List[Dict[str, Any]],
+                        historical: bool = False) -> List[Dict[str, Any]]:
+    """
+    Creates a batch of appointments.
 
-        return appointment
+    The batch is validated set-wise, including the date availability, and
+    every valid appointment, its services and its schedule entry are inserted,
+    and the analytics rollups updated, with one statement per table, in the
+    transaction that read the booked appointments. Invalid appointments are
+    reported without preventing the others from being created.
+
+    Args:
+        appointments (List[Dict[str, Any]]): The appointments 'date',
+            'customer_id', 'employee_id' and 'services_ids'.
+        historical (bool): Whether the appointments are imported history, exempt
+            from the booking window and business hours rules.
+
+    Returns:
+        List[Dict[str, Any]]: The result of each appointment, in the batch order.
+    """
+
+    BulkValidation.validate_batch_size(appointments)
+
+    try:
+        errors, periods = AppointmentValidation.validate_appointments_batch(
+            appointments, historical)
+        created = [{**appointments[index], 'date': date, 'end_date': end_date,
+                    'services': get_services_by_services_ids(appointments[index]['services_ids'])}
+                   for index, (date, end_date) in periods.items()]
+        appointments_ids = insert_appointments(created)
+
+        if appointments_ids:
+            insert_schedule_entries([
+                schedule_entry(appointment_id, appointment['date'], appointment['end_date'],
+                               appointment['customer_id'], appointment['employee_id'],
+                               appointment['services'])
+                for appointment_id, appointment in zip(appointments_ids, created)
+            ])
+            add_bookings_to_rollups(created)
+            bump_table_version(Appointment.__tablename__)
+
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        abort(409, errors={
+            'json': {
+                'batch': ['Appointments were booked concurrently, please retry the batch.']
+            }
+        })
     except Exception as error:
         db.session.rollback()
         raise error
+
+    return build_batch_results(len(appointments), errors, appointments_ids)
@@ -0,0 +1,116 @@
+"""
+Business module for availability searches.
+"""
+
+import math
+from typing import Dict, List, Optional, Union
+from datetime import datetime, timedelta
+from repositories.appointment_repository import get_employees_appointments_intervals
+from repositories.employee_repository import get_employees_ids_by_services_ids
+from validations.appointment_validation import AppointmentValidation
+from validations.availability_validation import AvailabilityValidation
+
+SLOT_MINUTES = 15
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def _slot_index(date: datetime, origin: datetime, round_up: bool = False) -> int:
+    """
+    Converts a date into its slot index in the search grid.
+
+    Args:
+        date (datetime): The date to convert.
+        origin (datetime): The start of the grid.
+        round_up (bool): Whether a date inside a slot maps to the next slot.
+
+    Returns:
+        int: The slot index.
+    """
+
+    slots = (date - origin) / timedelta(minutes=SLOT_MINUTES)
+
+    return math.ceil(slots) if round_up else math.floor(slots)
+
+
+def _candidate_slots(origin: datetime, now: datetime) -> List[int]:
+    """
+    Lists the slots where an appointment may start: inside business hours and
+    inside the allowed booking range.
+
+    Args:
+        origin (datetime): The start of the grid, midnight of the current day.
+        now (datetime): The current date.
+
+    Returns:
+        List[int]: The candidate slots indexes, in ascending order.
+    """
+
+    last_date = now + timedelta(days=AppointmentValidation.MAX_ADVANCE_DAYS)
+    candidates = []
+
+    for day in range(AppointmentValidation.MAX_ADVANCE_DAYS + 1):
+        date = datetime.combine(origin.date() + timedelta(days=day),
+                                AppointmentValidation.OPENING_TIME)
+        closing = datetime.combine(date.date(), AppointmentValidation.CLOSING_TIME)
+
+        while date < closing:
+            if now <= date <= last_date:
+                candidates.append(_slot_index(date, origin))
+            date += timedelta(minutes=SLOT_MINUTES)
+
+    return candidates
+
+
+def get_available_slots(services_ids: List[int],
+                        employee_id: Optional[int] = None
+                        ) -> List[Dict[str, Union[int, List[str]]]]:
+    """
+    Retrieves every bookable start time for the given services.
+
+    Each employee performing all the services gets a bitmap of SLOT_MINUTES
+    slots covering the booking range, filled from a single query over the
+    range's appointments. A start time is bookable when every slot covered by
+    the services duration is free.
+
+    Args:
+        services_ids (List[int]): The list of service IDs to be booked.
+        employee_id (Optional[int]): Restricts the search to this employee.
+
+    Returns:
+        List[Dict[str, Union[int, List[str]]]]: The bookable start times per employee.
+    """
+
+    services = AvailabilityValidation.validate_availability(services_ids, employee_id)
+    employees_ids = get_employees_ids_by_services_ids(services_ids, employee_id)
+
+    if not employees_ids:
+        return []
+
+    now = datetime.now()
+    origin = datetime.combine(now.date(), datetime.min.time())
+    candidates = _candidate_slots(origin, now)
+    total_duration = timedelta(minutes=sum(service.duration for service in services))
+    duration = math.ceil(total_duration / timedelta(minutes=SLOT_MINUTES))
+    grid_end = origin + timedelta(
+        days=AppointmentValidation.MAX_ADVANCE_DAYS + 1) + total_duration
+    grids = {employee: bytearray(_slot_index(grid_end, origin, round_up=True))
+             for employee in employees_ids}
+
+    for employee, date, end_date in get_employees_appointments_intervals(
+            origin, grid_end, AppointmentValidation.MAX_APPOINTMENT_DURATION, employees_ids):
+        grid = grids[employee]
+        first = max(_slot_index(date, origin), 0)
+        last = min(_slot_index(end_date, origin, round_up=True), len(grid))
+        grid[first:last] = b'\x01' * max(last - first, 0)
+
+    return [
+        {
+            'employee_id': employee,
+            'slots': [
+                (origin + timedelta(minutes=slot * SLOT_MINUTES)).strftime(DATE_FORMAT)
+                for slot in candidates
+                if grids[employee].find(1, slot, slot + duration) == -1
+            ]
+        }
+        for employee in employees_ids
+    ]
@@ -0,0 +1,34 @@
+"""
+Business module for batches of entities.
+"""
+
+from typing import Any, Dict, List
+from validations.bulk_validation import BatchErrors
+
+
+def build_batch_results(size: int, errors: BatchErrors,
+                        created_ids: List[int]) -> List[Dict[str, Any]]:
+    """
+    Builds the per item results of a batch.
+
+    Args:
+        size (int): The number of items in the batch.
+        errors (BatchErrors): The rejected items.
+        created_ids (List[int]): The created records ID's, in the order of
+            the accepted items.
+
+    Returns:
+        List[Dict[str, Any]]: One result per item, in the batch order.
+    """
+
+    created = iter(created_ids)
+    results = []
+
+    for index in range(size):
+        if index in errors:
+            status, messages = errors[index]
+            results.append({'index': index, 'status': status, 'errors': messages})
+        else:
+            results.append({'index': index, 'status': 201, 'id': next(created)})
+
+    return results
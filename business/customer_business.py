@@ -2,8 +2,14 @@
 Business module for Customer entities.
 """
 
+from typing import Any, Dict, List
 from database.models.customer import Customer
 from database.db_setup import db
+from business.bulk_business import build_batch_results
+from repositories.customer_repository import (
+    customer_exists, insert_customers, search_customer_email)
+from repositories.table_version_repository import bump_table_version
+from validations.bulk_validation import BulkValidation
 from validations.customer_validation import CustomerValidation
 
 
@@ -11,6 +17,9 @@ def create_customer(name: str, email: str) -> Customer:
     """
     Creates a new customer.
 
+    The customer table version is bumped in the same transaction, and the cached
+    lookups of the customer ID and email are invalidated once committed.
+
     Args:
         name (str): The customer's name.
         email (str): The customer's email.
@@ -25,9 +34,48 @@ def create_customer(name: str, email: str) -> Customer:
 
     try:
         db.session.add(customer)
+        bump_table_version(Customer.__tablename__)
         db.session.commit()
+    except Exception as error:
+        db.session.rollback()
+        raise error
+
+    # Usually a no-op, since only found rows are cached: see repositories.cache.cached.
+    customer_exists.invalidate(customer.id)
+    search_customer_email.invalidate(email)
+
+    return customer
+
+
+def create_customers(customers: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+    """
+    Creates a batch of customers.
+
+    The batch is validated set-wise and every valid customer is inserted with
+    a single statement, in a single transaction. Invalid customers are
+    reported without preventing the others from being created.
+
+    Args:
+        customers (List[Dict[str, str]]): The customers 'name' and 'email'.
+
+    Returns:
+        List[Dict[str, Any]]: The result of each customer, in the batch order.
+    """
+
+    BulkValidation.validate_batch_size(customers)
+
+    errors = CustomerValidation.validate_customers_batch(customers)
+    valid = [customer for index, customer in enumerate(customers) if index not in errors]
 
-        return customer
+    try:
+        customers_ids = insert_customers(valid)
+
+        if customers_ids:
+            bump_table_version(Customer.__tablename__)
+
+        db.session.commit()
     except Exception as error:
         db.session.rollback()
         raise error
+
+    return build_batch_results(len(customers), errors, customers_ids)
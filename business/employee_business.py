@@ -2,10 +2,14 @@
 Business module for Employee entities.
 """
 
-from typing import List
+from typing import Any, Dict, List
 from database.models.employee import Employee
 from database.db_setup import db
-from repositories.service_repository import get_services_by_services_ids
+from business.bulk_business import build_batch_results
+from repositories.employee_repository import (
+    add_employee_services, employee_exists, insert_employees, search_employee_email)
+from repositories.table_version_repository import bump_table_version
+from validations.bulk_validation import BulkValidation
 from validations.employee_validation import EmployeeValidation
 
 
@@ -13,6 +17,9 @@ def create_employee(name: str, email: str, services: List[int]) -> Employee:
     """
     Creates a new Employee.
 
+    The employee table version is bumped in the same transaction, and the cached
+    lookups of the employee ID and email are invalidated once committed.
+
     Args:
         name (str): The employee's name.
         email (str): The employee's email.
@@ -24,15 +31,57 @@ def create_employee(name: str, email: str, services: List[int]) -> Employee:
 
     EmployeeValidation.validate_employee(email, services)
 
-    services = get_services_by_services_ids(services_ids=services)
-
-    employee = Employee(name, email, services, appointments=[])
+    employee = Employee(name, email, services=[], appointments=[])
 
     try:
         db.session.add(employee)
+        db.session.flush()
+        # The services were validated against the catalog, so they are linked by ID
+        # without loading them.
+        add_employee_services(employee.id, services)
+        bump_table_version(Employee.__tablename__)
         db.session.commit()
+    except Exception as error:
+        db.session.rollback()
+        raise error
+
+    # Usually a no-op, since only found rows are cached: see repositories.cache.cached.
+    employee_exists.invalidate(employee.id)
+    search_employee_email.invalidate(email)
 
-        return employee
+    return employee
+
+
+def create_employees(employees: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Creates a batch of employees.
+
+    The batch is validated set-wise and every valid employee and its services
+    are inserted with one statement per table, in a single transaction.
+    Invalid employees are reported without preventing the others from being
+    created.
+
+    Args:
+        employees (List[Dict[str, Any]]): The employees 'name', 'email' and 'services' ID's.
+
+    Returns:
+        List[Dict[str, Any]]: The result of each employee, in the batch order.
+    """
+
+    BulkValidation.validate_batch_size(employees)
+
+    errors = EmployeeValidation.validate_employees_batch(employees)
+    valid = [employee for index, employee in enumerate(employees) if index not in errors]
+
+    try:
+        employees_ids = insert_employees(valid)
+
+        if employees_ids:
+            bump_table_version(Employee.__tablename__)
+
+        db.session.commit()
     except Exception as error:
         db.session.rollback()
         raise error
+
+    return build_batch_results(len(employees), errors, employees_ids)
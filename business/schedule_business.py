@@ -0,0 +1,63 @@
+"""
+Business module for employees schedules.
+"""
+
+from typing import Any, Dict, List, Optional
+from datetime import date, datetime
+from repositories.projections import ScheduleRecord
+from repositories.read_models import CatalogEntry
+from repositories.schedule_repository import get_schedule
+from validations.schedule_validation import ScheduleValidation
+
+
+def schedule_entry(appointment_id: int, appointment_date: datetime, end_date: datetime,
+                   customer_id: int, employee_id: int,
+                   services: List[CatalogEntry]) -> Dict[str, Any]:
+    """
+    Builds the schedule entry of a new appointment, to be inserted with it.
+
+    Args:
+        appointment_id (int): The appointment ID.
+        appointment_date (datetime): The appointment's date.
+        end_date (datetime): The date when the appointment ends.
+        customer_id (int): The customer's ID.
+        employee_id (int): The employee's ID.
+        services (List[CatalogEntry]): The appointment's services.
+
+    Returns:
+        Dict[str, Any]: The entry, as inserted by insert_schedule_entries.
+    """
+
+    return {
+        'appointment_id': appointment_id,
+        'employee_id': employee_id,
+        'date': appointment_date,
+        'end_date': end_date,
+        'customer_id': customer_id,
+        'services': [service.name for service in services],
+        'price': sum(service.price for service in services)
+    }
+
+
+def get_employees_schedule(start: date, end: Optional[date] = None,
+                           employee_id: Optional[int] = None) -> List[ScheduleRecord]:
+    """
+    Retrieves the appointments of one or every employee over a range of days.
+
+    The schedule is read from the schedule entries, maintained with every
+    booking, so it needs neither the appointments history nor any join.
+
+    Args:
+        start (date): The first day of the range.
+        end (Optional[date]): The last day of the range, included. Defaults to start.
+        employee_id (Optional[int]): Restricts the schedule to this employee.
+
+    Returns:
+        List[ScheduleRecord]: The appointments, ordered by day, employee and date.
+    """
+
+    end = end or start
+
+    ScheduleValidation.validate_schedule(start, end, employee_id)
+
+    return get_schedule(start, end, employee_id)
@@ -2,32 +2,86 @@
 Business module for Service entities.
 """
 
+from typing import Any, Dict, List
 from database.models.service import Service
 from database.db_setup import db
+from repositories.read_models import CatalogEntry
+from repositories.service_repository import SERVICE_TABLE, cache_services, insert_services
+from repositories.table_version_repository import bump_table_version
+from business.bulk_business import build_batch_results
+from validations.bulk_validation import BulkValidation
 from validations.service_validation import ServiceValidation
 
 
-def create_service(name: str, price: int) -> Service:
+def create_service(name: str, price: int, duration: int) -> Service:
     """
     Creates a new Service.
 
+    The service table version is bumped in the same transaction, so every
+    process reloads its service catalog, and this process's catalog is
+    updated in place.
+
     Args:
         name (str): The service's name.
         price (int): The service's price in cents.
+        duration (int): The service's duration in minutes.
 
     Returns:
         Service: Created service.
     """
 
-    ServiceValidation.validate_service(name, price)
+    ServiceValidation.validate_service(name, price, duration)
 
-    service = Service(name=name, price=price, employees=[], appointments=[])
+    service = Service(name=name, price=price, duration=duration,
+                      employees=[], appointments=[])
 
     try:
         db.session.add(service)
+        db.session.flush()
+        version = bump_table_version(SERVICE_TABLE)
         db.session.commit()
+    except Exception as error:
+        db.session.rollback()
+        raise error
+
+    cache_services([CatalogEntry.from_model(service)], version)
+
+    return service
+
+
+def create_services(services: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Creates a batch of services.
+
+    The batch is validated set-wise and every valid service is inserted with
+    a single statement, in a single transaction. Invalid services are
+    reported without preventing the others from being created.
+
+    Args:
+        services (List[Dict[str, Any]]): The services 'name', 'price' and 'duration'.
 
-        return service
+    Returns:
+        List[Dict[str, Any]]: The result of each service, in the batch order.
+    """
+
+    BulkValidation.validate_batch_size(services)
+
+    errors = ServiceValidation.validate_services_batch(services)
+    valid = [service for index, service in enumerate(services) if index not in errors]
+    version = None
+
+    try:
+        created = insert_services(valid)
+
+        if created:
+            version = bump_table_version(SERVICE_TABLE)
+
+        db.session.commit()
     except Exception as error:
         db.session.rollback()
         raise error
+
+    if created:
+        cache_services(created, version)
+
+    return build_batch_results(len(services), errors, [service.id for service in created])
@@ -0,0 +1,25 @@
+"""
+Registers the command line commands with the Flask application.
+"""
+
+from flask import Flask
+from commands.analytics_command import analytics
+from commands.benchmark_command import benchmark
+from commands.import_command import import_data
+from commands.memory_command import benchmark_memory
+from commands.serialization_command import benchmark_serialization
+
+
+def register_commands(app: Flask):
+    """
+    Registers all application commands, run with `flask --app app <command>`.
+
+    Args:
+        app (Flask): The Flask application instance.
+    """
+
+    app.cli.add_command(import_data)
+    app.cli.add_command(benchmark_serialization)
+    app.cli.add_command(benchmark_memory)
+    app.cli.add_command(benchmark)
+    app.cli.add_command(analytics)
@@ -0,0 +1,495 @@
+"""
+Command module for benchmarking the API.
+
+`flask benchmark seed` fills the database with realistic generated rows, see
+`database.generator`. `flask benchmark run` measures the latency percentiles
+and the throughput of the main routes, through the Flask test client or
+against a running server, and saves them as JSON with the commit they were
+measured on. `flask benchmark compare` compares two result files, e.g. of
+two commits. `flask benchmark indexes` measures the hot lookups with and
+without the indexes serving them.
+"""
+
+import http.client
+import json
+import platform
+import statistics
+import subprocess
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+import click
+from flask import current_app
+from sqlalchemy import func, select
+from database.db_setup import db
+from database.generator import Scale, generate_data
+from database.models.appointment import Appointment
+from database.models.customer import Customer
+from database.models.employee import Employee
+from database.models.schedule_entry import ScheduleEntry
+from database.models.service import Service
+from database.models.service_appointment import service_appointment
+from database.models.service_employee import service_employee
+from monitoring.histogram import Histogram
+from repositories.appointment_repository import (
+    get_all_appointments, get_appointments_intervals, get_employees_appointments_intervals)
+from repositories.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from repositories.read_models import Schedule
+from validations.appointment_validation import AppointmentValidation
+
+DATE_FORMAT = AppointmentValidation.DATE_FORMAT
+LISTING_ROUTES = ('/customers', '/employees', '/services', '/appointments')
+SCENARIOS = ('POST /appointment', 'POST /employee',
+             *(f'GET {route}' for route in LISTING_ROUTES), 'GET /schedule')
+
+# The indexes added for the hot lookups, dropped while measuring the lookups without them.
+HOT_INDEXES = (*Appointment.__table__.indexes, *service_employee.indexes,
+               *service_appointment.indexes)
+AVAILABILITY_EMPLOYEES = 50
+
+Request = Tuple[str, str, Optional[Dict[str, Any]]]
+Send = Callable[[str, str, Optional[Dict[str, Any]]], int]
+
+
+@click.group('benchmark')
+def benchmark() -> None:
+    """
+    Seeds a benchmark database, measures the API routes and compares results.
+    """
+
+
+@benchmark.command('seed')
+@click.option('--customers', type=click.IntRange(1), default=10000, show_default=True)
+@click.option('--employees', type=click.IntRange(1), default=100, show_default=True)
+@click.option('--services', type=click.IntRange(1), default=50, show_default=True)
+@click.option('--services-per-employee', type=click.IntRange(1, 10), default=5,
+              show_default=True)
+@click.option('--appointments', type=click.IntRange(0), default=1000000, show_default=True)
+@click.option('--seed', 'seed_value', type=int, default=0, show_default=True,
+              help='Seed of the random generator, so a scale always yields the same rows.')
+@click.option('--until', type=click.DateTime(formats=['%Y-%m-%d']), default=None,
+              help='Day after the last day of appointments. Defaults to today.')
+@click.option('--chunk-size', type=click.IntRange(1), default=50000, show_default=True,
+              help='Rows inserted per executemany.')
+def seed(customers: int, employees: int, services: int, services_per_employee: int,
+         appointments: int, seed_value: int, until: Optional[datetime], chunk_size: int) -> None:
+    """
+    Adds generated customers, services, employees and past appointments to the
+    database. Requires numpy.
+    """
+
+    started = time.perf_counter()
+
+    try:
+        rows = generate_data(Scale(customers, employees, services, services_per_employee,
+                                   appointments), seed_value,
+                             until.date() if until else None, chunk_size)
+    except ValueError as error:
+        raise click.UsageError(str(error)) from error
+
+    click.echo(f"Seeded {rows['customer']} customers, {rows['service']} services, "
+               f"{rows['employee']} employees and {rows['appointment']} appointments in "
+               f"{time.perf_counter() - started:.1f}s.")
+
+
+def _booking_requests(count: int) -> List[Request]:
+    """
+    Builds appointment requests on free slots of the booking window, cycling
+    through the employees, each booking for its own customer.
+
+    Raises:
+        click.UsageError: If there are not enough employees, customers or free slots.
+    """
+
+    employees = db.session.execute(
+        select(service_employee.c.employee_id, Service.id, Service.duration)
+        .join(Service, Service.id == service_employee.c.service_id)
+        .order_by(service_employee.c.employee_id, Service.id)).all()
+    services: Dict[int, Tuple[int, int]] = {}
+
+    for employee_id, service_id, duration in employees:
+        services.setdefault(employee_id, (service_id, duration))
+
+    customers = db.session.execute(
+        select(Customer.id).order_by(Customer.id).limit(len(services))).scalars().all()
+
+    if not services or len(customers) < len(services):
+        raise click.UsageError('Seed the database first with `flask benchmark seed`.')
+
+    tomorrow = date.today() + timedelta(days=1)
+    schedules: Dict[int, Schedule] = defaultdict(Schedule)
+
+    for employee_id, start, end in db.session.execute(
+            select(Appointment.employee_id, Appointment.date, Appointment.end_date)
+            .where(Appointment.date >= datetime.combine(tomorrow, datetime.min.time()))):
+        schedules[employee_id].add(start, end)
+
+    requests: List[Request] = []
+    slot = timedelta(minutes=max(duration for _, duration in services.values()))
+
+    for day in range(AppointmentValidation.MAX_ADVANCE_DAYS - 1):
+        start = datetime.combine(tomorrow + timedelta(days=day), AppointmentValidation.OPENING_TIME)
+
+        while start.time() < AppointmentValidation.CLOSING_TIME:
+            for (employee_id, (service_id, duration)), customer_id in zip(services.items(),
+                                                                           customers):
+                end = start + timedelta(minutes=duration)
+
+                if not schedules[employee_id].overlaps(start, end):
+                    requests.append(('POST', '/appointment', {
+                        'date': start.strftime(DATE_FORMAT), 'customer_id': customer_id,
+                        'employee_id': employee_id, 'services_ids': [service_id]}))
+
+                    if len(requests) == count:
+                        return requests
+
+            start += slot
+
+    raise click.UsageError(f'Only {len(requests)} free slots are left in the booking window, '
+                           f'{count} are needed. Seed a new database or lower --requests.')
+
+
+def _scenario_requests(scenario: str, count: int, run_id: str,
+                       limit: Optional[int]) -> List[Request]:
+    """
+    Builds the requests of a scenario, before it is measured.
+    """
+
+    if scenario == 'POST /appointment':
+        return _booking_requests(count)
+
+    if scenario == 'POST /employee':
+        service_id = db.session.query(func.min(Service.id)).scalar()
+
+        if service_id is None:
+            raise click.UsageError('Seed the database first with `flask benchmark seed`.')
+
+        return [('POST', '/employee', {'name': f'Funcionário Benchmark {index}',
+                                       'email': f'benchmark-{run_id}-{index}@benchmark.test',
+                                       'services': [service_id]})
+                for index in range(count)]
+
+    if scenario == 'GET /schedule':
+        day = db.session.query(func.max(ScheduleEntry.day)).scalar()
+        employees_ids = db.session.execute(select(Employee.id).order_by(Employee.id)).scalars().all()
+
+        if day is None:
+            raise click.UsageError('Seed the database first with `flask benchmark seed`.')
+
+        # The last booked day, for each employee in turn.
+        return [('GET', f'/schedule?start={day.isoformat()}'
+                        f'&employee_id={employees_ids[index % len(employees_ids)]}', None)
+                for index in range(count)]
+
+    method, path = scenario.split(' ')
+
+    return [(method, path if limit is None else f'{path}?limit={limit}', None)] * count
+
+
+def _test_client_sender() -> Send:
+    """
+    Sends requests through the Flask test client, one client per thread.
+    """
+
+    app = current_app._get_current_object()  # pylint: disable=protected-access
+    local = threading.local()
+
+    def send(method: str, path: str, body: Optional[Dict[str, Any]]) -> int:
+        if not hasattr(local, 'client'):
+            local.client = app.test_client()
+
+        response = local.client.open(path, method=method, json=body, buffered=True)
+        response.close()
+
+        return response.status_code
+
+    return send
+
+
+def _http_sender(url: str) -> Send:
+    """
+    Sends requests to a running server, over one keep-alive connection per thread.
+    """
+
+    parts = urlsplit(url)
+    connection_class = (http.client.HTTPSConnection if parts.scheme == 'https'
+                        else http.client.HTTPConnection)
+    local = threading.local()
+
+    def send(method: str, path: str, body: Optional[Dict[str, Any]]) -> int:
+        for attempt in range(2):
+            if not hasattr(local, 'connection'):
+                local.connection = connection_class(parts.netloc, timeout=30)
+
+            try:
+                local.connection.request(
+                    method, parts.path.rstrip('/') + path,
+                    body=None if body is None else json.dumps(body),
+                    headers={'Content-Type': 'application/json'})
+                response = local.connection.getresponse()
+                response.read()
+
+                return response.status
+            except (http.client.HTTPException, ConnectionError):
+                local.connection.close()
+                del local.connection
+
+                if attempt:
+                    raise
+
+        return 0
+
+    return send
+
+
+def _measure(send: Send, requests: List[Request], concurrency: int) -> Dict[str, Any]:
+    """
+    Sends the requests with the given number of concurrent clients.
+
+    Returns:
+        Dict[str, Any]: The number of requests and errors, the latency
+        percentiles in milliseconds, and the throughput in requests per second.
+    """
+
+    latencies = Histogram()
+
+    def timed(request: Request) -> int:
+        started = time.perf_counter()
+        status = send(*request)
+        latencies.record(int((time.perf_counter() - started) * 1_000_000))
+
+        return status
+
+    started = time.perf_counter()
+
+    with ThreadPoolExecutor(concurrency) as executor:
+        statuses = list(executor.map(timed, requests))
+
+    elapsed = time.perf_counter() - started
+    percentiles = latencies.quantiles((0.5, 0.9, 0.99))
+
+    return {
+        'requests': len(requests),
+        'errors': sum(1 for status in statuses if status >= 400),
+        'p50_ms': percentiles[0.5] / 1000,
+        'p90_ms': percentiles[0.9] / 1000,
+        'p99_ms': percentiles[0.99] / 1000,
+        'max_ms': latencies.max / 1000,
+        'mean_ms': round(latencies.total / max(latencies.count, 1) / 1000, 3),
+        'throughput': round(len(requests) / elapsed, 1),
+    }
+
+
+def _commit() -> Tuple[Optional[str], bool]:
+    """
+    Retrieves the checked out commit and whether the working tree has changes.
+    """
+
+    def git(*args: str) -> Optional[str]:
+        try:
+            return subprocess.run(['git', *args], cwd=current_app.root_path, check=True,
+                                  capture_output=True, text=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    return git('rev-parse', 'HEAD'), bool(git('status', '--porcelain', '--untracked-files=no'))
+
+
+@benchmark.command('run')
+@click.option('--url', default=None,
+              help='Base URL of a running server, e.g. http://localhost:8000. The Flask test '
+                   'client is used when omitted. The server must use this app\'s database.')
+@click.option('--requests', 'count', type=click.IntRange(1), default=500, show_default=True,
+              help='Measured requests per scenario.')
+@click.option('--warmup', type=click.IntRange(0), default=50, show_default=True,
+              help='Requests sent per scenario before measuring.')
+@click.option('--concurrency', type=click.IntRange(1), default=1, show_default=True)
+@click.option('--limit', type=click.IntRange(1, MAX_PAGE_SIZE), default=None,
+              help='Page size of the listing scenarios. Defaults to the API default.')
+@click.option('--scenario', 'scenarios', type=click.Choice(SCENARIOS), multiple=True,
+              help='Scenario to run, may be repeated. Defaults to every scenario.')
+@click.option('--output', type=click.Path(dir_okay=False, writable=True), default=None,
+              help='Results file. Defaults to benchmark-<commit>.json.')
+def run(url: Optional[str], count: int, warmup: int, concurrency: int, limit: Optional[int],
+        scenarios: Tuple[str, ...], output: Optional[str]) -> None:
+    """
+    Measures the latency percentiles and throughput of the API routes.
+    """
+
+    commit, dirty = _commit()
+    run_id = f'{int(time.time())}'
+    send = _http_sender(url) if url else _test_client_sender()
+    rows = {model.__tablename__: db.session.query(func.count(model.id)).scalar()
+            for model in (Customer, Service, Employee, Appointment)}
+    results: Dict[str, Any] = {
+        'commit': commit,
+        'dirty': dirty,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'database': db.engine.dialect.name,
+        'target': url or 'test-client',
+        'concurrency': concurrency,
+        'limit': limit,
+        'rows': rows,
+        'scenarios': {},
+    }
+
+    for scenario in scenarios or SCENARIOS:
+        requests = _scenario_requests(scenario, warmup + count, run_id, limit)
+        db.session.rollback()
+
+        for request in requests[:warmup]:
+            send(*request)
+
+        results['scenarios'][scenario] = measured = _measure(send, requests[warmup:], concurrency)
+        click.echo(f"{scenario}: p50 {measured['p50_ms']:.2f} ms, p99 {measured['p99_ms']:.2f} ms, "
+                   f"{measured['throughput']:.0f} req/s, {measured['errors']} errors.")
+
+    output = output or f"benchmark-{(commit or 'unknown')[:12]}.json"
+
+    with open(output, 'w', encoding='utf-8') as file:
+        json.dump(results, file, indent=2)
+
+    click.echo(f'Results saved to {output}.')
+
+
+def _change(baseline: float, current: float) -> str:
+    return f'{(current - baseline) / baseline:+.1%}' if baseline else 'n/a'
+
+
+@benchmark.command('compare')
+@click.argument('baseline', type=click.File(encoding='utf-8'))
+@click.argument('current', type=click.File(encoding='utf-8'))
+@click.option('--max-regression', type=click.FloatRange(0), default=None,
+              help='Exits with an error if a p99 latency grew by more than this percentage.')
+def compare(baseline: Any, current: Any, max_regression: Optional[float]) -> None:
+    """
+    Compares the results of two benchmark runs, e.g. of two commits.
+    """
+
+    baseline_results, current_results = json.load(baseline), json.load(current)
+    regressions = []
+
+    click.echo(f"Baseline {(baseline_results['commit'] or 'unknown')[:12]}, "
+               f"current {(current_results['commit'] or 'unknown')[:12]}.")
+
+    for scenario, measured in current_results['scenarios'].items():
+        reference = baseline_results['scenarios'].get(scenario)
+
+        if reference is None:
+            continue
+
+        click.echo(f"{scenario}: "
+                   f"p50 {reference['p50_ms']:.2f} -> {measured['p50_ms']:.2f} ms "
+                   f"({_change(reference['p50_ms'], measured['p50_ms'])}), "
+                   f"p99 {reference['p99_ms']:.2f} -> {measured['p99_ms']:.2f} ms "
+                   f"({_change(reference['p99_ms'], measured['p99_ms'])}), "
+                   f"{reference['throughput']:.0f} -> {measured['throughput']:.0f} req/s "
+                   f"({_change(reference['throughput'], measured['throughput'])}).")
+
+        if (max_regression is not None and reference['p99_ms']
+                and measured['p99_ms'] > reference['p99_ms'] * (1 + max_regression / 100)):
+            regressions.append(scenario)
+
+    if regressions:
+        raise click.ClickException(f"p99 regressed by more than {max_regression}%: "
+                                   f"{', '.join(regressions)}.")
+
+
+def _index_lookups() -> Dict[str, Callable[[], Any]]:
+    """
+    Builds the hot lookups served by the indexes, on rows of the seeded database.
+
+    Raises:
+        click.UsageError: If the database has no appointments.
+    """
+
+    count = db.session.query(func.count(Appointment.id)).scalar()
+
+    if not count:
+        raise click.UsageError('Seed the database first with `flask benchmark seed`.')
+
+    # An appointment 90% deep into the (date, id) order, as a deep page cursor.
+    deep = db.session.execute(
+        select(Appointment.date, Appointment.id, Appointment.employee_id,
+               Appointment.customer_id, Appointment.end_date)
+        .order_by(Appointment.date, Appointment.id).offset(count * 9 // 10).limit(1)).one()
+    employees_ids = db.session.execute(
+        select(Employee.id).order_by(Employee.id).limit(AVAILABILITY_EMPLOYEES)).scalars().all()
+    window_start = datetime.combine(deep.date.date(), datetime.min.time())
+    page, _ = get_all_appointments(DEFAULT_PAGE_SIZE, (deep.date, deep.id), projected=True)
+    page_ids = [appointment.id for appointment in page]
+    max_duration = AppointmentValidation.MAX_APPOINTMENT_DURATION
+
+    return {
+        'overlap check (employee or customer)': lambda: get_appointments_intervals(
+            deep.date, deep.end_date, max_duration, [deep.employee_id], [deep.customer_id]),
+        f'availability window ({len(employees_ids)} employees)':
+            lambda: get_employees_appointments_intervals(
+                window_start,
+                window_start + timedelta(days=AppointmentValidation.MAX_ADVANCE_DAYS),
+                max_duration, employees_ids),
+        'keyset page, deep (date, id)': lambda: get_all_appointments(
+            DEFAULT_PAGE_SIZE, (deep.date, deep.id), projected=True),
+        'appointment services (selectin)': lambda: db.session.execute(
+            select(service_appointment.c.appointment_id, service_appointment.c.service_id)
+            .where(service_appointment.c.appointment_id.in_(page_ids))).all(),
+        'employee services (reverse side)': lambda: db.session.execute(
+            select(service_employee.c.employee_id, service_employee.c.service_id)
+            .where(service_employee.c.employee_id.in_(employees_ids))).all(),
+    }
+
+
+def _median_ms(lookup: Callable[[], Any], repeat: int) -> float:
+    """
+    Runs a lookup the given number of times and returns its median duration.
+    """
+
+    durations = []
+
+    for _ in range(repeat):
+        started = time.perf_counter()
+        lookup()
+        durations.append(time.perf_counter() - started)
+
+    return statistics.median(durations) * 1000
+
+
+@benchmark.command('indexes')
+@click.option('--repeat', type=click.IntRange(1), default=100, show_default=True,
+              help='Runs of each lookup, whose median is reported.')
+def indexes(repeat: int) -> None:
+    """
+    Measures the hot lookups with their indexes, then without them.
+
+    The indexes are dropped for the second measurement and created again
+    afterwards, which takes a while on large databases. Run it on a benchmark
+    database, not on one serving requests.
+    """
+
+    lookups = _index_lookups()
+    with_indexes = {name: _median_ms(lookup, repeat) for name, lookup in lookups.items()}
+    db.session.rollback()
+
+    with db.engine.begin() as connection:
+        for index in HOT_INDEXES:
+            index.drop(connection, checkfirst=True)
+
+    try:
+        without_indexes = {name: _median_ms(lookup, repeat) for name, lookup in lookups.items()}
+        db.session.rollback()
+    finally:
+        with db.engine.begin() as connection:
+            for index in HOT_INDEXES:
+                index.create(connection, checkfirst=True)
+
+    rows = db.session.query(func.count(Appointment.id)).scalar()
+    click.echo(f'Median lookup latency over {repeat} runs, on {rows} appointments '
+               '(without -> with indexes):')
+
+    for name, duration in with_indexes.items():
+        click.echo(f'  {name:<40} {without_indexes[name]:>9.3f} ms -> {duration:>7.3f} ms')
@@ -0,0 +1,280 @@
+"""
+Command module for importing large data files.
+
+Records are streamed from the file, validated and created in chunks through
+the batch business functions, one transaction per chunk. The byte offset
+after the last committed chunk is saved to a checkpoint file, so an
+interrupted import resumes from there.
+"""
+
+import csv
+import json
+import os
+import time
+from functools import partial
+from itertools import islice
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Tuple
+import click
+from marshmallow import EXCLUDE, Schema, ValidationError
+from werkzeug.exceptions import HTTPException
+from business.appointment_business import create_appointments
+from business.customer_business import create_customers
+from business.employee_business import create_employees
+from business.service_business import create_services
+from repositories.service_repository import forget_catalog_version
+from schemas.appointment_schema import AppointmentSchema
+from schemas.customer_schema import CustomerSchema
+from schemas.employee_schema import EmployeeSchema
+from schemas.service_schema import ServiceSchema
+from validations.bulk_validation import MAX_BATCH_SIZE
+
+DEFAULT_CHUNK_SIZE = 5000
+# Separator of the ID's of list columns in CSV files, such as "1;2".
+CSV_LIST_SEPARATOR = ';'
+
+# Maps each entity to its input schema, batch creation function and list fields.
+# Imported appointments are history, exempt from the booking window and business hours.
+ENTITIES: Dict[str, Tuple[Schema, Callable, Tuple[str, ...]]] = {
+    'customers': (CustomerSchema(), create_customers, ()),
+    'services': (ServiceSchema(), create_services, ()),
+    'employees': (EmployeeSchema(), create_employees, ('services',)),
+    'appointments': (AppointmentSchema(), partial(create_appointments, historical=True),
+                     ('services_ids',)),
+}
+
+
+class _LineReader():
+    """
+    Iterator over the decoded lines of a binary file, keeping the byte
+    offset of the end of the last line read.
+    """
+
+    def __init__(self, file: BinaryIO) -> None:
+        self.file = file
+        self.offset = file.tell()
+
+    def __iter__(self) -> '_LineReader':
+        return self
+
+    def __next__(self) -> str:
+        line = self.file.readline()
+
+        if not line:
+            raise StopIteration
+
+        self.offset += len(line)
+
+        return line.decode('utf-8')
+
+
+def _read_csv(file: BinaryIO, offset: int,
+              list_fields: Tuple[str, ...]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Reads the records of a CSV file with a header row.
+
+    Empty cells are left out, so the schema defaults apply, and list columns
+    are split on CSV_LIST_SEPARATOR.
+
+    Args:
+        file (BinaryIO): The file, opened in binary mode.
+        offset (int): The byte offset to resume from, or 0 to read from the start.
+        list_fields (Tuple[str, ...]): The list columns.
+
+    Returns:
+        Iterator[Tuple[int, Dict[str, Any]]]: The byte offset after each record, and the record.
+    """
+
+    lines = _LineReader(file)
+    header = next(csv.reader(lines), None)
+
+    if header is None:
+        return
+
+    header[0] = header[0].lstrip('\ufeff')
+
+    if offset:
+        file.seek(offset)
+        lines.offset = offset
+
+    for row in csv.reader(lines):
+        record = {column: value for column, value in zip(header, row) if value != ''}
+
+        for field in list_fields:
+            if field in record:
+                record[field] = record[field].split(CSV_LIST_SEPARATOR)
+
+        yield lines.offset, record
+
+
+def _read_ndjson(file: BinaryIO, offset: int) -> Iterator[Tuple[int, Any]]:
+    """
+    Reads the records of a NDJSON file, one JSON object per line.
+
+    Lines that are not valid JSON are yielded as text, so they are rejected
+    by the schema like any other invalid record.
+
+    Args:
+        file (BinaryIO): The file, opened in binary mode.
+        offset (int): The byte offset to resume from, or 0 to read from the start.
+
+    Returns:
+        Iterator[Tuple[int, Any]]: The byte offset after each record, and the record.
+    """
+
+    file.seek(offset)
+    lines = _LineReader(file)
+
+    for line in lines:
+        if not line.strip():
+            continue
+
+        try:
+            yield lines.offset, json.loads(line)
+        except json.JSONDecodeError:
+            yield lines.offset, line
+
+
+def _load_checkpoint(path: str) -> Dict[str, int]:
+    """
+    Reads the progress saved by an interrupted import.
+
+    Args:
+        path (str): The checkpoint file path.
+
+    Returns:
+        Dict[str, int]: The byte offset and the records, created and rejected
+        counts after the last committed chunk.
+    """
+
+    if not os.path.exists(path):
+        return {'offset': 0, 'records': 0, 'created': 0, 'rejected': 0}
+
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)
+
+
+def _save_checkpoint(path: str, checkpoint: Dict[str, int]) -> None:
+    """
+    Saves the import progress, replacing the previous checkpoint atomically.
+
+    Args:
+        path (str): The checkpoint file path.
+        checkpoint (Dict[str, int]): The progress to save.
+    """
+
+    with open(f'{path}.tmp', 'w', encoding='utf-8') as file:
+        json.dump(checkpoint, file)
+
+    os.replace(f'{path}.tmp', path)
+
+
+def _import_chunk(chunk: List[Any], schema: Schema,
+                  create_batch: Callable) -> List[Dict[str, Any]]:
+    """
+    Validates and creates a chunk of records, in a single transaction.
+
+    Args:
+        chunk (List[Any]): The raw records.
+        schema (Schema): The entity input schema.
+        create_batch (Callable): The entity batch creation function.
+
+    Returns:
+        List[Dict[str, Any]]: The result of each record, in the chunk order.
+    """
+
+    results: List[Dict[str, Any]] = [{} for _ in chunk]
+    loaded = []
+    loaded_indexes = []
+
+    for index, record in enumerate(chunk):
+        try:
+            loaded.append(schema.load(record, unknown=EXCLUDE))
+            loaded_indexes.append(index)
+        except ValidationError as error:
+            results[index] = {'status': 422, 'errors': error.messages}
+
+    # Other processes may have changed the services since the previous chunk.
+    forget_catalog_version()
+
+    for index, result in zip(loaded_indexes, create_batch(loaded) if loaded else []):
+        results[index] = {key: value for key, value in result.items() if key != 'index'}
+
+    return results
+
+
+@click.command('import-data')
+@click.argument('entity', type=click.Choice(list(ENTITIES)))
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'file_format', type=click.Choice(['csv', 'ndjson']),
+              help='File format. Defaults to the file extension.')
+@click.option('--chunk-size', type=click.IntRange(1, MAX_BATCH_SIZE), default=DEFAULT_CHUNK_SIZE,
+              show_default=True, help='Records validated and committed per transaction.')
+@click.option('--rejects', type=click.Path(dir_okay=False),
+              help='NDJSON file where the rejected records and their errors are appended.')
+@click.option('--restart', is_flag=True,
+              help='Ignore the checkpoint of a previous import and start from the beginning.')
+def import_data(entity: str, path: str, file_format: str, chunk_size: int,
+                rejects: str, restart: bool) -> None:
+    """
+    Imports customers, services, employees or appointments from a CSV or NDJSON file.
+
+    CSV files must have a header row with the input field names, and list
+    fields hold ID's separated by ';'. Records are validated with the same
+    rules as the bulk routes, appointments as history (`historical=true`),
+    so past appointments are accepted. Progress is saved to PATH.checkpoint after every
+    committed chunk, and a new run resumes from it.
+    """
+
+    schema, create_batch, list_fields = ENTITIES[entity]
+    file_format = file_format or ('csv' if path.lower().endswith('.csv') else 'ndjson')
+    checkpoint_path = f'{path}.checkpoint'
+
+    if restart and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+
+    checkpoint = _load_checkpoint(checkpoint_path)
+
+    if checkpoint['offset']:
+        click.echo(f"Resuming after record {checkpoint['records']}.")
+
+    started = time.perf_counter()
+    imported = 0
+
+    with open(path, 'rb') as file:
+        records = (_read_csv(file, checkpoint['offset'], list_fields) if file_format == 'csv'
+                   else _read_ndjson(file, checkpoint['offset']))
+
+        while chunk := list(islice(records, chunk_size)):
+            try:
+                results = _import_chunk([record for _, record in chunk], schema, create_batch)
+            except HTTPException as error:
+                raise click.ClickException(
+                    f"Chunk after record {checkpoint['records']} failed: {error}. "
+                    'Run the command again to resume from it.') from error
+
+            rejected = [(checkpoint['records'] + index + 1, result)
+                        for index, result in enumerate(results) if result['status'] != 201]
+
+            if rejects and rejected:
+                with open(rejects, 'a', encoding='utf-8') as rejects_file:
+                    for record, result in rejected:
+                        rejects_file.write(json.dumps({'record': record, **result}) + '\n')
+
+            imported += len(chunk)
+            checkpoint = {
+                'offset': chunk[-1][0],
+                'records': checkpoint['records'] + len(chunk),
+                'created': checkpoint['created'] + len(chunk) - len(rejected),
+                'rejected': checkpoint['rejected'] + len(rejected),
+            }
+            _save_checkpoint(checkpoint_path, checkpoint)
+
+            click.echo(f"{checkpoint['records']} records: {checkpoint['created']} created, "
+                       f"{checkpoint['rejected']} rejected "
+                       f'({imported / (time.perf_counter() - started):.0f} records/s).')
+
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+
+    click.echo(f"Import finished: {checkpoint['created']} created, "
+               f"{checkpoint['rejected']} rejected in {time.perf_counter() - started:.1f}s.")
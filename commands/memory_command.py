@@ -0,0 +1,85 @@
+"""
+Command module for measuring the memory footprint of the read models.
+
+Records are built in bulk while tracing allocations, and the traced size
+growth is reported per record, for the ORM instances and for the read
+models replacing them in memory.
+"""
+
+import gc
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Any, Callable, List, Tuple
+import click
+from database.models.appointment import Appointment
+from database.models.service import Service
+from repositories.read_models import CatalogEntry, Schedule
+
+
+def _footprint(build: Callable[[int], Any], records: int) -> float:
+    """
+    Measures the memory retained by a structure holding the given number of records.
+
+    Args:
+        build (Callable[[int], Any]): Builds the structure of the given number of records.
+        records (int): The number of records.
+
+    Returns:
+        float: The retained bytes per record.
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    structure = build(records)
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del structure
+
+    return retained / records
+
+
+def _date(index: int) -> datetime:
+    return datetime(2030, 1, 1, 9) + timedelta(minutes=30 * index)
+
+
+def _services(records: int) -> List[Service]:
+    return [Service(name=f'Serviço {index}', price=1000, duration=30,
+                    employees=[], appointments=[]) for index in range(records)]
+
+
+def _catalog_entries(records: int) -> List[CatalogEntry]:
+    return [CatalogEntry(index, f'Serviço {index}', 1000, 30) for index in range(records)]
+
+
+def _appointments(records: int) -> List[Appointment]:
+    return [Appointment(date=_date(index), services=[], employee_id=1, customer_id=1)
+            for index in range(records)]
+
+
+def _intervals(records: int) -> List[Tuple[datetime, datetime]]:
+    return [(_date(index), _date(index) + timedelta(minutes=30)) for index in range(records)]
+
+
+def _schedule(records: int) -> Schedule:
+    return Schedule.from_appointments(_appointments(records))
+
+
+@click.command('benchmark-memory')
+@click.option('--records', type=click.IntRange(1), default=100000, show_default=True,
+              help='Records built per structure.')
+def benchmark_memory(records: int) -> None:
+    """
+    Reports the per-record memory footprint of ORM instances and read models.
+    """
+
+    structures = {
+        'Service instances': _services,
+        'CatalogEntry': _catalog_entries,
+        'Appointment instances': _appointments,
+        '(date, end_date) tuples': _intervals,
+        'Schedule': _schedule,
+    }
+
+    for name, build in structures.items():
+        click.echo(f'{name}: {_footprint(build, records):.0f} bytes per record.')
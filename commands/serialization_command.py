@@ -0,0 +1,124 @@
+"""
+Command module for benchmarking the compiled serializer against marshmallow.
+
+Synthetic listings are serialized to JSON by both paths, which are checked to
+produce the same bytes before being timed.
+"""
+
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Tuple
+import click
+from flask import current_app
+from marshmallow import Schema
+from schemas.appointment_schema import AppointmentViewSchema
+from schemas.customer_schema import CustomerViewSchema
+from schemas.employee_schema import EmployeeViewSchema
+from schemas.fast_serializer import compile_schema, dumps
+from schemas.service_schema import ServiceViewSchema
+
+# Services linked to each synthetic appointment, and appointments to each service.
+SERVICES_PER_APPOINTMENT = 3
+APPOINTMENTS_PER_SERVICE = 20
+
+
+def _build_listings(rows: int) -> Dict[str, Tuple[Schema, List[Any]]]:
+    """
+    Builds synthetic listings shaped like the ORM objects of each view schema.
+
+    Args:
+        rows (int): The number of objects of each listing.
+
+    Returns:
+        Dict[str, Tuple[Schema, List[Any]]]: The schema and objects of each listing.
+    """
+
+    start = datetime(2030, 1, 1, 8)
+    services = [SimpleNamespace(id=index, name=f'Serviço {index}', price=1000 + index,
+                                duration=30, employees=[], appointments=[])
+                for index in range(1, rows + 1)]
+    employees = [SimpleNamespace(id=index, name=f'Funcionário {index}',
+                                 email=f'employee{index}@example.com',
+                                 services=services[index % rows:index % rows + SERVICES_PER_APPOINTMENT])
+                 for index in range(1, rows + 1)]
+    customers = [SimpleNamespace(id=index, name=f'Cliente {index}',
+                                 email=f'customer{index}@example.com')
+                 for index in range(1, rows + 1)]
+    appointments = []
+
+    for index in range(1, rows + 1):
+        date = start + timedelta(minutes=30 * index)
+        linked = services[index % rows:index % rows + SERVICES_PER_APPOINTMENT]
+        appointment = SimpleNamespace(id=index, date=date, end_date=date + timedelta(minutes=90),
+                                      customer_id=index, employee_id=index, services=linked)
+        appointments.append(appointment)
+
+        for service in linked:
+            if len(service.appointments) < APPOINTMENTS_PER_SERVICE:
+                service.appointments.append(appointment)
+
+    for employee in employees:
+        for service in employee.services:
+            service.employees.append(employee)
+
+    return {
+        'appointments': (AppointmentViewSchema(many=True), appointments),
+        'services': (ServiceViewSchema(many=True), services),
+        'employees': (EmployeeViewSchema(many=True), employees),
+        'customers': (CustomerViewSchema(many=True), customers),
+    }
+
+
+def _best_time(func: Callable[[], str], repeat: int) -> float:
+    """
+    Runs a function several times and returns its fastest run.
+
+    Args:
+        func (Callable[[], str]): The function to time.
+        repeat (int): The number of runs.
+
+    Returns:
+        float: The fastest run, in seconds.
+    """
+
+    best = float('inf')
+
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+
+    return best
+
+
+@click.command('benchmark-serialization')
+@click.option('--rows', type=click.IntRange(1), default=1000, show_default=True,
+              help='Objects serialized per listing.')
+@click.option('--repeat', type=click.IntRange(1), default=5, show_default=True,
+              help='Runs of each serializer; the fastest one is reported.')
+def benchmark_serialization(rows: int, repeat: int) -> None:
+    """
+    Compares the marshmallow and compiled serialization of the view schemas.
+    """
+
+    json_provider = current_app.json
+
+    for name, (schema, objects) in _build_listings(rows).items():
+        serialize = compile_schema(schema)
+
+        def marshmallow_path(schema=schema, objects=objects) -> str:
+            return json_provider.dumps(schema.dump(objects), separators=(',', ':'))
+
+        def compiled_path(serialize=serialize, objects=objects) -> str:
+            return dumps(serialize(objects))
+
+        if marshmallow_path() != compiled_path():
+            raise click.ClickException(f'The {name} outputs differ.')
+
+        marshmallow_time = _best_time(marshmallow_path, repeat)
+        compiled_time = _best_time(compiled_path, repeat)
+
+        click.echo(f'{name}: marshmallow {marshmallow_time * 1000:.1f} ms, '
+                   f'compiled {compiled_time * 1000:.1f} ms '
+                   f'({marshmallow_time / compiled_time:.1f}x faster).')
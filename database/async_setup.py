@@ -0,0 +1,112 @@
+"""
+Setup module for the async database engines of the ASGI serving mode.
+
+The async engines connect to the same databases as the Flask app, through
+the async driver of each dialect: aiosqlite for SQLite and asyncpg for
+PostgreSQL. They use the same engine profile, pragmas and statement timeout.
+"""
+
+from typing import Any, Dict, List, Optional
+from sqlalchemy import URL, event, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from database.config import DATABASE_PROFILE, DATABASE_STATEMENT_TIMEOUT, ENGINE_OPTIONS
+from database.db_setup import set_sqlite_pragmas
+
+ASYNC_DRIVERS = {
+    'sqlite': 'aiosqlite',
+    'postgresql': 'asyncpg',
+}
+
+
+def async_url(url: str) -> URL:
+    """
+    Converts a database URL to the async driver of its dialect.
+
+    Args:
+        url (str): The SQLAlchemy URL of the sync engine.
+
+    Returns:
+        URL: The URL of the async engine.
+
+    Raises:
+        ValueError: If the dialect has no supported async driver.
+    """
+
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver for '{backend}' databases. "
+                         f"Expected one of: {', '.join(ASYNC_DRIVERS)}.")
+
+    return parsed.set(drivername=f'{backend}+{ASYNC_DRIVERS[backend]}')
+
+
+def _engine_options() -> Dict[str, Any]:
+    """
+    Adapts the engine profile options to the async drivers.
+
+    Returns:
+        Dict[str, Any]: The async engine options.
+    """
+
+    options = dict(ENGINE_OPTIONS[DATABASE_PROFILE])
+
+    if DATABASE_PROFILE == 'postgresql':
+        # asyncpg takes server settings instead of libpq options.
+        options['connect_args'] = {
+            'server_settings': {'statement_timeout': str(DATABASE_STATEMENT_TIMEOUT)}}
+
+    return options
+
+
+def _create_engine(url: str) -> AsyncEngine:
+    """
+    Creates the async engine of a database, applying the profile's SQLite pragmas.
+    """
+
+    engine = create_async_engine(async_url(url), **_engine_options())
+
+    if engine.dialect.name == 'sqlite':
+        event.listen(engine.sync_engine, 'connect', set_sqlite_pragmas)
+
+    return engine
+
+
+class AsyncDatabase():
+    """
+    Async engines and session factories of the primary database and of its
+    read replica, when one is configured.
+
+    Attributes:
+        engine (AsyncEngine): The primary database engine.
+        replica_engine (Optional[AsyncEngine]): The read replica engine.
+        session (async_sessionmaker[AsyncSession]): Opens sessions on the primary database.
+        replica_session (async_sessionmaker[AsyncSession]): Opens sessions on the
+            read replica, or on the primary database if there is none.
+    """
+
+    def __init__(self, url: str, replica_url: Optional[str] = None) -> None:
+        self.engine = _create_engine(url)
+        self.replica_engine = _create_engine(replica_url) if replica_url else None
+        self.session = async_sessionmaker(self.engine, expire_on_commit=False)
+        self.replica_session = async_sessionmaker(
+            self.replica_engine or self.engine, expire_on_commit=False)
+
+    @property
+    def engines(self) -> List[AsyncEngine]:
+        """
+        The async engines of the primary database and of its read replica.
+        """
+
+        return [self.engine, *([self.replica_engine] if self.replica_engine else [])]
+
+    async def dispose(self) -> None:
+        """
+        Closes every pooled connection.
+        """
+
+        await self.engine.dispose()
+
+        if self.replica_engine is not None:
+            await self.replica_engine.dispose()
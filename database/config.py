@@ -1,8 +1,74 @@
 """
 Configuration module for the database.
+
+The database is selected with the DATABASE_URL environment variable, which accepts
+any SQLAlchemy URL and defaults to a local SQLite file. When DATABASE_REPLICA_URL is
+set, the listing routes read from that replica while writes go to DATABASE_URL.
+
+The engine profile is selected with the DATABASE_PROFILE environment variable:
+
+- default: SQLAlchemy defaults, suited to development.
+- production: WAL journal, tuned pragmas and connection pool, suited to
+  several app workers sharing a SQLite database file.
+- postgresql: pooled connections with pre-ping and a statement timeout,
+  suited to a PostgreSQL server.
+
+Repository lookups are cached in process, bounded by CACHE_MAX_ENTRIES and
+CACHE_TTL. When CACHE_REDIS_URL is set, a Redis server is used as a second
+tier shared by every process.
+
+Statements running longer than SLOW_QUERY_THRESHOLD milliseconds are logged
+and aggregated with their query plans by the slow query profiler.
 """
 
 import os
 
 BASE_DIR = os.path.abspath(os.path.dirname(__file__))
-DATABASE_URI = f"sqlite:///{os.path.join(BASE_DIR, 'database.db')}"
+DATABASE_URI = os.environ.get(
+    'DATABASE_URL', f"sqlite:///{os.path.join(BASE_DIR, 'database.db')}")
+DATABASE_REPLICA_URI = os.environ.get('DATABASE_REPLICA_URL')
+DATABASE_PROFILE = os.environ.get('DATABASE_PROFILE', 'default')
+DATABASE_STATEMENT_TIMEOUT = int(os.environ.get('DATABASE_STATEMENT_TIMEOUT', 5000))
+
+SQLITE_PRAGMAS = {
+    'default': {},
+    'production': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'mmap_size': int(os.environ.get('SQLITE_MMAP_SIZE', 256 * 1024 * 1024)),
+        # Negative values are in KiB, so this is a 64 MiB page cache per connection.
+        'cache_size': int(os.environ.get('SQLITE_CACHE_SIZE', -64 * 1024)),
+        'temp_store': 'MEMORY',
+        'busy_timeout': int(os.environ.get('SQLITE_BUSY_TIMEOUT', 5000)),
+    },
+}
+
+ENGINE_OPTIONS = {
+    'default': {},
+    'production': {
+        'pool_size': int(os.environ.get('DATABASE_POOL_SIZE', 5)),
+        'max_overflow': int(os.environ.get('DATABASE_MAX_OVERFLOW', 10)),
+        'pool_timeout': int(os.environ.get('DATABASE_POOL_TIMEOUT', 30)),
+        'pool_recycle': int(os.environ.get('DATABASE_POOL_RECYCLE', 3600)),
+    },
+    'postgresql': {
+        'pool_size': int(os.environ.get('DATABASE_POOL_SIZE', 10)),
+        'max_overflow': int(os.environ.get('DATABASE_MAX_OVERFLOW', 20)),
+        'pool_timeout': int(os.environ.get('DATABASE_POOL_TIMEOUT', 30)),
+        'pool_recycle': int(os.environ.get('DATABASE_POOL_RECYCLE', 1800)),
+        'pool_pre_ping': True,
+        'connect_args': {
+            'options': f'-c statement_timeout={DATABASE_STATEMENT_TIMEOUT}'
+        },
+    },
+}
+
+if DATABASE_PROFILE not in ENGINE_OPTIONS:
+    raise ValueError(f"Unknown DATABASE_PROFILE '{DATABASE_PROFILE}'. "
+                     f"Expected one of: {', '.join(ENGINE_OPTIONS)}.")
+
+CACHE_MAX_ENTRIES = int(os.environ.get('CACHE_MAX_ENTRIES', 10000))
+CACHE_TTL = int(os.environ.get('CACHE_TTL', 300))
+CACHE_REDIS_URL = os.environ.get('CACHE_REDIS_URL')
+
+SLOW_QUERY_THRESHOLD = float(os.environ.get('SLOW_QUERY_THRESHOLD', 100))
@@ -4,9 +4,32 @@ Setup module for the database.
 
 from flask_sqlalchemy import SQLAlchemy
 from flask import Flask
-from database.config import DATABASE_URI
+from sqlalchemy import event
+from database.config import (
+    DATABASE_URI,
+    DATABASE_REPLICA_URI,
+    DATABASE_PROFILE,
+    ENGINE_OPTIONS,
+    SQLITE_PRAGMAS,
+)
+from database.routing import REPLICA_BIND_KEY, RoutingSession
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
+
+
+def set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    """
+    Applies the profile's SQLite pragmas to every new connection.
+
+    Args:
+        dbapi_connection: The DBAPI connection just opened by the pool.
+        _connection_record: The pool's record of the connection.
+    """
+
+    cursor = dbapi_connection.cursor()
+    for pragma, value in SQLITE_PRAGMAS.get(DATABASE_PROFILE, {}).items():
+        cursor.execute(f'PRAGMA {pragma} = {value}')
+    cursor.close()
 
 
 def init_db(app: Flask):
@@ -18,7 +41,18 @@ def init_db(app: Flask):
     """
     app.config['SQLALCHEMY_DATABASE_URI'] = DATABASE_URI
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = ENGINE_OPTIONS[DATABASE_PROFILE]
+    if DATABASE_REPLICA_URI:
+        app.config['SQLALCHEMY_BINDS'] = {REPLICA_BIND_KEY: DATABASE_REPLICA_URI}
     db.init_app(app)
 
+    # Imported here since the migrations depend on the models, which depend on db.
+    from database.migrations import upgrade  # pylint: disable=import-outside-toplevel
+
     with app.app_context():
+        for engine in db.engines.values():
+            if engine.dialect.name == 'sqlite':
+                event.listen(engine, 'connect', set_sqlite_pragmas)
+
         db.create_all()
+        upgrade(db.engine)
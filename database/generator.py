@@ -0,0 +1,446 @@
+"""
+Generator of realistic barbershop data, inserted straight into the model tables.
+
+Customers and employees get plausible names and unique emails, services come
+from a barbershop catalog priced between MIN_SERVICE_PRICE and
+MAX_SERVICE_PRICE, employees perform a random subset of the services, and
+appointments fill the employees' business hours, between OPENING_TIME and
+CLOSING_TIME, day by day back from a given date. Every appointment gets its
+schedule entry, and the analytics rollups are rebuilt, as if the appointments
+were booked through the API.
+
+No employee has overlapping appointments, since each day of an employee is
+filled back to back, and no customer has two appointments on the same day.
+Every column is drawn as a NumPy array, so millions of rows are generated in
+seconds, and rows are inserted with one executemany per chunk. The same seed,
+scale and last day always generate the same rows.
+
+Requires `pip install numpy`.
+"""
+
+import json
+import unicodedata
+from datetime import date
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from sqlalchemy import func, insert
+from database.db_setup import db
+from database.models.appointment import Appointment
+from database.models.customer import Customer
+from database.models.employee import Employee
+from database.models.schedule_entry import ScheduleEntry
+from database.models.service import Service
+from database.models.service_appointment import service_appointment
+from database.models.service_employee import service_employee
+from database.rollups import rebuild_rollups
+from repositories.service_repository import forget_catalog_version
+from repositories.table_version_repository import VERSIONED_TABLES, bump_table_version
+from validations.appointment_validation import AppointmentValidation
+from validations.service_validation import (
+    MAX_SERVICE_DURATION, MAX_SERVICE_PRICE, MIN_SERVICE_DURATION, MIN_SERVICE_PRICE)
+
+FIRST_NAMES = ('Ana', 'Bruno', 'Carlos', 'Daniel', 'Eduardo', 'Fernanda', 'Gabriel', 'Helena',
+               'Igor', 'João', 'Juliana', 'Lucas', 'Marcos', 'Mariana', 'Nicolas', 'Otávio',
+               'Paulo', 'Rafael', 'Renata', 'Rodrigo', 'Sérgio', 'Thiago', 'Vinícius', 'Vitor')
+LAST_NAMES = ('Almeida', 'Alves', 'Barbosa', 'Cardoso', 'Carvalho', 'Costa', 'Ferreira',
+              'Gomes', 'Lima', 'Martins', 'Melo', 'Oliveira', 'Pereira', 'Ribeiro', 'Rocha',
+              'Rodrigues', 'Santos', 'Silva', 'Souza', 'Teixeira')
+# Name, duration in minutes and price in cents of the catalog services.
+SERVICES_CATALOG = (
+    ('Corte Social', 30, 4000),
+    ('Corte Degradê', 40, 5000),
+    ('Corte Navalhado', 40, 5500),
+    ('Corte Infantil', 30, 3500),
+    ('Barba', 30, 3500),
+    ('Barboterapia', 45, 6500),
+    ('Corte e Barba', 60, 7000),
+    ('Sobrancelha', 15, 2500),
+    ('Acabamento', 15, 2500),
+    ('Pigmentação de Barba', 45, 6000),
+    ('Hidratação', 30, 4500),
+    ('Limpeza de Pele', 45, 7000),
+    ('Relaxamento', 60, 8000),
+    ('Selagem', 90, 9500),
+    ('Luzes', 90, 10000),
+)
+EMAIL_DOMAIN = 'example.com'
+# Share of the appointments booking a second service of the employee.
+TWO_SERVICES_RATE = 0.3
+# Chance of an idle gap before each appointment, of 15 to 60 minutes.
+IDLE_RATE = 0.25
+IDLE_STEP = 15
+# Cells of the slots grid drawn at once when generating appointments.
+GRID_CELLS = 4_000_000
+
+
+class Scale(NamedTuple):
+    """
+    Number of rows to generate per entity.
+
+    Attributes:
+        customers (int): The number of customers.
+        employees (int): The number of employees.
+        services (int): The number of services.
+        services_per_employee (int): The number of services each employee performs.
+        appointments (int): The number of past appointments.
+    """
+
+    customers: int
+    employees: int
+    services: int
+    services_per_employee: int
+    appointments: int
+
+
+def _numpy() -> Any:
+    """
+    Imports NumPy, required by the generator only.
+    """
+
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError as error:
+        raise ImportError('The data generator requires the numpy package. '
+                          'Install it with `pip install numpy`.') from error
+
+    return numpy
+
+
+def _ascii(name: str) -> str:
+    return unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode().lower()
+
+
+def _people(rng: Any, ids: List[int], kind: str) -> Dict[str, List[Any]]:
+    """
+    Generates the name and email columns of customers or employees, with
+    unique emails built from their IDs.
+    """
+
+    first = rng.integers(0, len(FIRST_NAMES), len(ids)).tolist()
+    last = rng.integers(0, len(LAST_NAMES), len(ids)).tolist()
+    first_ascii = [_ascii(name) for name in FIRST_NAMES]
+    last_ascii = [_ascii(name) for name in LAST_NAMES]
+
+    return {
+        'id': ids,
+        'name': [f'{FIRST_NAMES[name]} {LAST_NAMES[surname]}' for name, surname in zip(first, last)],
+        'email': [f'{first_ascii[name]}.{last_ascii[surname]}.{kind}{person_id}@{EMAIL_DOMAIN}'
+                  for person_id, name, surname in zip(ids, first, last)],
+    }
+
+
+def _services(np: Any, rng: Any, ids: List[int]) -> Tuple[Dict[str, List[Any]], Any]:
+    """
+    Generates the services, cycling through the catalog with numbered variants,
+    prices within 10% of the catalog price and durations within 5 minutes.
+
+    Returns:
+        Tuple[Dict[str, List[Any]], Any]: The service columns and the array of their durations.
+    """
+
+    count = len(ids)
+    template = np.arange(count) % len(SERVICES_CATALOG)
+    base_durations = np.array([duration for _, duration, _ in SERVICES_CATALOG])[template]
+    base_prices = np.array([price for _, _, price in SERVICES_CATALOG])[template]
+    durations = np.clip(base_durations + 5 * rng.integers(-1, 2, count),
+                        max(MIN_SERVICE_DURATION, 5), MAX_SERVICE_DURATION)
+    prices = np.clip(np.round(base_prices * rng.normal(1, 0.1, count) / 50) * 50,
+                     MIN_SERVICE_PRICE, MAX_SERVICE_PRICE).astype(np.int64)
+    names = []
+
+    for index, template_index in enumerate(template.tolist()):
+        name = SERVICES_CATALOG[template_index][0]
+        variant = index // len(SERVICES_CATALOG)
+        names.append(f'{name} {variant + 1}' if variant else name)
+
+    return {'id': ids, 'name': names, 'price': prices.tolist(),
+            'duration': durations.tolist()}, durations
+
+
+def _assignments(np: Any, rng: Any, employees: int, services: int, per_employee: int) -> Any:
+    """
+    Draws the services of each employee, without repetition.
+
+    Returns:
+        Any: An (employees, per_employee) array of service indexes.
+    """
+
+    return np.argsort(rng.random((employees, services)), axis=1)[:, :per_employee]
+
+
+def _business_minutes() -> int:
+    opening, closing = AppointmentValidation.OPENING_TIME, AppointmentValidation.CLOSING_TIME
+
+    return (closing.hour * 60 + closing.minute) - (opening.hour * 60 + opening.minute)
+
+
+def _days_grid(np: Any, rng: Any, assignments: Any, durations: Any,
+               days: int, slots: int) -> Tuple[Any, ...]:
+    """
+    Fills the business hours of every employee on a block of days.
+
+    Each day of an employee is a row of slots, whose services, second services
+    and idle gaps are drawn at once. The start of each slot is the end of the
+    previous one plus its gap, and the slots ending after closing are dropped.
+
+    Returns:
+        Tuple[Any, ...]: The day in the block, the employee index, the start in
+        minutes after opening, the duration, the first and the second service
+        indexes of each appointment, the second being -1 for a single service.
+    """
+
+    employees, per_employee = assignments.shape
+    rows = days * employees
+    employee = np.tile(np.arange(employees), days)[:, None]
+
+    position = rng.integers(0, per_employee, (rows, slots))
+    first = assignments[employee, position]
+    length = durations[first]
+
+    if per_employee > 1:
+        two = rng.random((rows, slots)) < TWO_SERVICES_RATE
+        # Shifting the position by 1 to per_employee - 1 picks another service of the employee.
+        shifted = (position + rng.integers(1, per_employee, (rows, slots))) % per_employee
+        second = np.where(two, assignments[employee, shifted], -1)
+        length = length + np.where(two, durations[second], 0)
+    else:
+        second = np.full((rows, slots), -1)
+
+    gaps = np.where(rng.random((rows, slots)) < IDLE_RATE,
+                    IDLE_STEP * rng.integers(1, 5, (rows, slots)), 0)
+    starts = np.cumsum(gaps + length, axis=1) - length
+    row, slot = np.nonzero(starts + length <= _business_minutes())
+
+    return (row // employees, row % employees, starts[row, slot], length[row, slot],
+            first[row, slot], second[row, slot])
+
+
+def _appointments(np: Any, rng: Any, assignments: Any, durations: Any,
+                  count: int) -> Tuple[Any, ...]:
+    """
+    Generates the appointments, in blocks of days back from the first day,
+    until the requested number is reached.
+
+    Returns:
+        Tuple[Any, ...]: The day before the first day, the employee index, the
+        start in minutes after opening, the duration, the first and the second
+        service indexes of each appointment.
+    """
+
+    employees = assignments.shape[0]
+    slots = _business_minutes() // int(durations[assignments].min()) + 1
+    days_per_block = max(GRID_CELLS // (employees * slots), 1)
+    blocks: List[Tuple[Any, ...]] = [tuple(np.empty(0, dtype=np.int64) for _ in range(6))]
+    generated = 0
+    first_day = 0
+
+    while generated < count:
+        day, *columns = _days_grid(np, rng, assignments, durations, days_per_block, slots)
+
+        if not len(day):
+            raise ValueError('No appointment fits the business hours.')
+
+        blocks.append((day + first_day, *columns))
+        generated += len(day)
+        first_day += days_per_block
+
+    return tuple(np.concatenate(column)[:count] for column in zip(*blocks))
+
+
+def _customers_of(np: Any, rng: Any, days: Any, customers: int) -> Any:
+    """
+    Assigns a customer to each appointment, no customer booking twice on the same day.
+
+    The appointments of a day take consecutive positions, in random order and
+    from a random offset, in a random permutation of the customers.
+
+    Returns:
+        Any: The customer index of each appointment.
+
+    Raises:
+        ValueError: If a day has more appointments than there are customers.
+    """
+
+    per_day = np.bincount(days)
+
+    if per_day.max(initial=0) > customers:
+        raise ValueError(f'A day has {per_day.max()} appointments, more than the {customers} '
+                         'customers. Generate more customers.')
+
+    day_start = np.concatenate(([0], np.cumsum(per_day)[:-1]))
+    order = np.lexsort((rng.random(len(days)), days))
+    rank = np.arange(len(days)) - day_start[days[order]]
+    offsets = rng.integers(0, customers, len(per_day))
+    permutation = rng.permutation(customers)
+    assigned = np.empty(len(days), dtype=np.int64)
+    assigned[order] = permutation[(offsets[days[order]] + rank) % customers]
+
+    return assigned
+
+
+def _next_id(model: Any) -> int:
+    return (db.session.query(func.max(model.id)).scalar() or 0) + 1
+
+
+def _datetimes(np: Any, dialect: str, values: Any, unit: str = 'us') -> List[Any]:
+    """
+    Converts datetimes, or dates with the 'D' unit, to DBAPI parameters. SQLite
+    has no datetime type, and SQLAlchemy stores them as text, in the format
+    produced here.
+    """
+
+    values = values.astype(f'datetime64[{unit}]')
+
+    if dialect == 'sqlite':
+        return [text.replace('T', ' ')
+                for text in np.datetime_as_string(values, unit=unit).tolist()]
+
+    return values.tolist()
+
+
+def _services_of(np: Any, services: Dict[str, List[Any]], service: Any, second: Any
+                 ) -> Tuple[List[str], List[int]]:
+    """
+    Builds the services names, as JSON, and the total price of every appointment,
+    once per distinct pair of services.
+    """
+
+    # Pairs are encoded as one integer, with 0 for no second service.
+    base = len(services['id']) + 1
+    pairs, inverse = np.unique(service * base + second + 1, return_inverse=True)
+    names, prices = [], []
+
+    for pair in pairs.tolist():
+        first, other = divmod(pair, base)
+        booked = sorted((first, other - 1)) if other else [first]
+        names.append(json.dumps([services['name'][position] for position in booked]))
+        prices.append(sum(services['price'][position] for position in booked))
+
+    return (np.array(names, dtype=object)[inverse].tolist(),
+            np.array(prices)[inverse].tolist())
+
+
+def _insert(table: Any, columns: Dict[str, List[Any]], chunk_size: int) -> None:
+    """
+    Inserts columns of values with one executemany per chunk.
+
+    The rows are sent through the DBAPI cursor of the session's connection, in
+    the session's transaction, with the insert compiled for its dialect. The
+    values are already converted, so SQLAlchemy's processing of each value,
+    which would take most of the insert time, is skipped.
+    """
+
+    connection = db.session.connection()
+    compiled = insert(table).compile(dialect=connection.dialect, column_keys=list(columns))
+
+    if compiled.positional:
+        rows: List[Any] = list(zip(*(columns[name] for name in compiled.positiontup)))
+    else:
+        rows = [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+    cursor = connection.connection.cursor()
+
+    try:
+        for start in range(0, len(rows), chunk_size):
+            cursor.executemany(compiled.string, rows[start:start + chunk_size])
+    finally:
+        cursor.close()
+
+
+def generate_data(scale: Scale, seed: int = 0, until: Optional[date] = None,
+                  chunk_size: int = 50000) -> Dict[str, int]:
+    """
+    Generates and inserts customers, services, employees and past appointments,
+    in a single transaction, after the rows already in the database.
+
+    Args:
+        scale (Scale): The number of rows of each entity.
+        seed (int): The seed of the random generator.
+        until (Optional[date]): The day after the last day of appointments. Defaults to today.
+        chunk_size (int): The rows inserted per executemany.
+
+    Returns:
+        Dict[str, int]: The number of inserted rows, by table.
+
+    Raises:
+        ValueError: If the scale cannot produce conflict-free appointments.
+    """
+
+    np = _numpy()
+    rng = np.random.default_rng(seed)
+    dialect = db.session.connection().dialect.name
+    first = {model: _next_id(model) for model in (Customer, Service, Employee, Appointment)}
+    per_employee = min(scale.services_per_employee, scale.services)
+    until = np.datetime64(until or date.today(), 'D')
+    # Rows are created at the start of the day after the appointments, so they are reproducible.
+    created_at = _datetimes(np, dialect, until.reshape(1))[0]
+
+    customers_ids = first[Customer] + np.arange(scale.customers)
+    employees_ids = first[Employee] + np.arange(scale.employees)
+    services_ids = first[Service] + np.arange(scale.services)
+    services, durations = _services(np, rng, services_ids.tolist())
+    assignments = _assignments(np, rng, scale.employees, scale.services, per_employee)
+
+    day, employee, start, length, service, second = _appointments(
+        np, rng, assignments, durations, scale.appointments)
+    customer = _customers_of(np, rng, day, scale.customers)
+
+    opening = AppointmentValidation.OPENING_TIME
+    dates = (until - day - 1).astype('datetime64[m]') + (opening.hour * 60 + opening.minute + start)
+    appointments_ids = first[Appointment] + np.arange(len(day))
+    has_second = second >= 0
+    links_appointments = np.concatenate((appointments_ids, appointments_ids[has_second]))
+    links_services = services_ids[np.concatenate((service, second[has_second]))]
+
+    customers = _people(rng, customers_ids.tolist(), 'cliente')
+    employees = _people(rng, employees_ids.tolist(), 'funcionario')
+    services_names, prices = _services_of(np, services, service, second)
+
+    for table, columns in ((Customer.__table__, customers), (Service.__table__, services),
+                           (Employee.__table__, employees)):
+        _insert(table, {**columns, 'created_at': [created_at] * len(columns['id']),
+                        'updated_at': [created_at] * len(columns['id'])}, chunk_size)
+
+    _insert(service_employee, {
+        'employee_id': np.repeat(employees_ids, per_employee).tolist(),
+        'service_id': services_ids[assignments].ravel().tolist()}, chunk_size)
+    _insert(Appointment.__table__, {
+        'id': appointments_ids.tolist(),
+        'date': _datetimes(np, dialect, dates),
+        'end_date': _datetimes(np, dialect, dates + length),
+        'employee_id': employees_ids[employee].tolist(),
+        'customer_id': customers_ids[customer].tolist(),
+        'created_at': [created_at] * len(day),
+        'updated_at': [created_at] * len(day)}, chunk_size)
+    _insert(service_appointment, {
+        'appointment_id': links_appointments.tolist(),
+        'service_id': links_services.tolist()}, chunk_size)
+    _insert(ScheduleEntry.__table__, {
+        'appointment_id': appointments_ids.tolist(),
+        'employee_id': employees_ids[employee].tolist(),
+        'day': _datetimes(np, dialect, dates, unit='D'),
+        'date': _datetimes(np, dialect, dates),
+        'end_date': _datetimes(np, dialect, dates + length),
+        'customer_id': customers_ids[customer].tolist(),
+        'customer_name': np.array(customers['name'], dtype=object)[customer].tolist(),
+        'services': services_names,
+        'price': prices}, chunk_size)
+
+    rollups = rebuild_rollups(chunk_size)
+
+    for table_name in VERSIONED_TABLES:
+        bump_table_version(table_name)
+
+    db.session.commit()
+    forget_catalog_version()
+
+    return {
+        'customer': scale.customers,
+        'service': scale.services,
+        'employee': scale.employees,
+        'service_employee': scale.employees * per_employee,
+        'appointment': len(day),
+        'service_appointment': len(links_appointments),
+        'schedule_entry': len(day),
+        'employee_day_rollup': rollups['employee_day_rollup'],
+        'service_day_rollup': rollups['service_day_rollup'],
+    }
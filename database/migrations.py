@@ -0,0 +1,329 @@
+"""
+Migration module for the database.
+
+`db.create_all()` only creates missing tables, so columns and indexes added to
+existing models are brought into existing database files here.
+"""
+
+import logging
+from collections import defaultdict
+from typing import List, Optional
+from datetime import timedelta
+from sqlalchemy import (
+    Connection, Engine, Index, Row, inspect, insert, select, func, bindparam, text)
+from sqlalchemy.schema import AddConstraint
+from database.db_setup import db
+from database.models import (
+    Appointment, Customer, EmployeeDayRollup, ScheduleEntry, Service, TableVersion,
+    service_appointment)
+from database.models.appointment import EXCLUSION_CONSTRAINTS
+from repositories.table_version_repository import VERSIONED_TABLES
+
+MIGRATION_CHUNK_SIZE = 10000
+# Number of duplicated keys quoted in the log when a unique index cannot be created.
+DUPLICATES_REPORTED = 10
+
+logger = logging.getLogger(__name__)
+
+
+def _add_column(connection: Connection, table_name: str,
+                column_name: str, default: Optional[str] = None) -> None:
+    """
+    Adds a model column to an existing table.
+
+    Args:
+        connection (Connection): The database connection.
+        table_name (str): The table name.
+        column_name (str): The column name, as declared in the model.
+        default (Optional[str]): The SQL default used to fill the existing rows.
+    """
+
+    column = db.metadata.tables[table_name].c[column_name]
+    column_type = column.type.compile(dialect=connection.dialect)
+    ddl = f'ALTER TABLE {table_name} ADD COLUMN {column_name} {column_type}'
+
+    if default is not None:
+        ddl += f' NOT NULL DEFAULT {default}'
+
+    connection.exec_driver_sql(ddl)
+
+
+def _fill_appointments_end_date(connection: Connection) -> None:
+    """
+    Fills the end date of existing appointments with the sum of their services durations.
+
+    Appointments are processed in chunks of consecutive IDs, so memory does not
+    depend on the number of appointments.
+
+    Args:
+        connection (Connection): The database connection.
+    """
+
+    update = Appointment.__table__.update().where(
+        Appointment.id == bindparam('appointment_id')
+    ).values(end_date=bindparam('appointment_end_date'), updated_at=Appointment.updated_at)
+    last_id = 0
+
+    while True:
+        rows = connection.execute(
+            select(Appointment.id, Appointment.date,
+                   func.coalesce(func.sum(Service.duration), 0))
+            .select_from(Appointment)
+            .outerjoin(service_appointment,
+                       service_appointment.c.appointment_id == Appointment.id)
+            .outerjoin(Service, Service.id == service_appointment.c.service_id)
+            .where(Appointment.id > last_id)
+            .group_by(Appointment.id, Appointment.date)
+            .order_by(Appointment.id)
+            .limit(MIGRATION_CHUNK_SIZE)
+        ).all()
+
+        if not rows:
+            return
+
+        connection.execute(update, [
+            {'appointment_id': appointment_id,
+             'appointment_end_date': date + timedelta(minutes=duration)}
+            for appointment_id, date, duration in rows
+        ])
+        last_id = rows[-1][0]
+
+
+def _fill_schedule_entries(connection: Connection) -> None:
+    """
+    Creates the schedule entries of the appointments that do not have one yet.
+
+    Entries are inserted with their appointment, so only the appointments
+    booked before the schedule_entry table existed are missing, all after the
+    last appointment with an entry. They are processed in chunks of
+    consecutive IDs, so memory does not depend on the number of appointments.
+
+    Args:
+        connection (Connection): The database connection.
+    """
+
+    last_id = connection.execute(
+        select(func.max(ScheduleEntry.appointment_id))).scalar() or 0
+
+    while True:
+        rows = connection.execute(
+            select(Appointment.id, Appointment.employee_id, Appointment.date,
+                   Appointment.end_date, Appointment.customer_id, Customer.name)
+            .join(Customer, Customer.id == Appointment.customer_id)
+            .where(Appointment.id > last_id)
+            .order_by(Appointment.id)
+            .limit(MIGRATION_CHUNK_SIZE)
+        ).all()
+
+        if not rows:
+            return
+
+        services = defaultdict(list)
+
+        for appointment_id, name, price in connection.execute(
+                select(service_appointment.c.appointment_id, Service.name, Service.price)
+                .join(Service, Service.id == service_appointment.c.service_id)
+                .where(service_appointment.c.appointment_id.between(rows[0][0], rows[-1][0]))
+                .order_by(service_appointment.c.appointment_id, Service.id)):
+            services[appointment_id].append((name, price))
+
+        connection.execute(insert(ScheduleEntry.__table__), [
+            {'appointment_id': appointment_id, 'employee_id': employee_id,
+             'day': date.date(), 'date': date, 'end_date': end_date,
+             'customer_id': customer_id, 'customer_name': customer_name,
+             'services': [name for name, _ in services[appointment_id]],
+             'price': sum(price for _, price in services[appointment_id])}
+            for appointment_id, employee_id, date, end_date, customer_id, customer_name in rows
+        ])
+        last_id = rows[-1][0]
+
+
+def _find_duplicates(connection: Connection, index: Index) -> List[Row]:
+    """
+    Finds the key values repeated by existing rows, which prevent a unique index
+    from being created.
+
+    Args:
+        connection (Connection): The database connection.
+        index (Index): The unique index.
+
+    Returns:
+        List[Row]: The first repeated key values, each followed by its number of rows.
+    """
+
+    columns = list(index.columns)
+
+    return connection.execute(
+        select(*columns, func.count())
+        .group_by(*columns)
+        .having(func.count() > 1)
+        .order_by(*columns)
+        .limit(DUPLICATES_REPORTED)
+    ).all()
+
+
+def _create_indexes(connection: Connection) -> None:
+    """
+    Creates the model indexes missing from the database.
+
+    A unique index is skipped when the existing rows repeat its key, as in
+    databases that booked the same slot twice before the index existed. The
+    repeated keys are logged so they can be fixed by hand, and the index is
+    created on the next startup once they are gone.
+
+    Args:
+        connection (Connection): The database connection.
+    """
+
+    inspector = inspect(connection)
+
+    for table in db.metadata.sorted_tables:
+        existing = {index['name'] for index in inspector.get_indexes(table.name)}
+
+        for index in table.indexes:
+            if index.name in existing:
+                continue
+
+            if index.unique:
+                duplicates = _find_duplicates(connection, index)
+
+                if duplicates:
+                    logger.error(
+                        'The unique index %s was not created: rows of the %s table repeat '
+                        'its key (%s). Fix them and restart the app to create it. '
+                        'First repeated keys, with their number of rows: %s',
+                        index.name, table.name,
+                        ', '.join(column.name for column in index.columns),
+                        '; '.join(', '.join(str(value) for value in row)
+                                  for row in duplicates))
+                    continue
+
+            index.create(connection)
+
+
+def _find_overlaps(connection: Connection, column_name: str) -> List[Row]:
+    """
+    Finds the overlapping appointments of the same employee or customer, which
+    prevent an exclusion constraint from being created.
+
+    Args:
+        connection (Connection): The database connection.
+        column_name (str): 'employee_id' or 'customer_id'.
+
+    Returns:
+        List[Row]: The first overlapping pairs, as rows of (owner ID, appointment ID,
+        overlapping appointment ID).
+    """
+
+    first, second = Appointment.__table__.alias(), Appointment.__table__.alias()
+
+    return connection.execute(
+        select(first.c[column_name], first.c.id, second.c.id)
+        .join(second, second.c[column_name] == first.c[column_name])
+        .where(first.c.id < second.c.id,
+               first.c.date < second.c.end_date,
+               second.c.date < first.c.end_date)
+        .order_by(first.c.id, second.c.id)
+        .limit(DUPLICATES_REPORTED)
+    ).all()
+
+
+def _create_exclusion_constraints(connection: Connection) -> None:
+    """
+    Creates the PostgreSQL exclusion constraints missing from the appointment table.
+
+    As with the unique indexes, a constraint is skipped when existing
+    appointments already overlap, and the overlapping pairs are logged so they
+    can be fixed by hand.
+
+    Args:
+        connection (Connection): The database connection.
+    """
+
+    if connection.dialect.name != 'postgresql':
+        return
+
+    existing = set(connection.execute(text(
+        "SELECT conname FROM pg_constraint WHERE contype = 'x'")).scalars())
+    constraints = {constraint.name: constraint
+                   for constraint in Appointment.__table__.constraints}
+
+    for column_name, name in EXCLUSION_CONSTRAINTS.items():
+        if name in existing:
+            continue
+
+        overlaps = _find_overlaps(connection, column_name)
+
+        if overlaps:
+            logger.error(
+                'The exclusion constraint %s was not created: appointments of the same '
+                '%s overlap. Fix them and restart the app to create it. First '
+                'overlapping appointments, as (%s, ID, ID): %s',
+                name, column_name, column_name,
+                '; '.join(', '.join(str(value) for value in row) for row in overlaps))
+            continue
+
+        connection.exec_driver_sql('CREATE EXTENSION IF NOT EXISTS btree_gist')
+        connection.execute(AddConstraint(constraints[name]))
+
+
+def _check_rollups(connection: Connection) -> None:
+    """
+    Warns when the analytics rollups are empty while appointments exist, as in
+    databases created before the rollups. They are rebuilt by the `analytics
+    rebuild` command rather than here, since the rebuild requires NumPy.
+
+    Args:
+        connection (Connection): The database connection.
+    """
+
+    if (connection.execute(select(EmployeeDayRollup.day).limit(1)).first() is None
+            and connection.execute(select(Appointment.id).limit(1)).first() is not None):
+        logger.warning('The analytics rollups are empty: run `flask --app app analytics '
+                       'rebuild` to compute them from the appointments history.')
+
+
+def _seed_table_versions(connection: Connection) -> None:
+    """
+    Creates the version row of every versioned table that does not have one yet.
+
+    Args:
+        connection (Connection): The database connection.
+    """
+
+    existing = set(connection.execute(select(TableVersion.table_name)).scalars())
+    missing = [table_name for table_name in VERSIONED_TABLES if table_name not in existing]
+
+    if missing:
+        connection.execute(TableVersion.__table__.insert(), [
+            {'table_name': table_name, 'version': 0} for table_name in missing
+        ])
+
+
+def upgrade(engine: Engine) -> None:
+    """
+    Brings an existing database up to date with the models.
+
+    Args:
+        engine (Engine): The database engine.
+    """
+
+    inspector = inspect(engine)
+    service_columns = {column['name'] for column in inspector.get_columns('service')}
+    appointment_columns = {column['name']
+                           for column in inspector.get_columns('appointment')}
+
+    with engine.begin() as connection:
+        if 'duration' not in service_columns:
+            _add_column(connection, 'service', 'duration', default='30')
+
+        if 'end_date' not in appointment_columns:
+            _add_column(connection, 'appointment', 'end_date')
+            _fill_appointments_end_date(connection)
+
+        _create_indexes(connection)
+        _create_exclusion_constraints(connection)
+
+        _fill_schedule_entries(connection)
+        _check_rollups(connection)
+        _seed_table_versions(connection)
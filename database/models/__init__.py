@@ -4,3 +4,7 @@ from .appointment import Appointment
 from .service import Service
 from .service_employee import service_employee
 from .service_appointment import service_appointment
+from .table_version import TableVersion
+from .schedule_entry import ScheduleEntry
+from .employee_day_rollup import EmployeeDayRollup
+from .service_day_rollup import ServiceDayRollup
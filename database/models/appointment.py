@@ -3,7 +3,9 @@ This module defines the Appointment model for the database.
 """
 
 from typing import List, TYPE_CHECKING
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import DDL, event
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
 from database.db_setup import db
 from .service_appointment import service_appointment
 
@@ -11,6 +13,13 @@ from .service_appointment import service_appointment
 if TYPE_CHECKING:
     from .service import Service
 
+# Names of the PostgreSQL exclusion constraints keeping the appointments of
+# the same employee or customer from overlapping, by column.
+EXCLUSION_CONSTRAINTS = {
+    'employee_id': 'ex_appointment_employee_id_period',
+    'customer_id': 'ex_appointment_customer_id_period',
+}
+
 
 class Appointment(db.Model):
     """
@@ -19,6 +28,7 @@ class Appointment(db.Model):
     Attributes:
         id (int): Primary key identifier.
         date (datetime): Date and time of the appointment.
+        end_date (datetime): Date and time when the appointment ends.
         services (List[Service]): List of services associated with the appointment.
         employee_id (int): Foreign key referencing the assigned employee.
         customer_id (int): Foreign key referencing the assigned customer.
@@ -30,6 +40,7 @@ class Appointment(db.Model):
 
     id = db.Column(db.Integer, primary_key=True)
     date = db.Column(db.DateTime, nullable=False)
+    end_date = db.Column(db.DateTime, nullable=False)
     services = db.relationship(
         'Service', secondary=service_appointment, back_populates='appointments')
     employee_id = db.Column(db.Integer, db.ForeignKey(
@@ -42,9 +53,49 @@ class Appointment(db.Model):
     updated_at = db.Column(
         db.DateTime, default=datetime.now(timezone.utc), onupdate=datetime.now(timezone.utc))
 
+    # On PostgreSQL, the exclusion constraints reject an appointment overlapping
+    # another one of the same employee or customer, even when both are inserted
+    # by concurrent transactions. SQLite serializes writers, so the availability
+    # check of the insert is enough there.
+    __table_args__ = (
+        db.Index('ix_appointment_employee_id_date', 'employee_id', 'date', unique=True),
+        db.Index('ix_appointment_customer_id_date', 'customer_id', 'date', unique=True),
+        db.Index('ix_appointment_date_id', 'date', 'id'),
+        ExcludeConstraint(
+            (employee_id, '='), (db.func.tsrange(date, end_date), '&&'),
+            name=EXCLUSION_CONSTRAINTS['employee_id'], using='gist'
+        ).ddl_if(dialect='postgresql'),
+        ExcludeConstraint(
+            (customer_id, '='), (db.func.tsrange(date, end_date), '&&'),
+            name=EXCLUSION_CONSTRAINTS['customer_id'], using='gist'
+        ).ddl_if(dialect='postgresql'),
+    )
+
     def __init__(self, date: datetime, services: List['Service'],
                  employee_id: int, customer_id: int) -> None:
         self.date = date
+        self.end_date = Appointment.get_end_date(date, services)
         self.services = services
         self.employee_id = employee_id
         self.customer_id = customer_id
+
+    @staticmethod
+    def get_end_date(date: datetime, services: List['Service']) -> datetime:
+        """
+        Computes when an appointment ends, after all its services are executed.
+
+        Args:
+            date (datetime): Date and time of the appointment.
+            services (List[Service]): List of services of the appointment.
+
+        Returns:
+            datetime: Date and time when the appointment ends.
+        """
+
+        return date + timedelta(minutes=sum(service.duration for service in services))
+
+
+# The exclusion constraints compare integers with '=' in a GiST index, which
+# requires the btree_gist extension.
+event.listen(Appointment.__table__, 'before_create', DDL(
+    'CREATE EXTENSION IF NOT EXISTS btree_gist').execute_if(dialect='postgresql'))
@@ -0,0 +1,39 @@
+"""
+This module defines the EmployeeDayRollup model for the database.
+"""
+
+from datetime import date
+from database.db_setup import db
+
+
+class EmployeeDayRollup(db.Model):
+    """
+    Represents the bookings totals of one employee on one day, added to by
+    every booking and recomputed from the appointments history by the
+    `analytics rebuild` command.
+
+    Attributes:
+        day (date): Primary key, day of the appointments.
+        employee_id (int): Primary key, foreign key referencing the employee.
+        bookings (int): Number of appointments.
+        revenue (int): Total price of the appointments services in cents.
+        booked_minutes (int): Total duration of the appointments in minutes.
+    """
+
+    __tablename__ = 'employee_day_rollup'
+    __table_args__ = (
+        db.Index('ix_employee_day_rollup_employee_id_day', 'employee_id', 'day'),
+    )
+
+    day = db.Column(db.Date, primary_key=True)
+    employee_id = db.Column(db.Integer, db.ForeignKey('employee.id'), primary_key=True)
+    bookings = db.Column(db.Integer, nullable=False, default=0)
+    revenue = db.Column(db.Integer, nullable=False, default=0)
+    booked_minutes = db.Column(db.Integer, nullable=False, default=0)
+
+    def __init__(self, day: date, employee_id: int) -> None:
+        self.day = day
+        self.employee_id = employee_id
+        self.bookings = 0
+        self.revenue = 0
+        self.booked_minutes = 0
@@ -0,0 +1,58 @@
+"""
+This module defines the ScheduleEntry model for the database.
+"""
+
+from datetime import datetime
+from typing import List
+from database.db_setup import db
+
+
+class ScheduleEntry(db.Model):
+    """
+    Represents an appointment in the schedule of its employee's day, denormalized
+    with the customer name and the services names and price, so a schedule is
+    read from this table alone.
+
+    Entries are written with their appointment, in the same transaction, and
+    customers and services are never updated, so they never go stale.
+
+    Attributes:
+        appointment_id (int): Primary key, referencing the appointment.
+        employee_id (int): Foreign key referencing the assigned employee.
+        day (date): Day of the appointment.
+        date (datetime): Date and time of the appointment.
+        end_date (datetime): Date and time when the appointment ends.
+        customer_id (int): Foreign key referencing the assigned customer.
+        customer_name (str): Name of the customer.
+        services (List[str]): Names of the services of the appointment.
+        price (int): Total price of the services in cents.
+    """
+
+    __tablename__ = 'schedule_entry'
+    __table_args__ = (
+        db.Index('ix_schedule_entry_employee_id_day_date', 'employee_id', 'day', 'date'),
+        db.Index('ix_schedule_entry_day_employee_id_date', 'day', 'employee_id', 'date'),
+    )
+
+    appointment_id = db.Column(db.Integer, db.ForeignKey('appointment.id'), primary_key=True)
+    employee_id = db.Column(db.Integer, db.ForeignKey('employee.id'), nullable=False)
+    day = db.Column(db.Date, nullable=False)
+    date = db.Column(db.DateTime, nullable=False)
+    end_date = db.Column(db.DateTime, nullable=False)
+    customer_id = db.Column(db.Integer, db.ForeignKey('customer.id'), nullable=False)
+    customer_name = db.Column(db.String(100), nullable=False)
+    services = db.Column(db.JSON, nullable=False)
+    price = db.Column(db.Integer, nullable=False)
+
+    def __init__(self, appointment_id: int, employee_id: int, date: datetime,
+                 end_date: datetime, customer_id: int, customer_name: str,
+                 services: List[str], price: int) -> None:
+        self.appointment_id = appointment_id
+        self.employee_id = employee_id
+        self.day = date.date()
+        self.date = date
+        self.end_date = end_date
+        self.customer_id = customer_id
+        self.customer_name = customer_name
+        self.services = services
+        self.price = price
@@ -21,6 +21,7 @@ class Service(db.Model):
         id (int): Primary key identifier.
         name (str): Name of the service.
         price (int): Price of the service in cents.
+        duration (int): Duration of the service in minutes.
         employees (list): List of employees that can perform the service.
         appointments (list): List of appointments with assigned service.
         created_at (datetime): Timestamp when the record was created.
@@ -29,8 +30,9 @@ class Service(db.Model):
     __tablename__ = 'service'
 
     id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String(100), nullable=False)
+    name = db.Column(db.String(100), nullable=False, index=True)
     price = db.Column(db.Integer, nullable=False)
+    duration = db.Column(db.Integer, nullable=False, server_default='30')
     employees = db.relationship(
         'Employee', secondary=service_employee, back_populates='services')
     appointments = db.relationship(
@@ -39,9 +41,10 @@ class Service(db.Model):
     updated_at = db.Column(
         db.DateTime, default=datetime.now(timezone.utc), onupdate=datetime.now(timezone.utc))
 
-    def __init__(self, name: str, price: int,
+    def __init__(self, name: str, price: int, duration: int,
                  employees: list['Employee'], appointments: list['Appointment']) -> None:
         self.name = name
         self.price = price
+        self.duration = duration
         self.employees = employees
         self.appointments = appointments
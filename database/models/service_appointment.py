@@ -9,5 +9,6 @@ service_appointment = db.Table(
     db.Column('service_id', db.Integer, db.ForeignKey(
         'service.id'), primary_key=True),
     db.Column('appointment_id', db.Integer, db.ForeignKey(
-        'appointment.id'), primary_key=True)
+        'appointment.id'), primary_key=True),
+    db.Index('ix_service_appointment_appointment_id_service_id', 'appointment_id', 'service_id')
 )
@@ -0,0 +1,33 @@
+"""
+This module defines the ServiceDayRollup model for the database.
+"""
+
+from datetime import date
+from database.db_setup import db
+
+
+class ServiceDayRollup(db.Model):
+    """
+    Represents the bookings totals of one service on one day, added to by
+    every booking and recomputed from the appointments history by the
+    `analytics rebuild` command.
+
+    Attributes:
+        day (date): Primary key, day of the appointments.
+        service_id (int): Primary key, foreign key referencing the service.
+        bookings (int): Number of appointments including the service.
+        revenue (int): Total price of the service in those appointments, in cents.
+    """
+
+    __tablename__ = 'service_day_rollup'
+
+    day = db.Column(db.Date, primary_key=True)
+    service_id = db.Column(db.Integer, db.ForeignKey('service.id'), primary_key=True)
+    bookings = db.Column(db.Integer, nullable=False, default=0)
+    revenue = db.Column(db.Integer, nullable=False, default=0)
+
+    def __init__(self, day: date, service_id: int) -> None:
+        self.day = day
+        self.service_id = service_id
+        self.bookings = 0
+        self.revenue = 0
@@ -9,5 +9,6 @@ service_employee = db.Table(
     db.Column('service_id', db.Integer, db.ForeignKey(
         'service.id'), primary_key=True),
     db.Column('employee_id', db.Integer, db.ForeignKey(
-        'employee.id'), primary_key=True)
+        'employee.id'), primary_key=True),
+    db.Index('ix_service_employee_employee_id_service_id', 'employee_id', 'service_id')
 )
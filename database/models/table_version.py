@@ -0,0 +1,27 @@
+"""
+This module defines the TableVersion model for the database.
+"""
+
+from datetime import datetime, timezone
+from database.db_setup import db
+
+
+class TableVersion(db.Model):
+    """
+    Represents the write version of a table, bumped by every change to its rows.
+
+    Attributes:
+        table_name (str): Name of the versioned table.
+        version (int): Number of changes committed to the table.
+        updated_at (datetime): Timestamp of the last change to the table.
+    """
+
+    __tablename__ = 'table_version'
+
+    table_name = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.now(timezone.utc))
+
+    def __init__(self, table_name: str) -> None:
+        self.table_name = table_name
+        self.version = 0
@@ -0,0 +1,171 @@
+"""
+Rebuild of the analytics rollups from the appointments history.
+
+Bookings add to the rollups as they are made, so a rebuild is only needed
+for appointments inserted some other way, such as databases created before
+the rollups existed. The appointments are read in chunks of consecutive IDs,
+each chunk is summed per day and employee or service with NumPy, and the
+partial sums of every chunk are summed once more at the end, so memory
+depends on the chunk size and the number of rollup rows only.
+
+Requires `pip install numpy`.
+"""
+
+from typing import Any, Dict, List, Tuple
+from sqlalchemy import String, delete, func, insert, select, type_coerce
+from database.db_setup import db
+from database.models.appointment import Appointment
+from database.models.employee_day_rollup import EmployeeDayRollup
+from database.models.service import Service
+from database.models.service_appointment import service_appointment
+from database.models.service_day_rollup import ServiceDayRollup
+from repositories.table_version_repository import bump_table_version
+
+REBUILD_CHUNK_SIZE = 200000
+
+
+def _numpy() -> Any:
+    """
+    Imports NumPy, required by the rebuild only.
+    """
+
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError as error:
+        raise ImportError('Rebuilding the analytics rollups requires the numpy package. '
+                          'Install it with `pip install numpy`.') from error
+
+    return numpy
+
+
+def _sum_by_key(np: Any, keys: Any, *values: Any) -> Tuple[Any, ...]:
+    """
+    Sums values sharing the same key.
+
+    Returns:
+        Tuple[Any, ...]: The distinct keys, in ascending order, and the sums of each values array.
+    """
+
+    distinct, inverse = np.unique(keys, return_inverse=True)
+
+    return (distinct, *(np.bincount(inverse, weights=column, minlength=len(distinct))
+                        .round().astype(np.int64) for column in values))
+
+
+def _chunk_totals(np: Any, rows: List[Any], prices: Any, employees_base: int,
+                  services_base: int, last_id: int) -> Tuple[Tuple[Any, ...], Tuple[Any, ...]]:
+    """
+    Sums a chunk of appointments per day and employee and per day and service.
+
+    Keys are encoded as day * base + ID, days being counted from the epoch.
+
+    Returns:
+        Tuple[Tuple[Any, ...], Tuple[Any, ...]]: The employees keys, bookings,
+        revenue and booked minutes, and the services keys, bookings and revenue.
+    """
+
+    ids, employees, dates, end_dates = zip(*rows)
+    ids, employees = np.array(ids, dtype=np.int64), np.array(employees, dtype=np.int64)
+    dates = np.array(dates, dtype='datetime64[m]')
+    days = dates.astype('datetime64[D]').astype(np.int64)
+    minutes = (np.array(end_dates, dtype='datetime64[m]') - dates).astype(np.int64)
+
+    # Rows are converted to tuples, NumPy would otherwise probe each Row for array attributes.
+    links = np.array([tuple(row) for row in db.session.execute(
+        select(service_appointment.c.appointment_id, service_appointment.c.service_id)
+        .where(service_appointment.c.appointment_id.between(int(ids[0]), last_id))
+    )], dtype=np.int64).reshape(-1, 2)
+    positions = np.searchsorted(ids, links[:, 0])
+    links_services = links[:, 1]
+    links_prices = prices[links_services]
+    revenue = np.bincount(positions, weights=links_prices, minlength=len(ids))
+
+    return (
+        _sum_by_key(np, days * employees_base + employees,
+                    np.ones(len(ids)), revenue, minutes),
+        _sum_by_key(np, days[positions] * services_base + links_services,
+                    np.ones(len(positions)), links_prices),
+    )
+
+
+def _rows(np: Any, partials: List[Tuple[Any, ...]], base: int,
+          id_column: str, columns: Tuple[str, ...]) -> List[Dict[str, Any]]:
+    """
+    Sums the partial totals of every chunk into rollup rows.
+    """
+
+    if not partials:
+        return []
+
+    keys, *totals = _sum_by_key(np, *(np.concatenate(column) for column in zip(*partials)))
+    days = (keys // base).astype('datetime64[D]').tolist()
+
+    return [dict(zip(('day', id_column, *columns), row))
+            for row in zip(days, (keys % base).tolist(), *(column.tolist() for column in totals))]
+
+
+def rebuild_rollups(chunk_size: int = REBUILD_CHUNK_SIZE) -> Dict[str, int]:
+    """
+    Replaces the employees and services daily rollups with the totals of every
+    appointment, in the caller's transaction.
+
+    The appointment table version is bumped, so the cached reports are not reused.
+
+    Args:
+        chunk_size (int): The appointments read per query.
+
+    Returns:
+        Dict[str, int]: The number of appointments read and of rollup rows written, by table.
+    """
+
+    np = _numpy()
+    employees_base = (db.session.query(func.max(Appointment.employee_id)).scalar() or 0) + 1
+    services = db.session.execute(select(Service.id, Service.price)).all()
+    services_base = max((service_id for service_id, _ in services), default=0) + 1
+    prices = np.zeros(services_base)
+    prices[[service_id for service_id, _ in services]] = [price for _, price in services]
+    employees_partials, services_partials = [], []
+    appointments = 0
+    last_id = 0
+
+    while True:
+        # Dates are read as returned by the driver, text on SQLite, which NumPy
+        # parses much faster than the datetime objects SQLAlchemy would build.
+        rows = db.session.execute(
+            select(Appointment.id, Appointment.employee_id,
+                   type_coerce(Appointment.date, String), type_coerce(Appointment.end_date, String))
+            .where(Appointment.id > last_id)
+            .order_by(Appointment.id)
+            .limit(chunk_size)
+        ).all()
+
+        if not rows:
+            break
+
+        last_id = rows[-1][0]
+        employees_totals, services_totals = _chunk_totals(
+            np, rows, prices, employees_base, services_base, last_id)
+        employees_partials.append(employees_totals)
+        services_partials.append(services_totals)
+        appointments += len(rows)
+
+    employees_rows = _rows(np, employees_partials, employees_base, 'employee_id',
+                           ('bookings', 'revenue', 'booked_minutes'))
+    services_rows = _rows(np, services_partials, services_base, 'service_id',
+                          ('bookings', 'revenue'))
+
+    db.session.execute(delete(EmployeeDayRollup))
+    db.session.execute(delete(ServiceDayRollup))
+
+    for table, rows in ((EmployeeDayRollup.__table__, employees_rows),
+                        (ServiceDayRollup.__table__, services_rows)):
+        if rows:
+            db.session.execute(insert(table), rows)
+
+    bump_table_version(Appointment.__tablename__)
+
+    return {
+        'appointment': appointments,
+        EmployeeDayRollup.__tablename__: len(employees_rows),
+        ServiceDayRollup.__tablename__: len(services_rows),
+    }
@@ -0,0 +1,52 @@
+"""
+Routing module for read replicas.
+
+Routes decorated with `use_read_replica` send their SELECT statements to the
+replica engine, when one is configured. Every other statement, and every
+statement of other routes, goes to the primary engine.
+"""
+
+from functools import wraps
+from typing import Any, Callable
+from flask import g
+from flask_sqlalchemy.session import Session
+from sqlalchemy import Select
+
+REPLICA_BIND_KEY = 'replica'
+
+
+class RoutingSession(Session):
+    """
+    Session that sends the reads of replica-enabled routes to the replica engine.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        """
+        Selects the replica engine for SELECT statements of replica-enabled routes,
+        and the default engine otherwise.
+        """
+
+        if (bind is None and not self._flushing and isinstance(clause, Select)
+                and g.get('use_read_replica') and REPLICA_BIND_KEY in self._db.engines):
+            return self._db.engines[REPLICA_BIND_KEY]
+
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def use_read_replica(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Decorates a read-only route so its queries hit the read replica.
+
+    Args:
+        func (Callable[..., Any]): The route function.
+
+    Returns:
+        Callable[..., Any]: The decorated route function.
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        g.use_read_replica = True
+        return func(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,49 @@
+"""
+Sets up the request instrumentation and the slow query profiler of the Flask application.
+"""
+
+from flask import Flask
+from sqlalchemy import Engine
+from database.config import SLOW_QUERY_THRESHOLD
+from database.db_setup import db
+from monitoring.instrumentation import instrument_app, instrument_engine
+from monitoring.profiler import QueryProfiler, slow_queries
+
+
+def init_monitoring(app: Flask):
+    """
+    Records the metrics of every request when the MONITORING config is enabled,
+    and profiles the statements of every engine when the QUERY_PROFILING config
+    is enabled. Both are exposed by the metrics routes.
+
+    Args:
+        app (Flask): The Flask application instance.
+    """
+
+    if app.config.get('QUERY_PROFILING', False):
+        app.extensions['query_profiler'] = QueryProfiler(SLOW_QUERY_THRESHOLD / 1000,
+                                                         slow_queries)
+
+    if app.config.get('MONITORING', False):
+        instrument_app(app)
+
+    with app.app_context():
+        for engine in db.engines.values():
+            monitor_engine(app, engine)
+
+
+def monitor_engine(app: Flask, engine: Engine):
+    """
+    Instruments and profiles the statements of an engine as configured for the
+    app, such as the sync engine behind an async engine of the ASGI entry point.
+
+    Args:
+        app (Flask): The Flask application instance, already set up by init_monitoring.
+        engine (Engine): The engine.
+    """
+
+    if app.config.get('MONITORING', False):
+        instrument_engine(engine)
+
+    if 'query_profiler' in app.extensions:
+        app.extensions['query_profiler'].attach(engine)
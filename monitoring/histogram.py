@@ -0,0 +1,120 @@
+"""
+HDR-style histogram of integer values.
+
+Values are counted in log-linear buckets: every power of two range is split
+into the same number of sub-buckets, so the relative error of any reported
+value is bounded, from a microsecond to hours, with about a thousand
+counters at most. Recording a value is a few integer operations.
+"""
+
+import threading
+from typing import Dict, Iterable, List, Tuple
+
+
+class Histogram():
+    """
+    Thread-safe histogram of non-negative integer values.
+
+    Values below 2 ** (precision_bits + 1) are counted exactly, larger ones
+    with a relative error below 1 / 2 ** precision_bits.
+
+    Attributes:
+        precision_bits (int): The number of sub-buckets per power of two, as a power of two.
+        count (int): The number of recorded values.
+        total (int): The sum of the recorded values.
+        max (int): The largest recorded value.
+    """
+
+    __slots__ = ('precision_bits', 'count', 'total', 'max', '_counts', '_lock')
+
+    def __init__(self, precision_bits: int = 5) -> None:
+        self.precision_bits = precision_bits
+        self.count = 0
+        self.total = 0
+        self.max = 0
+        self._counts: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def _index(self, value: int) -> int:
+        shift = value.bit_length() - self.precision_bits - 1
+
+        if shift <= 0:
+            return value
+
+        return (shift << self.precision_bits) + (value >> shift)
+
+    def _upper_bound(self, index: int) -> int:
+        """
+        Retrieves the largest value counted in a bucket.
+        """
+
+        shift = (index >> self.precision_bits) - 1
+
+        if shift <= 0:
+            return index
+
+        return ((index - (shift << self.precision_bits) + 1) << shift) - 1
+
+    def record(self, value: int) -> None:
+        """
+        Records a value.
+
+        Args:
+            value (int): The value, negative values are recorded as 0.
+        """
+
+        value = max(value, 0)
+        index = self._index(value)
+
+        with self._lock:
+            self._counts[index] = self._counts.get(index, 0) + 1
+            self.count += 1
+            self.total += value
+
+            if value > self.max:
+                self.max = value
+
+    def snapshot(self) -> Tuple[int, int, List[Tuple[int, int]]]:
+        """
+        Copies the histogram counters.
+
+        Returns:
+            Tuple[int, int, List[Tuple[int, int]]]: The number and sum of the values,
+            and the (upper bound, count) of every non-empty bucket, by increasing bound.
+        """
+
+        with self._lock:
+            buckets = sorted(self._counts.items())
+            count, total, maximum = self.count, self.total, self.max
+
+        return count, total, [(min(self._upper_bound(index), maximum), bucket_count)
+                              for index, bucket_count in buckets]
+
+    def quantiles(self, quantiles: Iterable[float]) -> Dict[float, int]:
+        """
+        Computes quantiles of the recorded values.
+
+        Args:
+            quantiles (Iterable[float]): The quantiles, between 0 and 1.
+
+        Returns:
+            Dict[float, int]: The upper bound of the bucket holding each quantile,
+            0 for every quantile if no value was recorded.
+        """
+
+        count, _, buckets = self.snapshot()
+        values: Dict[float, int] = {}
+
+        for quantile in quantiles:
+            rank = max(quantile * count, 1)
+            seen = 0
+            values[quantile] = 0
+
+            for upper_bound, bucket_count in buckets:
+                seen += bucket_count
+
+                if seen >= rank:
+                    values[quantile] = upper_bound
+                    break
+
+        return values
@@ -0,0 +1,166 @@
+"""
+Per-request instrumentation of the Flask app and of the async routes.
+
+The counters of the running request are kept in a context variable: the
+SQL statements are timed by cursor execution events of every engine, the
+JSON encoding by the app's JSON provider and the compiled serializer, and
+the totals are recorded in the metrics registry once the response is built,
+or once a streamed response is closed. The async routes of the ASGI entry point record their requests with the
+same counters. Statements run outside a request, such as in commands, are
+not recorded.
+"""
+
+import time
+from contextvars import ContextVar
+from typing import Any, Optional
+from flask import Flask, Response, request
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import Engine, event
+from monitoring.metrics import registry
+
+
+class RequestStats():
+    """
+    Counters of the running request.
+
+    Attributes:
+        started (float): The request start, in seconds of the performance counter.
+        sql_statements (int): The number of SQL statements run.
+        sql_duration (float): The time spent running SQL statements, in seconds.
+        sql_started (float): The start of the running SQL statement.
+        serialization_duration (float): The time spent serializing, in seconds.
+    """
+
+    __slots__ = ('started', 'sql_statements', 'sql_duration', 'sql_started',
+                 'serialization_duration')
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.sql_statements = 0
+        self.sql_duration = 0.0
+        self.sql_started = 0.0
+        self.serialization_duration = 0.0
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar('request_stats', default=None)
+
+
+def record_serialization(started: float) -> None:
+    """
+    Adds the time elapsed since the given start to the running request's serialization time.
+
+    Args:
+        started (float): The serialization start, in seconds of the performance counter.
+    """
+
+    stats = _current.get()
+
+    if stats is not None:
+        stats.serialization_duration += time.perf_counter() - started
+
+
+class InstrumentedJSONProvider(DefaultJSONProvider):
+    """
+    Flask's default JSON provider, timing the encoding of every response.
+    """
+
+    # Encodes exactly like the default provider, so the compiled serializer stays enabled.
+    compiled_serializer_compatible = True
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        started = time.perf_counter()
+        encoded = super().dumps(obj, **kwargs)
+        record_serialization(started)
+
+        return encoded
+
+
+def _before_cursor_execute(*_args) -> None:
+    stats = _current.get()
+
+    if stats is not None:
+        stats.sql_started = time.perf_counter()
+
+
+def _after_cursor_execute(*_args) -> None:
+    stats = _current.get()
+
+    if stats is not None:
+        stats.sql_statements += 1
+        stats.sql_duration += time.perf_counter() - stats.sql_started
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Times the SQL statements run by an engine during requests.
+
+    Args:
+        engine (Engine): The engine.
+    """
+
+    event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+
+
+def start_request_stats() -> None:
+    """
+    Starts counting the statements and serialization of a new request.
+    """
+
+    _current.set(RequestStats())
+
+
+def record_request_stats(method: str, route: str, status: int) -> None:
+    """
+    Records the running request's counters in the metrics registry, and stops counting.
+
+    Args:
+        method (str): The request method.
+        route (str): The matched route rule.
+        status (int): The response status code.
+    """
+
+    stats = _current.get()
+
+    if stats is None:
+        return
+
+    _current.set(None)
+    registry.record_request(
+        method, route, status, int((time.perf_counter() - stats.started) * 1_000_000),
+        stats.sql_statements, int(stats.sql_duration * 1_000_000),
+        int(stats.serialization_duration * 1_000_000))
+
+
+def _finish_request(response: Response) -> Response:
+    """
+    Records the running request's counters under its route rule.
+
+    Streamed bodies, such as the exports, are generated after the response
+    is returned, so their requests are recorded once the response is closed,
+    with the statements and serialization of the whole stream.
+    """
+
+    rule = request.url_rule
+    route = rule.rule if rule is not None else 'unmatched'
+
+    if response.is_streamed:
+        method, status = request.method, response.status_code
+        response.call_on_close(lambda: record_request_stats(method, route, status))
+    else:
+        record_request_stats(request.method, route, response.status_code)
+
+    return response
+
+
+def instrument_app(app: Flask) -> None:
+    """
+    Records the metrics of every request handled by the app.
+
+    Args:
+        app (Flask): The Flask application instance.
+    """
+
+    app.json = InstrumentedJSONProvider(app)
+    app.before_request(start_request_stats)
+    app.after_request(_finish_request)
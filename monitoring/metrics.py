@@ -0,0 +1,184 @@
+"""
+In-memory registry of the request metrics, rendered in the Prometheus text format.
+
+Every request is recorded under its route rule and method, so the number of
+series is bounded by the number of routes. Durations are recorded in
+microseconds and exposed in seconds, as summaries with their quantiles.
+"""
+
+import threading
+from collections import defaultdict
+from typing import DefaultDict, Dict, List, Tuple
+from monitoring.histogram import Histogram
+from repositories.cache import cache
+
+PROMETHEUS_MIMETYPE = 'text/plain; version=0.0.4'
+QUANTILES = (0.5, 0.9, 0.99, 0.999)
+MICROSECONDS = 1_000_000
+
+Labels = Tuple[str, str]
+
+
+class RouteMetrics():
+    """
+    Histograms of the requests of one route and method.
+
+    Attributes:
+        duration (Histogram): The wall time of the requests, in microseconds.
+        sql_statements (Histogram): The number of SQL statements run per request.
+        sql_duration (Histogram): The SQL time per request, in microseconds.
+        serialization_duration (Histogram): The serialization time per request, in microseconds.
+    """
+
+    __slots__ = ('duration', 'sql_statements', 'sql_duration', 'serialization_duration')
+
+    def __init__(self) -> None:
+        self.duration = Histogram()
+        self.sql_statements = Histogram()
+        self.sql_duration = Histogram()
+        self.serialization_duration = Histogram()
+
+
+class MetricsRegistry():
+    """
+    Thread-safe registry of the metrics of every route.
+    """
+
+    def __init__(self) -> None:
+        self._routes: DefaultDict[Labels, RouteMetrics] = defaultdict(RouteMetrics)
+        self._responses: DefaultDict[Tuple[str, str, int], int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def record_request(self, method: str, route: str, status: int, duration: int,
+                       sql_statements: int, sql_duration: int,
+                       serialization_duration: int) -> None:
+        """
+        Records a finished request.
+
+        Args:
+            method (str): The request method.
+            route (str): The matched route rule.
+            status (int): The response status code.
+            duration (int): The request wall time, in microseconds.
+            sql_statements (int): The number of SQL statements run.
+            sql_duration (int): The time spent running SQL statements, in microseconds.
+            serialization_duration (int): The time spent serializing, in microseconds.
+        """
+
+        with self._lock:
+            metrics = self._routes[(method, route)]
+            self._responses[(method, route, status)] += 1
+
+        metrics.duration.record(duration)
+        metrics.sql_statements.record(sql_statements)
+        metrics.sql_duration.record(sql_duration)
+        metrics.serialization_duration.record(serialization_duration)
+
+    def routes(self) -> Dict[Labels, RouteMetrics]:
+        """
+        Retrieves the metrics of every recorded route.
+
+        Returns:
+            Dict[Labels, RouteMetrics]: The metrics, by method and route.
+        """
+
+        with self._lock:
+            return dict(self._routes)
+
+    def responses(self) -> Dict[Tuple[str, str, int], int]:
+        """
+        Retrieves the number of responses of every recorded route.
+
+        Returns:
+            Dict[Tuple[str, str, int], int]: The number of responses, by method, route and status.
+        """
+
+        with self._lock:
+            return dict(self._responses)
+
+    def clear(self) -> None:
+        """
+        Removes every recorded metric.
+        """
+
+        with self._lock:
+            self._routes.clear()
+            self._responses.clear()
+
+
+registry = MetricsRegistry()
+
+
+def _labels(**labels) -> str:
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+               for value in labels.values())
+
+    return ','.join(f'{name}="{value}"' for name, value in zip(labels, escaped))
+
+
+def _scaled(value: int, scale: int) -> float:
+    return value / scale if scale != 1 else value
+
+
+def _summary(lines: List[str], name: str, labels: Labels,
+             histogram: Histogram, scale: int) -> None:
+    """
+    Renders the quantiles, sum and count of a histogram as a Prometheus summary.
+    """
+
+    method, route = labels
+    series = _labels(method=method, route=route)
+
+    for quantile, value in histogram.quantiles(QUANTILES).items():
+        lines.append(f'{name}{{{series},quantile="{quantile}"}} {_scaled(value, scale)}')
+
+    lines.append(f'{name}_sum{{{series}}} {_scaled(histogram.total, scale)}')
+    lines.append(f'{name}_count{{{series}}} {histogram.count}')
+
+
+def render_metrics() -> str:
+    """
+    Renders the recorded metrics and the cache counters in the Prometheus text format.
+
+    Returns:
+        str: The metrics exposition.
+    """
+
+    routes = sorted(registry.routes().items())
+    summaries = [
+        ('http_request_duration_seconds', 'Wall time of the requests.',
+         'duration', MICROSECONDS),
+        ('http_request_sql_statements', 'SQL statements run per request.',
+         'sql_statements', 1),
+        ('http_request_sql_duration_seconds', 'Time spent running SQL statements per request.',
+         'sql_duration', MICROSECONDS),
+        ('http_request_serialization_duration_seconds',
+         'Time spent serializing the response per request.',
+         'serialization_duration', MICROSECONDS),
+    ]
+
+    lines = ['# HELP http_requests_total Responses sent, by route and status.',
+             '# TYPE http_requests_total counter']
+    lines.extend(
+        f'http_requests_total{{{_labels(method=method, route=route, status=status)}}} {count}'
+        for (method, route, status), count in sorted(registry.responses().items()))
+
+    for name, description, attribute, scale in summaries:
+        lines.append(f'# HELP {name} {description}')
+        lines.append(f'# TYPE {name} summary')
+
+        for labels, metrics in routes:
+            _summary(lines, name, labels, getattr(metrics, attribute), scale)
+
+    lines.append('# HELP cache_lookups_total Repository cache lookups, by result.')
+    lines.append('# TYPE cache_lookups_total counter')
+    stats = cache.stats()
+
+    for result in ('local_hits', 'shared_hits', 'misses'):
+        lines.append(f'cache_lookups_total{{{_labels(result=result)}}} {stats[result]}')
+
+    lines.append('# HELP cache_shared_errors_total Failed operations on the shared cache tier.')
+    lines.append('# TYPE cache_shared_errors_total counter')
+    lines.append(f'cache_shared_errors_total {stats["shared_errors"]}')
+
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,324 @@
+"""
+Slow query profiler.
+
+Every statement running longer than SLOW_QUERY_THRESHOLD is logged with its
+normalized SQL, a fingerprint of its parameters, the repository function it
+was issued from, and its query plan, captured with EXPLAIN QUERY PLAN on
+SQLite or EXPLAIN on PostgreSQL the first time the statement is slow.
+Slow statements are aggregated by the fingerprint of their normalized SQL,
+so the repository calls missing an index stand out.
+
+Parameters are only logged as a hash, since they hold customers data.
+"""
+
+import hashlib
+import logging
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+from flask import has_request_context, request
+from sqlalchemy import Connection, Engine, event
+
+logger = logging.getLogger(__name__)
+
+# Packages of the app, whose frames may issue a statement outside a repository, e.g. lazy loads.
+APP_PACKAGES = ('business', 'commands', 'database', 'routes', 'schemas', 'validations')
+# Modules of helpers called by the repository functions, never reported as origins.
+REPOSITORY_HELPERS = ('repositories.cache', 'repositories.pagination')
+EXPLAIN_PREFIXES = {
+    'sqlite': 'EXPLAIN QUERY PLAN ',
+    'postgresql': 'EXPLAIN ',
+}
+EXPLAINABLE = re.compile(r'\s*(SELECT|INSERT|UPDATE|DELETE|WITH)\b', re.IGNORECASE)
+
+_STRINGS = re.compile(r"'(?:[^']|'')*'")
+_NUMBERS = re.compile(r'\b\d+(?:\.\d+)?\b')
+_PLACEHOLDERS = re.compile(r'%\(\w+\)s|%s|\$\d+|(?<!:):\w+')
+_LISTS = re.compile(r'\(\?(?:\s*,\s*\?)+\)')
+_ROWS = re.compile(r'\(\?\)(?:\s*,\s*\(\?\))+')
+_SPACES = re.compile(r'\s+')
+# Route of the running async request, which has no Flask request context.
+_route: ContextVar[Optional[str]] = ContextVar('profiled_route', default=None)
+
+
+def normalize_sql(statement: str) -> str:
+    """
+    Normalizes a statement, so that its executions with any parameters, literals
+    or number of IN values and inserted rows are aggregated together.
+
+    Args:
+        statement (str): The SQL statement.
+
+    Returns:
+        str: The statement on one line, with every value replaced by a `?`.
+    """
+
+    statement = _STRINGS.sub('?', statement)
+    statement = _PLACEHOLDERS.sub('?', statement)
+    statement = _NUMBERS.sub('?', statement)
+    statement = _LISTS.sub('(?)', statement)
+    statement = _ROWS.sub('(?)', statement)
+
+    return _SPACES.sub(' ', statement).strip()
+
+
+def fingerprint(text: str) -> str:
+    """
+    Hashes a normalized statement or a parameters representation.
+
+    Args:
+        text (str): The text to hash.
+
+    Returns:
+        str: The first 16 hexadecimal digits of its SHA-1.
+    """
+
+    return hashlib.sha1(text.encode()).hexdigest()[:16]
+
+
+@contextmanager
+def profiled_route(route: str) -> Iterator[None]:
+    """
+    Attributes the statements issued by the libraries to an async route.
+
+    Args:
+        route (str): The method and path of the running async request.
+    """
+
+    token = _route.set(route)
+
+    try:
+        yield
+    finally:
+        _route.reset(token)
+
+
+def statement_origin() -> str:
+    """
+    Finds the function of the app that issued the running statement.
+
+    Returns:
+        str: The outermost repository function of the call stack, as in
+        `repositories.employee_repository.get_employee_appointment`, or the
+        innermost function of the app if the statement was not issued by a
+        repository, or the route of the running request for statements issued
+        by the libraries, such as lazy loads while serializing or the queries
+        of the async routes, or 'unknown'.
+    """
+
+    frame = sys._getframe(1)  # pylint: disable=protected-access
+    origin: Optional[str] = None
+    app_frame: Optional[str] = None
+
+    while frame is not None:
+        module = frame.f_globals.get('__name__', '')
+
+        if module in REPOSITORY_HELPERS:
+            pass
+        elif module.startswith('repositories.'):
+            origin = f'{module}.{frame.f_code.co_name}'
+        elif origin is not None:
+            return origin
+        elif app_frame is None and module.split('.')[0] in APP_PACKAGES:
+            app_frame = f'{module}.{frame.f_code.co_name}'
+
+        frame = frame.f_back
+
+    if origin or app_frame:
+        return origin or app_frame
+
+    if has_request_context() and request.url_rule is not None:
+        return f'{request.method} {request.url_rule.rule}'
+
+    return _route.get() or 'unknown'
+
+
+def explain(connection: Connection, statement: str, parameters: Any) -> List[str]:
+    """
+    Captures the query plan of a statement, on the connection that ran it.
+
+    The plan is read with a DBAPI cursor, so it is not itself profiled.
+    Neither EXPLAIN QUERY PLAN nor EXPLAIN without ANALYZE run the statement.
+
+    Args:
+        connection (Connection): The connection that ran the statement.
+        statement (str): The SQL statement, as sent to the DBAPI.
+        parameters (Any): The statement parameters.
+
+    Returns:
+        List[str]: The lines of the plan, empty if the dialect or the
+        statement cannot be explained.
+    """
+
+    prefix = EXPLAIN_PREFIXES.get(connection.dialect.name)
+
+    if prefix is None or not EXPLAINABLE.match(statement):
+        return []
+
+    cursor = connection.connection.cursor()
+
+    try:
+        cursor.execute(prefix + statement, parameters)
+        return [str(row[-1]) for row in cursor.fetchall()]
+    except Exception as error:  # pylint: disable=broad-except
+        return [f'EXPLAIN failed: {error}']
+    finally:
+        cursor.close()
+
+
+class SlowQuery():
+    """
+    Aggregate of the slow executions of one normalized statement.
+
+    Attributes:
+        fingerprint (str): The fingerprint of the normalized statement.
+        statement (str): The normalized statement.
+        origins (Counter): The number of slow executions, by issuing function.
+        count (int): The number of slow executions.
+        total_duration (float): The total time of the slow executions, in seconds.
+        max_duration (float): The longest slow execution, in seconds.
+        parameters (str): The parameters fingerprint of the last slow execution.
+        plan (Optional[List[str]]): The query plan, captured on the first slow
+            execution that can be explained.
+    """
+
+    __slots__ = ('fingerprint', 'statement', 'origins', 'count', 'total_duration',
+                 'max_duration', 'parameters', 'plan')
+
+    def __init__(self, statement_fingerprint: str, statement: str) -> None:
+        self.fingerprint = statement_fingerprint
+        self.statement = statement
+        self.origins: Counter = Counter()
+        self.count = 0
+        self.total_duration = 0.0
+        self.max_duration = 0.0
+        self.parameters = ''
+        self.plan: Optional[List[str]] = None
+
+
+class SlowQueryLog():
+    """
+    Thread-safe aggregates of the slow statements, by fingerprint.
+    """
+
+    def __init__(self) -> None:
+        self._queries: Dict[str, SlowQuery] = {}
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, origin: str, duration: float,
+               parameters: str) -> SlowQuery:
+        """
+        Records a slow execution.
+
+        Args:
+            statement (str): The normalized statement.
+            origin (str): The issuing function.
+            duration (float): The execution time, in seconds.
+            parameters (str): The parameters fingerprint.
+
+        Returns:
+            SlowQuery: The aggregate of the statement.
+        """
+
+        statement_fingerprint = fingerprint(statement)
+
+        with self._lock:
+            query = self._queries.get(statement_fingerprint)
+
+            if query is None:
+                query = self._queries[statement_fingerprint] = SlowQuery(
+                    statement_fingerprint, statement)
+
+            query.origins[origin] += 1
+            query.count += 1
+            query.total_duration += duration
+            query.max_duration = max(query.max_duration, duration)
+            query.parameters = parameters
+
+        return query
+
+    def queries(self) -> List[SlowQuery]:
+        """
+        Retrieves the aggregates of every slow statement.
+
+        Returns:
+            List[SlowQuery]: The aggregates, by decreasing total time.
+        """
+
+        with self._lock:
+            queries = list(self._queries.values())
+
+        return sorted(queries, key=lambda query: query.total_duration, reverse=True)
+
+    def clear(self) -> None:
+        """
+        Removes every aggregate.
+        """
+
+        with self._lock:
+            self._queries.clear()
+
+
+slow_queries = SlowQueryLog()
+
+
+class QueryProfiler():
+    """
+    Cursor execution listeners recording the statements slower than a threshold.
+
+    Attributes:
+        threshold (float): The threshold, in seconds.
+        log (SlowQueryLog): The aggregates the slow statements are recorded in.
+    """
+
+    def __init__(self, threshold: float, log: SlowQueryLog) -> None:
+        self.threshold = threshold
+        self.log = log
+
+    def before_cursor_execute(self, conn: Connection, *_args) -> None:
+        """
+        Records the start of the statement on its connection.
+        """
+
+        conn.info['profiler_started'] = time.perf_counter()
+
+    def after_cursor_execute(self, conn: Connection, _cursor, statement: str,
+                             parameters: Any, _context, executemany: bool) -> None:
+        """
+        Records the statement if it ran longer than the threshold, explaining
+        it on its first slow execution with a single parameters set.
+        """
+
+        duration = time.perf_counter() - conn.info['profiler_started']
+
+        if duration < self.threshold:
+            return
+
+        normalized = normalize_sql(statement)
+        origin = statement_origin()
+        # An executemany is fingerprinted by its first parameters set, bulk inserts hold thousands.
+        parameters_fingerprint = fingerprint(repr(parameters[0] if executemany else parameters))
+        query = self.log.record(normalized, origin, duration, parameters_fingerprint)
+
+        if query.plan is None and not executemany:
+            query.plan = explain(conn, statement, parameters)
+
+        logger.warning('Slow query %s took %.1f ms in %s (parameters %s): %s%s',
+                       query.fingerprint, duration * 1000, origin, parameters_fingerprint,
+                       normalized, ''.join(f'\n    {line}' for line in query.plan or []))
+
+    def attach(self, engine: Engine) -> None:
+        """
+        Profiles the statements run by an engine.
+
+        Args:
+            engine (Engine): The engine.
+        """
+
+        event.listen(engine, 'before_cursor_execute', self.before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', self.after_cursor_execute)
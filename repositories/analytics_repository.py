@@ -0,0 +1,125 @@
+"""
+Repository module for the analytics rollups queries.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from datetime import date
+from sqlalchemy import Row, Table, func
+from sqlalchemy.dialects import postgresql, sqlite
+from database.db_setup import db
+from database.models.employee_day_rollup import EmployeeDayRollup
+from database.models.service_day_rollup import ServiceDayRollup
+
+# Inserts supporting ON CONFLICT DO UPDATE, by dialect.
+_UPSERTS: Dict[str, Callable[[Table], Any]] = {
+    'sqlite': sqlite.insert,
+    'postgresql': postgresql.insert,
+}
+
+
+def _add_to(table: Table, keys: Sequence[str], rows: List[Dict[str, Any]]) -> None:
+    """
+    Adds the counters of the given rows to the rows of a rollup table, with a
+    single executemany upsert, inserting the missing rows.
+
+    The counters are incremented by the database, so concurrent bookings of
+    the same day never overwrite each other's totals.
+    """
+
+    if not rows:
+        return
+
+    upsert = _UPSERTS[db.session.connection().dialect.name](table)
+    counters = [column.name for column in table.columns if column.name not in keys]
+
+    db.session.execute(upsert.on_conflict_do_update(
+        index_elements=list(keys),
+        set_={name: table.c[name] + upsert.excluded[name] for name in counters}
+    ), rows)
+
+
+def add_to_rollups(employees_rows: List[Dict[str, Any]],
+                   services_rows: List[Dict[str, Any]]) -> None:
+    """
+    Adds the totals of new appointments to the employees and services daily rollups.
+
+    The caller owns the transaction, which must be the one inserting the
+    appointments, and should sort the rows by key so concurrent transactions
+    lock the rollup rows in the same order.
+
+    Args:
+        employees_rows (List[Dict[str, Any]]): The 'day', 'employee_id', 'bookings',
+            'revenue' and 'booked_minutes' to add.
+        services_rows (List[Dict[str, Any]]): The 'day', 'service_id', 'bookings'
+            and 'revenue' to add.
+    """
+
+    _add_to(EmployeeDayRollup.__table__, ('day', 'employee_id'), employees_rows)
+    _add_to(ServiceDayRollup.__table__, ('day', 'service_id'), services_rows)
+
+
+def get_days_rollup(start: date, end: date, employee_id: Optional[int] = None) -> List[Row]:
+    """
+    Retrieves the daily totals of one or every employee over a range of days.
+
+    Args:
+        start (date): The first day of the range.
+        end (date): The last day of the range, included.
+        employee_id (Optional[int]): Restricts the totals to this employee.
+
+    Returns:
+        List[Row]: Rows of (day, bookings, revenue, booked_minutes) of the days
+        with appointments, ordered by day.
+    """
+
+    query = db.session.query(
+        EmployeeDayRollup.day, func.sum(EmployeeDayRollup.bookings),
+        func.sum(EmployeeDayRollup.revenue), func.sum(EmployeeDayRollup.booked_minutes)
+    ).filter(EmployeeDayRollup.day.between(start, end))
+
+    if employee_id is not None:
+        query = query.filter(EmployeeDayRollup.employee_id == employee_id)
+
+    return query.group_by(EmployeeDayRollup.day).order_by(EmployeeDayRollup.day).all()
+
+
+def get_employees_rollup(start: date, end: date) -> List[Row]:
+    """
+    Retrieves the totals of every employee over a range of days.
+
+    Args:
+        start (date): The first day of the range.
+        end (date): The last day of the range, included.
+
+    Returns:
+        List[Row]: Rows of (employee_id, bookings, revenue, booked_minutes) of
+        the employees with appointments, ordered by employee.
+    """
+
+    return db.session.query(
+        EmployeeDayRollup.employee_id, func.sum(EmployeeDayRollup.bookings),
+        func.sum(EmployeeDayRollup.revenue), func.sum(EmployeeDayRollup.booked_minutes)
+    ).filter(
+        EmployeeDayRollup.day.between(start, end)
+    ).group_by(EmployeeDayRollup.employee_id).order_by(EmployeeDayRollup.employee_id).all()
+
+
+def get_services_rollup(start: date, end: date) -> List[Row]:
+    """
+    Retrieves the totals of every service over a range of days.
+
+    Args:
+        start (date): The first day of the range.
+        end (date): The last day of the range, included.
+
+    Returns:
+        List[Row]: Rows of (service_id, bookings, revenue) of the booked
+        services, ordered by service.
+    """
+
+    return db.session.query(
+        ServiceDayRollup.service_id, func.sum(ServiceDayRollup.bookings),
+        func.sum(ServiceDayRollup.revenue)
+    ).filter(
+        ServiceDayRollup.day.between(start, end)
+    ).group_by(ServiceDayRollup.service_id).order_by(ServiceDayRollup.service_id).all()
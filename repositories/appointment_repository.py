@@ -2,21 +2,96 @@
 Repository module for Appointment queries.
 """
 
-from typing import List, Optional
-from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from datetime import datetime, timedelta
+from sqlalchemy import ColumnElement, Row, and_, exists, insert, literal, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from database.db_setup import db
 from database.models.appointment import Appointment
+from database.models.service_appointment import service_appointment
+from repositories.pagination import (
+    DEFAULT_PAGE_SIZE, EXPORT_CHUNK_SIZE, paginate, paginate_async)
+from repositories.projections import AppointmentRecord, to_records
 
 
-def get_all_appointments() -> List[Appointment]:
+def _listing_columns() -> Tuple[Any, ...]:
     """
-    Retrieves all registered appointments.
+    Lists the columns of a projected appointment listing, in AppointmentRecord order.
+    """
+
+    return (Appointment.id, Appointment.date, Appointment.end_date,
+            Appointment.customer_id, Appointment.employee_id)
+
+
+def get_all_appointments(limit: int = DEFAULT_PAGE_SIZE,
+                         after: Optional[Tuple[datetime, int]] = None, projected: bool = False
+                         ) -> Tuple[List[Union[Appointment, AppointmentRecord]], Optional[str]]:
+    """
+    Retrieves a page of registered appointments, ordered by date.
+
+    Args:
+        limit (int): The maximum number of appointments to return.
+        after (Optional[Tuple[datetime, int]]): The (date, id) key of the last
+            appointment of the previous page.
+        projected (bool): Whether to return records of the listed columns
+            instead of ORM instances.
+
+    Returns:
+        Tuple[List[Union[Appointment, AppointmentRecord]], Optional[str]]: A list of
+        registered appointments and the cursor for the next page, or None if this
+        is the last page.
+    """
+
+    keys = (Appointment.date, Appointment.id)
+
+    if not projected:
+        return paginate(db.session.query(Appointment), keys, limit, after)
+
+    rows, next_cursor = paginate(db.session.query(*_listing_columns()), keys, limit, after)
+
+    return to_records(AppointmentRecord, rows), next_cursor
+
+
+async def get_all_appointments_async(session: AsyncSession, limit: int = DEFAULT_PAGE_SIZE,
+                                     after: Optional[Tuple[datetime, int]] = None
+                                     ) -> Tuple[List[AppointmentRecord], Optional[str]]:
+    """
+    Retrieves a page of registered appointments, ordered by date, as projected records,
+    with an async session.
+
+    Args:
+        session (AsyncSession): The async session.
+        limit (int): The maximum number of appointments to return.
+        after (Optional[Tuple[datetime, int]]): The (date, id) key of the last
+            appointment of the previous page.
+
+    Returns:
+        Tuple[List[AppointmentRecord], Optional[str]]: A list of registered appointments
+        and the cursor for the next page, or None if this is the last page.
+    """
+
+    rows, next_cursor = await paginate_async(
+        session, select(*_listing_columns()), (Appointment.date, Appointment.id), limit, after)
+
+    return to_records(AppointmentRecord, rows), next_cursor
+
+
+def iter_all_appointments(chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[Appointment]:
+    """
+    Iterates over every registered appointment, ordered by date.
+
+    Rows are fetched from a server-side cursor in chunks, so only one chunk
+    is held in memory at a time.
+
+    Args:
+        chunk_size (int): The number of appointments fetched per round-trip.
 
     Returns:
-        List[Appointment]: A list of registered appointments.
+        Iterator[Appointment]: An iterator over the registered appointments.
     """
 
-    return db.session.query(Appointment).all()
+    return iter(db.session.query(Appointment).order_by(
+        Appointment.date, Appointment.id).yield_per(chunk_size))
 
 
 def get_appointments_count() -> int:
@@ -44,37 +119,168 @@ def get_appointment(appointment_id: int) -> Optional[Appointment]:
     return db.session.query(Appointment).filter_by(id=appointment_id).first()
 
 
-def get_customer_appointment(date: datetime, customer_id: int) -> Optional[Appointment]:
+def overlapping_appointments(date: datetime, end_date: datetime,
+                             max_duration: timedelta) -> ColumnElement[bool]:
     """
-    Retrieves a customer appointment by date.
+    Builds the filter matching appointments that overlap the given interval.
+
+    Overlapping appointments start before the interval ends and end after it
+    starts. Since no appointment lasts longer than max_duration, they also
+    start after date - max_duration, which bounds the scan of the date index
+    to a small range instead of the whole appointment history.
 
     Args:
-        date (datetime): The appointment date.
-        customer_id (int): The customer's ID.
+        date (datetime): The interval start.
+        end_date (datetime): The interval end.
+        max_duration (timedelta): The longest possible appointment.
 
     Returns:
-         Optional[Appointment]: The appointment found or None.
+        ColumnElement[bool]: The overlap filter.
     """
 
-    return db.session.query(Appointment).filter(
-        Appointment.customer_id == customer_id,
-        Appointment.date == date
-    ).first()
+    return and_(
+        Appointment.date > date - max_duration,
+        Appointment.date < end_date,
+        Appointment.end_date > date
+    )
 
 
-def get_employee_appointment(date: datetime, employee_id: int) -> Optional[Appointment]:
+def insert_appointment_if_available(date: datetime, end_date: datetime,
+                                    max_duration: timedelta, customer_id: int,
+                                    employee_id: int, services_ids: List[int]) -> Optional[int]:
     """
-    Retrieves an employee appointment by date.
+    Inserts an appointment unless it overlaps an appointment of the customer or the employee.
+
+    The availability check and the insert are a single INSERT ... SELECT ... WHERE
+    NOT EXISTS statement. That alone is race-free on SQLite only, which runs one
+    write transaction at a time. On PostgreSQL, under READ COMMITTED, concurrent
+    statements do not see each other's uncommitted rows, so two overlapping
+    bookings could both pass the check: the second one is rejected by the
+    exclusion constraints on the (employee_id, period) and (customer_id, period)
+    pairs instead, raising an IntegrityError. Two bookings starting at the same
+    date are also rejected by the unique (employee_id, date) and (customer_id,
+    date) indexes, on every database. The caller owns the transaction.
 
     Args:
         date (datetime): The appointment date.
+        end_date (datetime): The date when the appointment ends.
+        max_duration (timedelta): The longest possible appointment.
+        customer_id (int): The customer's ID.
         employee_id (int): The employee's ID.
+        services_ids (List[int]): The appointment's services ID's.
 
     Returns:
-         Optional[Appointment]: The appointment found or None.
+        Optional[int]: The created appointment ID, or None if the date is unavailable.
+    """
+
+    is_date_booked = exists().where(
+        overlapping_appointments(date, end_date, max_duration),
+        or_(Appointment.customer_id == customer_id,
+            Appointment.employee_id == employee_id)
+    )
+    values = select(
+        literal(date, Appointment.date.type),
+        literal(end_date, Appointment.end_date.type),
+        literal(employee_id),
+        literal(customer_id)
+    ).where(~is_date_booked)
+
+    appointment_id = db.session.execute(
+        insert(Appointment).from_select(
+            ['date', 'end_date', 'employee_id', 'customer_id'], values
+        ).returning(Appointment.id)
+    ).scalar()
+
+    if appointment_id is not None:
+        db.session.execute(insert(service_appointment), [
+            {'service_id': service_id, 'appointment_id': appointment_id}
+            for service_id in set(services_ids)
+        ])
+
+    return appointment_id
+
+
+def get_employees_appointments_intervals(date: datetime, end_date: datetime,
+                                         max_duration: timedelta,
+                                         employees_ids: List[int]) -> List[Row]:
+    """
+    Retrieves, in a single query, the intervals of the given employees
+    appointments that overlap the given period.
+
+    Args:
+        date (datetime): The period start.
+        end_date (datetime): The period end.
+        max_duration (timedelta): The longest possible appointment.
+        employees_ids (List[int]): The employees ID's.
+
+    Returns:
+        List[Row]: Rows of (employee_id, date, end_date).
     """
 
-    return db.session.query(Appointment).filter(
-        Appointment.employee_id == employee_id,
-        Appointment.date == date
-    ).first()
+    return db.session.query(
+        Appointment.employee_id, Appointment.date, Appointment.end_date
+    ).filter(
+        Appointment.employee_id.in_(employees_ids),
+        overlapping_appointments(date, end_date, max_duration)
+    ).all()
+
+
+def get_appointments_intervals(date: datetime, end_date: datetime, max_duration: timedelta,
+                               employees_ids: List[int], customers_ids: List[int]) -> List[Row]:
+    """
+    Retrieves, in a single query, the intervals of the given employees and
+    customers appointments that overlap the given period.
+
+    Args:
+        date (datetime): The period start.
+        end_date (datetime): The period end.
+        max_duration (timedelta): The longest possible appointment.
+        employees_ids (List[int]): The employees ID's.
+        customers_ids (List[int]): The customers ID's.
+
+    Returns:
+        List[Row]: Rows of (employee_id, customer_id, date, end_date).
+    """
+
+    return db.session.query(
+        Appointment.employee_id, Appointment.customer_id, Appointment.date, Appointment.end_date
+    ).filter(
+        or_(Appointment.employee_id.in_(set(employees_ids)),
+            Appointment.customer_id.in_(set(customers_ids))),
+        overlapping_appointments(date, end_date, max_duration)
+    ).all()
+
+
+def insert_appointments(appointments: List[Dict[str, Any]]) -> List[int]:
+    """
+    Inserts appointments and links them to their services, with one executemany
+    statement per table.
+
+    The availability is not checked here: the caller must have checked the
+    appointments against each other and against the booked ones, in the same
+    transaction. The caller owns the transaction.
+
+    Args:
+        appointments (List[Dict[str, Any]]): The appointments 'date', 'end_date',
+            'employee_id', 'customer_id' and 'services_ids'.
+
+    Returns:
+        List[int]: The created appointments ID's, in the given order.
+    """
+
+    if not appointments:
+        return []
+
+    appointments_ids = list(db.session.scalars(
+        insert(Appointment.__table__).returning(Appointment.id, sort_by_parameter_order=True),
+        [{'date': appointment['date'], 'end_date': appointment['end_date'],
+          'employee_id': appointment['employee_id'], 'customer_id': appointment['customer_id']}
+         for appointment in appointments]))
+
+    db.session.execute(insert(service_appointment), [
+        {'service_id': service_id, 'appointment_id': appointment_id}
+        for appointment_id, appointment in zip(appointments_ids, appointments)
+        for service_id in set(appointment['services_ids'])
+    ])
+
+    return appointments_ids
@@ -0,0 +1,305 @@
+"""
+Cache module for repository lookups.
+
+Results are kept in a bounded in-process LRU tier and, when CACHE_REDIS_URL is
+set, in a Redis tier shared by every app process. Values must be JSON
+serializable, since they are stored as JSON in Redis.
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple
+from database.config import CACHE_MAX_ENTRIES, CACHE_TTL, CACHE_REDIS_URL
+
+CACHE_KEY_PREFIX = 'cache:'
+
+
+class LRUCache():
+    """
+    Thread-safe in-process cache, evicting the least recently used entry
+    when full and any entry older than its time to live.
+    """
+
+    def __init__(self, max_entries: int, ttl: float) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Retrieves a cached value.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[Any]: The cached value, or None if it is missing or expired.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Caches a value, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The value to cache.
+        """
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """
+        Removes a cached value.
+
+        Args:
+            key (str): The cache key.
+        """
+
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Removes every cached value.
+        """
+
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisCache():
+    """
+    Cache stored in a Redis server, or any client implementing the
+    get, set and delete commands of the Redis protocol.
+    """
+
+    def __init__(self, client: Any, ttl: float) -> None:
+        self.client = client
+        self.ttl = ttl
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Retrieves a cached value.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[Any]: The cached value, or None if it is missing or expired.
+        """
+
+        value = self.client.get(CACHE_KEY_PREFIX + key)
+
+        return None if value is None else json.loads(value)
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Caches a value, expiring after the time to live.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The value to cache.
+        """
+
+        self.client.set(CACHE_KEY_PREFIX + key, json.dumps(value), ex=int(self.ttl))
+
+    def delete(self, key: str) -> None:
+        """
+        Removes a cached value.
+
+        Args:
+            key (str): The cache key.
+        """
+
+        self.client.delete(CACHE_KEY_PREFIX + key)
+
+
+class TieredCache():
+    """
+    Two-tier cache: a local LRU tier in front of an optional shared tier.
+
+    The shared tier is best effort: when it fails, lookups fall back to the
+    database and the failure is counted.
+
+    Attributes:
+        local (LRUCache): The in-process tier.
+        shared (Optional[RedisCache]): The tier shared by every process.
+    """
+
+    def __init__(self, local: LRUCache, shared: Optional[RedisCache] = None) -> None:
+        self.local = local
+        self.shared = shared
+        self._counters = {'local_hits': 0, 'shared_hits': 0, 'misses': 0, 'shared_errors': 0}
+        self._lock = threading.Lock()
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Retrieves a cached value from the first tier holding it.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[Any]: The cached value, or None on a miss.
+        """
+
+        value = self.local.get(key)
+
+        if value is not None:
+            self._count('local_hits')
+            return value
+
+        if self.shared is not None:
+            try:
+                value = self.shared.get(key)
+            except Exception:  # pylint: disable=broad-except
+                self._count('shared_errors')
+
+            if value is not None:
+                self._count('shared_hits')
+                self.local.set(key, value)
+                return value
+
+        self._count('misses')
+
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Caches a value in every tier.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The value to cache.
+        """
+
+        self.local.set(key, value)
+
+        if self.shared is not None:
+            try:
+                self.shared.set(key, value)
+            except Exception:  # pylint: disable=broad-except
+                self._count('shared_errors')
+
+    def delete(self, key: str) -> None:
+        """
+        Removes a cached value from every tier.
+
+        Args:
+            key (str): The cache key.
+        """
+
+        self.local.delete(key)
+
+        if self.shared is not None:
+            try:
+                self.shared.delete(key)
+            except Exception:  # pylint: disable=broad-except
+                self._count('shared_errors')
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Retrieves the cache counters.
+
+        Returns:
+            Dict[str, int]: The number of hits per tier, misses and shared tier errors.
+        """
+
+        with self._lock:
+            return dict(self._counters)
+
+
+def _build_shared_tier() -> Optional[RedisCache]:
+    """
+    Connects the shared tier when CACHE_REDIS_URL is set.
+
+    Returns:
+        Optional[RedisCache]: The shared tier, or None if it is not configured.
+    """
+
+    if not CACHE_REDIS_URL:
+        return None
+
+    try:
+        import redis  # pylint: disable=import-outside-toplevel
+    except ImportError as error:
+        raise ImportError('CACHE_REDIS_URL is set but the redis package is not '
+                          'installed. Install it with `pip install redis`.') from error
+
+    return RedisCache(redis.Redis.from_url(CACHE_REDIS_URL), CACHE_TTL)
+
+
+cache = TieredCache(LRUCache(CACHE_MAX_ENTRIES, CACHE_TTL), _build_shared_tier())
+
+
+def cached(namespace: str) -> Callable:
+    """
+    Caches the results of a repository function, keyed by its positional arguments.
+
+    Only found results are cached: a missing row may be created by another
+    process at any time, while a found row stays valid until it is written,
+    and writes invalidate it with the `invalidate` attribute of the decorated
+    function, called with the same arguments.
+
+    Since misses are not cached, invalidating the key of a newly created row
+    usually evicts nothing. It still matters when a row was deleted outside
+    the app after being cached, as SQLite gives its ID to the next row
+    inserted, or when a cached email belonged to such a row.
+
+    Args:
+        namespace (str): The cache key prefix of the function.
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    def key(args: Tuple) -> str:
+        return f'{namespace}:{json.dumps(args)}'
+
+    def decorator(function: Callable) -> Callable:
+        @wraps(function)
+        def wrapper(*args):
+            value = cache.get(key(args))
+
+            if value is None:
+                value = function(*args)
+
+                if value:
+                    cache.set(key(args), value)
+
+            return value
+
+        wrapper.invalidate = lambda *args: cache.delete(key(args))
+
+        return wrapper
+
+    return decorator
@@ -2,25 +2,33 @@
 Repository module for Customer queries.
 """
 
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from database.models.customer import Customer
 from database.db_setup import db
+from repositories.cache import cached
+from repositories.pagination import DEFAULT_PAGE_SIZE, EXPORT_CHUNK_SIZE, paginate, paginate_async
+from repositories.projections import CustomerRecord, to_records
 
 
-def get_customer(customer_id: int) -> Optional[Customer]:
+@cached('customer_exists')
+def customer_exists(customer_id: int) -> bool:
     """
-    Retrieves a customer by its ID.
+    Checks if a customer is registered.
 
     Args:
         customer_id (int): The customer's ID.
 
     Returns:
-        Customer: The customer found or None.
+        bool: True if the customer exists, False otherwise.
     """
 
-    return db.session.query(Customer).filter_by(id=customer_id).first()
+    return db.session.query(
+        db.session.query(Customer).filter_by(id=customer_id).exists()).scalar()
 
 
+@cached('customer_email')
 def search_customer_email(email: str) -> Optional[str]:
     """
     Retrieves a customer email.
@@ -32,15 +40,129 @@ def search_customer_email(email: str) -> Optional[str]:
         str: The email found or None.
     """
 
-    return db.session.query(Customer.email).filter_by(email=email).first()
+    return db.session.query(Customer.email).filter_by(email=email).scalar()
 
 
-def get_all_customers() -> List[Customer]:
+def search_customers_emails(emails: List[str]) -> Set[str]:
     """
-    Retrieves all registered customers.
+    Retrieves, in a single query, which of the given emails are registered.
+
+    Args:
+        emails (List[str]): The customers emails to search.
+
+    Returns:
+        Set[str]: The registered emails.
+    """
+
+    return {email for email, in db.session.query(Customer.email).filter(
+        Customer.email.in_(set(emails)))}
+
+
+def get_customers_ids(customers_ids: List[int]) -> Set[int]:
+    """
+    Retrieves, in a single query, which of the given customers ID's are registered.
+
+    Args:
+        customers_ids (List[int]): The customers ID's to search.
+
+    Returns:
+        Set[int]: The registered ID's.
+    """
+
+    return {customer_id for customer_id, in db.session.query(Customer.id).filter(
+        Customer.id.in_(set(customers_ids)))}
+
+
+def insert_customers(customers: List[Dict[str, str]]) -> List[int]:
+    """
+    Inserts customers with a single executemany statement.
+
+    The caller owns the transaction.
+
+    Args:
+        customers (List[Dict[str, str]]): The customers 'name' and 'email'.
+
+    Returns:
+        List[int]: The created customers ID's, in the given order.
+    """
+
+    if not customers:
+        return []
+
+    return list(db.session.scalars(
+        insert(Customer).returning(Customer.id, sort_by_parameter_order=True),
+        [{'name': customer['name'], 'email': customer['email']} for customer in customers]))
+
+
+def _listing_columns() -> Tuple[Any, ...]:
+    """
+    Lists the columns of a projected customer listing, in CustomerRecord order.
+    """
+
+    return (Customer.id, Customer.name, Customer.email)
+
+
+def get_all_customers(limit: int = DEFAULT_PAGE_SIZE,
+                      after: Optional[Tuple[int]] = None, projected: bool = False
+                      ) -> Tuple[List[Union[Customer, CustomerRecord]], Optional[str]]:
+    """
+    Retrieves a page of registered customers, ordered by ID.
+
+    Args:
+        limit (int): The maximum number of customers to return.
+        after (Optional[Tuple[int]]): The ID key of the last customer of the previous page.
+        projected (bool): Whether to return records of the listed columns
+            instead of ORM instances.
+
+    Returns:
+        Tuple[List[Union[Customer, CustomerRecord]], Optional[str]]: A list of registered
+        customers and the cursor for the next page, or None if this is the last page.
+    """
+
+    if not projected:
+        return paginate(db.session.query(Customer), (Customer.id,), limit, after)
+
+    rows, next_cursor = paginate(
+        db.session.query(*_listing_columns()), (Customer.id,), limit, after)
+
+    return to_records(CustomerRecord, rows), next_cursor
+
+
+async def get_all_customers_async(session: AsyncSession, limit: int = DEFAULT_PAGE_SIZE,
+                                  after: Optional[Tuple[int]] = None
+                                  ) -> Tuple[List[CustomerRecord], Optional[str]]:
+    """
+    Retrieves a page of registered customers, ordered by ID, as projected records,
+    with an async session.
+
+    Args:
+        session (AsyncSession): The async session.
+        limit (int): The maximum number of customers to return.
+        after (Optional[Tuple[int]]): The key of the last customer of the previous page.
+
+    Returns:
+        Tuple[List[CustomerRecord], Optional[str]]: A list of registered customers
+        and the cursor for the next page, or None if this is the last page.
+    """
+
+    rows, next_cursor = await paginate_async(
+        session, select(*_listing_columns()), (Customer.id,), limit, after)
+
+    return to_records(CustomerRecord, rows), next_cursor
+
+
+def iter_all_customers(chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[Customer]:
+    """
+    Iterates over every registered customer, ordered by ID.
+
+    Rows are fetched from a server-side cursor in chunks, so only one chunk
+    is held in memory at a time.
+
+    Args:
+        chunk_size (int): The number of customers fetched per round-trip.
 
     Returns:
-        List[Customer]: A list of registered customers.
+        Iterator[Customer]: An iterator over the registered customers.
     """
 
-    return db.session.query(Customer).all()
+    return iter(db.session.query(Customer).order_by(Customer.id).yield_per(chunk_size))
@@ -2,25 +2,36 @@
 Repository module for Employee queries.
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from database.models.employee import Employee
+from database.models.service import Service
+from database.models.service_employee import service_employee
 from database.db_setup import db
+from repositories.cache import cached
+from repositories.pagination import DEFAULT_PAGE_SIZE, paginate, paginate_async
+from repositories.projections import EmployeeRecord, related_ids, to_records
 
 
-def get_employee(employee_id: int) -> Optional[Employee]:
+@cached('employee_exists')
+def employee_exists(employee_id: int) -> bool:
     """
-    Retrieves an employee by its ID.
+    Checks if an employee is registered.
 
     Args:
-        employee_id (int): The employee id to search.
+        employee_id (int): The employee's ID.
 
     Returns:
-        Employee: The employee found or None.
+        bool: True if the employee exists, False otherwise.
     """
 
-    return db.session.query(Employee).filter_by(id=employee_id).first()
+    return db.session.query(
+        db.session.query(Employee).filter_by(id=employee_id).exists()).scalar()
 
 
+@cached('employee_email')
 def search_employee_email(email: str) -> Optional[str]:
     """
     Retrieves an employee email.
@@ -32,15 +43,181 @@ def search_employee_email(email: str) -> Optional[str]:
         str: The email found or None.
     """
 
-    return db.session.query(Employee.email).filter_by(email=email).first()
+    return db.session.query(Employee.email).filter_by(email=email).scalar()
 
 
-def get_all_employees() -> List[Employee]:
+def search_employees_emails(emails: List[str]) -> Set[str]:
     """
-    Retrieves all registered employees.
+    Retrieves, in a single query, which of the given emails are registered.
+
+    Args:
+        emails (List[str]): The employees emails to search.
+
+    Returns:
+        Set[str]: The registered emails.
+    """
+
+    return {email for email, in db.session.query(Employee.email).filter(
+        Employee.email.in_(set(emails)))}
+
+
+def get_employees_ids(employees_ids: List[int]) -> Set[int]:
+    """
+    Retrieves, in a single query, which of the given employees ID's are registered.
+
+    Args:
+        employees_ids (List[int]): The employees ID's to search.
+
+    Returns:
+        Set[int]: The registered ID's.
+    """
+
+    return {employee_id for employee_id, in db.session.query(Employee.id).filter(
+        Employee.id.in_(set(employees_ids)))}
+
+
+def get_employees_count() -> int:
+    """
+    Retrieves the number of registered employees.
 
     Returns:
-        List[Employee]: A list of registered employees.
+        int: The total number of employees.
+    """
+
+    return db.session.query(func.count(Employee.id)).scalar()
+
+
+def insert_employees(employees: List[Dict[str, Any]]) -> List[int]:
+    """
+    Inserts employees and links them to their services, with one executemany
+    statement per table.
+
+    The caller owns the transaction.
+
+    Args:
+        employees (List[Dict[str, Any]]): The employees 'name', 'email' and 'services' ID's.
+
+    Returns:
+        List[int]: The created employees ID's, in the given order.
+    """
+
+    if not employees:
+        return []
+
+    employees_ids = list(db.session.scalars(
+        insert(Employee).returning(Employee.id, sort_by_parameter_order=True),
+        [{'name': employee['name'], 'email': employee['email']} for employee in employees]))
+
+    db.session.execute(insert(service_employee), [
+        {'service_id': service_id, 'employee_id': employee_id}
+        for employee_id, employee in zip(employees_ids, employees)
+        for service_id in dict.fromkeys(employee['services'])
+    ])
+
+    return employees_ids
+
+
+def _listing_columns() -> Tuple[Any, ...]:
+    """
+    Lists the columns of a projected employee listing, in EmployeeRecord order.
+    """
+
+    return (Employee.id, Employee.name, Employee.email,
+            related_ids(service_employee, 'employee_id', 'service_id', Employee.id))
+
+
+def get_all_employees(limit: int = DEFAULT_PAGE_SIZE,
+                      after: Optional[Tuple[int]] = None, projected: bool = False
+                      ) -> Tuple[List[Union[Employee, EmployeeRecord]], Optional[str]]:
+    """
+    Retrieves a page of registered employees, ordered by ID.
+
+    The services of the whole page are batch loaded with one extra query,
+    fetching only their IDs, instead of one lazy load per employee. When
+    projected, their IDs are aggregated in the page query itself.
+
+    Args:
+        limit (int): The maximum number of employees to return.
+        after (Optional[Tuple[int]]): The ID key of the last employee of the previous page.
+        projected (bool): Whether to return records of the listed columns
+            instead of ORM instances.
+
+    Returns:
+        Tuple[List[Union[Employee, EmployeeRecord]], Optional[str]]: A list of registered
+        employees and the cursor for the next page, or None if this is the last page.
+    """
+
+    if not projected:
+        query = db.session.query(Employee).options(
+            selectinload(Employee.services).load_only(Service.id))
+
+        return paginate(query, (Employee.id,), limit, after)
+
+    rows, next_cursor = paginate(
+        db.session.query(*_listing_columns()), (Employee.id,), limit, after)
+
+    return to_records(EmployeeRecord, rows, ids_columns=1), next_cursor
+
+
+async def get_all_employees_async(session: AsyncSession, limit: int = DEFAULT_PAGE_SIZE,
+                                  after: Optional[Tuple[int]] = None
+                                  ) -> Tuple[List[EmployeeRecord], Optional[str]]:
+    """
+    Retrieves a page of registered employees, ordered by ID, as projected records,
+    with an async session.
+
+    Args:
+        session (AsyncSession): The async session.
+        limit (int): The maximum number of employees to return.
+        after (Optional[Tuple[int]]): The key of the last employee of the previous page.
+
+    Returns:
+        Tuple[List[EmployeeRecord], Optional[str]]: A list of registered employees
+        and the cursor for the next page, or None if this is the last page.
+    """
+
+    rows, next_cursor = await paginate_async(
+        session, select(*_listing_columns()), (Employee.id,), limit, after)
+
+    return to_records(EmployeeRecord, rows, ids_columns=1), next_cursor
+
+
+def get_employees_ids_by_services_ids(services_ids: List[int],
+                                      employee_id: Optional[int] = None) -> List[int]:
+    """
+    Retrieves the ID's of the employees that perform all the given services.
+
+    Args:
+        services_ids (List[int]): The services ID's.
+        employee_id (Optional[int]): Restricts the search to this employee.
+
+    Returns:
+        List[int]: The employees ID's, in ascending order.
+    """
+
+    query = db.session.query(service_employee.c.employee_id).filter(
+        service_employee.c.service_id.in_(services_ids))
+
+    if employee_id is not None:
+        query = query.filter(service_employee.c.employee_id == employee_id)
+
+    return [employee_id for employee_id, in query.group_by(
+        service_employee.c.employee_id
+    ).having(
+        func.count(service_employee.c.service_id) == len(set(services_ids))
+    ).order_by(service_employee.c.employee_id)]
+
+
+def add_employee_services(employee_id: int, services_ids: List[int]) -> None:
+    """
+    Links an employee to the services it performs, by ID's.
+
+    Args:
+        employee_id (int): The employee ID.
+        services_ids (List[int]): The services ID's.
     """
 
-    return db.session.query(Employee).all()
+    db.session.execute(insert(service_employee), [
+        {'service_id': service_id, 'employee_id': employee_id}
+        for service_id in dict.fromkeys(services_ids)
+    ])
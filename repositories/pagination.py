@@ -0,0 +1,154 @@
+"""
+Repository module for keyset (cursor) pagination helpers.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple, Union
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+EXPORT_CHUNK_SIZE = 1000
+# Integer keys are bound as signed 64-bit integers by every supported driver.
+MIN_INT_KEY = -2 ** 63
+MAX_INT_KEY = 2 ** 63 - 1
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encodes the sort key of the last returned row into an opaque cursor.
+
+    Args:
+        values (Sequence[Any]): The sort key values (datetimes and integers).
+
+    Returns:
+        str: The URL-safe cursor.
+    """
+
+    payload = [value.isoformat() if isinstance(value, datetime) else value
+               for value in values]
+
+    return base64.urlsafe_b64encode(
+        json.dumps(payload, separators=(',', ':')).encode()).decode()
+
+
+def decode_cursor(cursor: str, types: Sequence[type]) -> Tuple[Any, ...]:
+    """
+    Decodes an opaque cursor back into a typed sort key.
+
+    Args:
+        cursor (str): The cursor received from the client.
+        types (Sequence[type]): The expected type of each sort key value.
+
+    Returns:
+        Tuple[Any, ...]: The decoded sort key.
+
+    Raises:
+        ValueError: If the cursor is malformed or does not match the expected types.
+    """
+
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (TypeError, UnicodeError, json.JSONDecodeError, binascii.Error) as error:
+        raise ValueError('Invalid cursor.') from error
+
+    if not isinstance(payload, list) or len(payload) != len(types):
+        raise ValueError('Invalid cursor.')
+
+    values = []
+    for value, value_type in zip(payload, types):
+        if value_type is datetime and isinstance(value, str):
+            value = datetime.fromisoformat(value)
+
+            # Stored dates are naive, and do not compare with timezone-aware ones.
+            if value.tzinfo is not None:
+                raise ValueError('Invalid cursor.')
+
+            values.append(value)
+        elif (value_type is int and isinstance(value, int) and not isinstance(value, bool)
+              and MIN_INT_KEY <= value <= MAX_INT_KEY):
+            values.append(value)
+        else:
+            raise ValueError('Invalid cursor.')
+
+    return tuple(values)
+
+
+def _page(query: Union[Query, Select], keys: Sequence[Any], limit: int,
+          after: Optional[Tuple[Any, ...]]) -> Union[Query, Select]:
+    """
+    Restricts a query or a select statement to one page, plus one row telling
+    if there is a next page.
+    """
+
+    if after is not None:
+        query = query.filter(tuple_(*keys) > tuple_(*after))
+
+    return query.order_by(*keys).limit(limit + 1)
+
+
+def _with_cursor(rows: List[Any], keys: Sequence[Any],
+                 limit: int) -> Tuple[List[Any], Optional[str]]:
+    """
+    Drops the extra row of a page and builds the cursor of the next page.
+    """
+
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    last = rows[-1]
+
+    return rows, encode_cursor([getattr(last, key.key) for key in keys])
+
+
+def paginate(query: Query, keys: Sequence[Any], limit: int,
+             after: Optional[Tuple[Any, ...]] = None) -> Tuple[List[Any], Optional[str]]:
+    """
+    Retrieves one page of a query using keyset pagination.
+
+    The query is ordered by the given key columns and filtered to rows strictly
+    after the given key, so every page is a single index range scan regardless
+    of how deep into the table it is.
+
+    Args:
+        query (Query): The base query.
+        keys (Sequence[Any]): The unique, ordered key columns.
+        limit (int): The maximum number of rows to return.
+        after (Optional[Tuple[Any, ...]]): The sort key of the last row of the previous page.
+
+    Returns:
+        Tuple[List[Any], Optional[str]]: The page rows and the cursor for the next page,
+        or None if this is the last page.
+    """
+
+    return _with_cursor(_page(query, keys, limit, after).all(), keys, limit)
+
+
+async def paginate_async(session: AsyncSession, statement: Select, keys: Sequence[Any],
+                         limit: int, after: Optional[Tuple[Any, ...]] = None
+                         ) -> Tuple[List[Any], Optional[str]]:
+    """
+    Retrieves one page of a select statement using keyset pagination, with an
+    async session.
+
+    Args:
+        session (AsyncSession): The async session.
+        statement (Select): The base select statement.
+        keys (Sequence[Any]): The unique, ordered key columns.
+        limit (int): The maximum number of rows to return.
+        after (Optional[Tuple[Any, ...]]): The sort key of the last row of the previous page.
+
+    Returns:
+        Tuple[List[Any], Optional[str]]: The page rows and the cursor for the next page,
+        or None if this is the last page.
+    """
+
+    result = await session.execute(_page(statement, keys, limit, after))
+
+    return _with_cursor(result.all(), keys, limit)
@@ -0,0 +1,174 @@
+"""
+Repository module for column-projected listing queries.
+
+Listings served by the compiled serializer only need the columns their view
+schema emits, so they are read as plain rows and returned as light records
+instead of ORM instances, skipping the identity map and attribute
+instrumentation. The ID's of related rows are aggregated by the database
+into a single column per relationship.
+"""
+
+from datetime import date as Date, datetime
+from typing import Any, List, NamedTuple, Optional, Sequence
+from sqlalchemy import ScalarSelect, String, Table, select
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.functions import FunctionElement
+
+# Separator of the ID's aggregated by group_concat and string_agg.
+_IDS_SEPARATOR = ','
+
+
+class Plucked(list):
+    """
+    List of values already plucked from related rows, such as their ID's.
+
+    The compiled serializer outputs it as is where the view schema
+    declares a list of Pluck fields.
+    """
+
+    __slots__ = ()
+
+
+class group_ids(FunctionElement):  # pylint: disable=invalid-name,too-many-ancestors
+    """
+    Aggregates integer ID's into a comma separated string: group_concat on
+    SQLite and MySQL, string_agg on PostgreSQL.
+    """
+
+    name = 'group_ids'
+    type = String()
+    inherit_cache = True
+
+
+@compiles(group_ids)
+def _compile_group_ids(element: group_ids, compiler: SQLCompiler, **kw) -> str:
+    return f'group_concat({compiler.process(element.clauses, **kw)})'
+
+
+@compiles(group_ids, 'postgresql')
+def _compile_group_ids_postgresql(element: group_ids, compiler: SQLCompiler, **kw) -> str:
+    return (f'string_agg(CAST({compiler.process(element.clauses, **kw)} AS TEXT), '
+            f"'{_IDS_SEPARATOR}')")
+
+
+def related_ids(association: Table, owner_column: str, related_column: str,
+                owner_id: Any) -> ScalarSelect:
+    """
+    Builds the correlated subquery aggregating the ID's related to a row
+    through an association table.
+
+    A subquery per relationship, instead of joins, keeps each listed row
+    single and avoids multiplying the rows of two relationships.
+
+    Args:
+        association (Table): The association table.
+        owner_column (str): The association column referencing the listed row.
+        related_column (str): The association column referencing the related row.
+        owner_id (Any): The ID column of the listed row.
+
+    Returns:
+        ScalarSelect: The subquery, returning the ID's as a string or NULL.
+    """
+
+    return select(group_ids(association.c[related_column])).where(
+        association.c[owner_column] == owner_id).scalar_subquery()
+
+
+def parse_ids(value: Optional[str]) -> Plucked:
+    """
+    Parses the ID's aggregated by `group_ids`, in ascending order.
+
+    Args:
+        value (Optional[str]): The aggregated ID's, or None if there are none.
+
+    Returns:
+        Plucked: The ID's.
+    """
+
+    if not value:
+        return Plucked()
+
+    return Plucked(sorted(map(int, value.split(_IDS_SEPARATOR))))
+
+
+class CustomerRecord(NamedTuple):
+    """
+    Projected customer, as listed by the customer view schema.
+    """
+
+    id: int
+    name: str
+    email: str
+
+
+class EmployeeRecord(NamedTuple):
+    """
+    Projected employee, as listed by the employee view schema.
+    """
+
+    id: int
+    name: str
+    email: str
+    services: Plucked
+
+
+class ServiceRecord(NamedTuple):
+    """
+    Projected service, as listed by the service view schema.
+    """
+
+    id: int
+    name: str
+    price: int
+    duration: int
+    employees: Plucked
+    appointments: Plucked
+
+
+class AppointmentRecord(NamedTuple):
+    """
+    Projected appointment, as listed by the appointment view schema.
+    """
+
+    id: int
+    date: datetime
+    end_date: datetime
+    customer_id: int
+    employee_id: int
+
+
+class ScheduleRecord(NamedTuple):
+    """
+    Projected schedule entry, as listed by the schedule view schema.
+    """
+
+    appointment_id: int
+    employee_id: int
+    day: Date
+    date: datetime
+    end_date: datetime
+    customer_id: int
+    customer_name: str
+    services: List[str]
+    price: int
+
+
+def to_records(record_type: type, rows: Sequence[Any], ids_columns: int = 0) -> List[Any]:
+    """
+    Converts projected rows into records, parsing their trailing aggregated ID's columns.
+
+    Args:
+        record_type (type): The record class, whose fields follow the row's columns.
+        rows (Sequence[Any]): The projected rows.
+        ids_columns (int): The number of trailing `group_ids` columns.
+
+    Returns:
+        List[Any]: The records.
+    """
+
+    if not ids_columns:
+        return [record_type(*row) for row in rows]
+
+    return [record_type(*row[:-ids_columns], *map(parse_ids, row[-ids_columns:]))
+            for row in rows]
@@ -0,0 +1,146 @@
+"""
+Repository module for the compact read models kept in memory.
+
+ORM instances carry their instance state, instrumented attributes and
+relationship collections, which is too heavy for data held across a request
+or a whole process. The read models below only hold the values the services
+catalog and the scheduling checks need, and are built from ORM instances or
+from plain query rows.
+"""
+
+import bisect
+from array import array
+from datetime import datetime, timedelta
+from typing import Iterable, NamedTuple
+from database.models.appointment import Appointment
+from database.models.service import Service
+
+_EPOCH = datetime(1970, 1, 1)
+_SECOND = timedelta(seconds=1)
+
+
+class CatalogEntry(NamedTuple):
+    """
+    Read-only copy of a service, kept in the in-process catalog.
+
+    Attributes:
+        id (int): The service ID.
+        name (str): The service name.
+        price (int): The service price in cents.
+        duration (int): The service duration in minutes.
+    """
+
+    id: int
+    name: str
+    price: int
+    duration: int
+
+    @classmethod
+    def from_model(cls, service: Service) -> 'CatalogEntry':
+        """
+        Copies a service instance into a catalog entry.
+
+        Args:
+            service (Service): The service instance.
+
+        Returns:
+            CatalogEntry: The catalog entry.
+        """
+
+        return cls(service.id, service.name, service.price, service.duration)
+
+
+def _to_seconds(date: datetime) -> int:
+    return (date - _EPOCH) // _SECOND
+
+
+class Schedule():
+    """
+    Booked intervals of one employee or customer, sorted by start date.
+
+    The intervals are stored as arrays of seconds since the epoch, 24 bytes per
+    appointment, instead of a tuple of two datetimes or an Appointment instance
+    per appointment. Intervals may overlap each other, as in legacy or imported
+    data, so the running maximum of the end dates is kept along with them.
+
+    Attributes:
+        starts (array): The intervals start dates.
+        ends (array): The intervals end dates, in the same order.
+        max_ends (array): The latest end date of the intervals up to each one.
+    """
+
+    __slots__ = ('starts', 'ends', 'max_ends')
+
+    def __init__(self) -> None:
+        self.starts = array('q')
+        self.ends = array('q')
+        self.max_ends = array('q')
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    @classmethod
+    def from_appointments(cls, appointments: Iterable[Appointment]) -> 'Schedule':
+        """
+        Builds the schedule of the given appointment instances.
+
+        Args:
+            appointments (Iterable[Appointment]): The appointments.
+
+        Returns:
+            Schedule: The schedule.
+        """
+
+        schedule = cls()
+
+        for appointment in sorted(appointments, key=lambda appointment: appointment.date):
+            end = _to_seconds(appointment.end_date)
+            schedule.starts.append(_to_seconds(appointment.date))
+            schedule.ends.append(end)
+            schedule.max_ends.append(max(schedule.max_ends[-1], end)
+                                     if schedule.max_ends else end)
+
+        return schedule
+
+    def add(self, date: datetime, end_date: datetime) -> None:
+        """
+        Adds an interval, keeping the intervals sorted.
+
+        Args:
+            date (datetime): The interval start.
+            end_date (datetime): The interval end.
+        """
+
+        start = _to_seconds(date)
+        end = _to_seconds(end_date)
+        position = bisect.bisect_right(self.starts, start)
+        self.starts.insert(position, start)
+        self.ends.insert(position, end)
+        self.max_ends.insert(position, max(self.max_ends[position - 1], end)
+                             if position > 0 else end)
+
+        # The running maximum only grows, so the update stops at the first later
+        # interval already ending after the new one.
+        for index in range(position + 1, len(self.max_ends)):
+            if self.max_ends[index] >= end:
+                break
+
+            self.max_ends[index] = end
+
+    def overlaps(self, date: datetime, end_date: datetime) -> bool:
+        """
+        Checks if a period overlaps any interval.
+
+        Args:
+            date (datetime): The period start.
+            end_date (datetime): The period end.
+
+        Returns:
+            bool: True if the period overlaps an interval, False otherwise.
+        """
+
+        start = _to_seconds(date)
+        position = bisect.bisect_left(self.starts, start)
+
+        return ((position > 0 and self.max_ends[position - 1] > start)
+                or (position < len(self.starts) and self.starts[position] < _to_seconds(end_date)))
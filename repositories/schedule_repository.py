@@ -0,0 +1,78 @@
+"""
+Repository module for ScheduleEntry queries.
+"""
+
+from typing import Any, Dict, List, Optional
+from datetime import date
+from sqlalchemy import bindparam, insert, select
+from database.db_setup import db
+from database.models.customer import Customer
+from database.models.schedule_entry import ScheduleEntry
+from repositories.projections import ScheduleRecord, to_records
+
+
+def insert_schedule_entries(entries: List[Dict[str, Any]]) -> None:
+    """
+    Inserts the schedule entries of new appointments, with a single executemany
+    statement.
+
+    The customer name is copied by the insert itself, from an INSERT ... SELECT
+    on the customer primary key, so it costs no extra round-trip. The caller
+    owns the transaction, which must be the one inserting the appointments.
+
+    Args:
+        entries (List[Dict[str, Any]]): The entries 'appointment_id', 'employee_id',
+            'date', 'end_date', 'customer_id', 'services' and 'price'.
+    """
+
+    if not entries:
+        return
+
+    values = select(
+        bindparam('appointment_id', type_=ScheduleEntry.appointment_id.type),
+        bindparam('employee_id', type_=ScheduleEntry.employee_id.type),
+        bindparam('day', type_=ScheduleEntry.day.type),
+        bindparam('date', type_=ScheduleEntry.date.type),
+        bindparam('end_date', type_=ScheduleEntry.end_date.type),
+        Customer.id,
+        Customer.name,
+        bindparam('services', type_=ScheduleEntry.services.type),
+        bindparam('price', type_=ScheduleEntry.price.type)
+    ).where(Customer.id == bindparam('customer_id'))
+
+    db.session.execute(
+        insert(ScheduleEntry.__table__).from_select(
+            ['appointment_id', 'employee_id', 'day', 'date', 'end_date',
+             'customer_id', 'customer_name', 'services', 'price'], values),
+        [{**entry, 'day': entry['date'].date()} for entry in entries])
+
+
+def get_schedule(start: date, end: date,
+                 employee_id: Optional[int] = None) -> List[ScheduleRecord]:
+    """
+    Retrieves the schedule of one or every employee over a range of days.
+
+    The schedule is a single range scan of the (employee_id, day, date) index
+    for one employee, or of the (day, employee_id, date) index for every
+    employee, both already in the listing order.
+
+    Args:
+        start (date): The first day of the range.
+        end (date): The last day of the range, included.
+        employee_id (Optional[int]): Restricts the schedule to this employee.
+
+    Returns:
+        List[ScheduleRecord]: The entries, ordered by day, employee and date.
+    """
+
+    query = db.session.query(
+        ScheduleEntry.appointment_id, ScheduleEntry.employee_id, ScheduleEntry.day,
+        ScheduleEntry.date, ScheduleEntry.end_date, ScheduleEntry.customer_id,
+        ScheduleEntry.customer_name, ScheduleEntry.services, ScheduleEntry.price
+    ).filter(ScheduleEntry.day.between(start, end))
+
+    if employee_id is not None:
+        query = query.filter(ScheduleEntry.employee_id == employee_id)
+
+    return to_records(ScheduleRecord, query.order_by(
+        ScheduleEntry.day, ScheduleEntry.employee_id, ScheduleEntry.date).all())
@@ -2,70 +2,276 @@
 Repository module for Service queries.
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+from flask import g, has_app_context
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from database.models.appointment import Appointment
+from database.models.employee import Employee
 from database.models.service import Service
+from database.models.service_appointment import service_appointment
+from database.models.service_employee import service_employee
 from database.db_setup import db
+from repositories.pagination import DEFAULT_PAGE_SIZE, paginate, paginate_async
+from repositories.projections import ServiceRecord, related_ids, to_records
+from repositories.read_models import CatalogEntry
+from repositories.table_version_repository import get_table_version
 
+SERVICE_TABLE = Service.__tablename__
 
-def get_all_services() -> List[Service]:
+
+class _Catalog(NamedTuple):
+    """
+    Snapshot of the whole service table at a given table version.
+    """
+
+    version: Optional[int]
+    by_id: Dict[int, CatalogEntry]
+    by_name: Dict[str, CatalogEntry]
+
+
+# Replaced as a whole, never mutated, so concurrent readers always see a consistent snapshot.
+_catalog = _Catalog(None, {}, {})
+
+
+def _build_catalog(version: Optional[int], entries: List[CatalogEntry]) -> _Catalog:
+    """
+    Indexes the catalog entries by ID and by name.
+
+    Args:
+        version (Optional[int]): The service table version of the entries.
+        entries (List[CatalogEntry]): Every registered service.
+
+    Returns:
+        _Catalog: The indexed catalog.
+    """
+
+    return _Catalog(version,
+                    {entry.id: entry for entry in entries},
+                    {entry.name: entry for entry in entries})
+
+
+def _get_catalog_version() -> int:
+    """
+    Retrieves the current service table version.
+
+    The version is read once per application context, which is one request
+    for the routes, so every catalog lookup of a request costs at most one
+    primary key query.
+
+    Returns:
+        int: The service table version.
+    """
+
+    if not has_app_context():
+        return get_table_version(SERVICE_TABLE)
+
+    if 'service_catalog_version' not in g:
+        g.service_catalog_version = get_table_version(SERVICE_TABLE)
+
+    return g.service_catalog_version
+
+
+def forget_catalog_version() -> None:
+    """
+    Makes the next catalog lookup of the application context read the
+    service table version again.
+
+    Long-running application contexts, such as CLI commands, call it
+    between units of work to pick up changes made by other processes.
+    """
+
+    if has_app_context():
+        g.pop('service_catalog_version', None)
+
+
+def _get_catalog() -> _Catalog:
     """
-    Retrieves all registered services.
+    Retrieves the service catalog, reloading it if another process changed the table.
 
     Returns:
-        List[Service]: A List of registered services.
+        _Catalog: The current service catalog.
     """
 
-    return db.session.query(Service).all()
+    global _catalog  # pylint: disable=global-statement
 
+    version = _get_catalog_version()
 
-def get_services_by_services_ids(services_ids: List[int]) -> List[Service]:
+    if _catalog.version != version:
+        entries = db.session.query(
+            Service.id, Service.name, Service.price, Service.duration).all()
+        _catalog = _build_catalog(version, [CatalogEntry(*entry) for entry in entries])
+
+    return _catalog
+
+
+def cache_services(services: List[CatalogEntry], version: Optional[int]) -> None:
     """
-    Retrieves all registered services by ID's.
+    Writes newly committed services through to the catalog.
+
+    The services are added in place only when the catalog is exactly one version
+    behind, otherwise another change was missed and the catalog is reloaded on
+    its next read.
+
+    Args:
+        services (List[CatalogEntry]): The committed services.
+        version (Optional[int]): The service table version after the change.
+    """
+
+    global _catalog  # pylint: disable=global-statement
+
+    forget_catalog_version()
+
+    if version is None or _catalog.version != version - 1:
+        _catalog = _Catalog(None, {}, {})
+        return
+
+    _catalog = _build_catalog(version, [*_catalog.by_id.values(), *services])
+
+
+def insert_services(services: List[Dict[str, Any]]) -> List[CatalogEntry]:
+    """
+    Inserts services with a single executemany statement.
+
+    The caller owns the transaction.
+
+    Args:
+        services (List[Dict[str, Any]]): The services 'name', 'price' and 'duration'.
+
+    Returns:
+        List[CatalogEntry]: The created services, in the given order.
+    """
+
+    if not services:
+        return []
+
+    return [CatalogEntry(*row) for row in db.session.execute(
+        insert(Service).returning(Service.id, Service.name, Service.price, Service.duration,
+                                  sort_by_parameter_order=True),
+        [{'name': service['name'], 'price': service['price'], 'duration': service['duration']}
+         for service in services])]
+
+
+def _listing_columns() -> Tuple[Any, ...]:
+    """
+    Lists the columns of a projected service listing, in ServiceRecord order.
+    """
+
+    return (Service.id, Service.name, Service.price, Service.duration,
+            related_ids(service_employee, 'service_id', 'employee_id', Service.id),
+            related_ids(service_appointment, 'service_id', 'appointment_id', Service.id))
+
+
+def get_all_services(limit: int = DEFAULT_PAGE_SIZE,
+                     after: Optional[Tuple[int]] = None, projected: bool = False
+                     ) -> Tuple[List[Union[Service, ServiceRecord]], Optional[str]]:
+    """
+    Retrieves a page of registered services, ordered by ID.
+
+    The employees and appointments of the whole page are batch loaded with
+    one extra query each, fetching only their IDs, instead of one lazy load
+    per service. When projected, their IDs are aggregated in the page query
+    itself.
+
+    Args:
+        limit (int): The maximum number of services to return.
+        after (Optional[Tuple[int]]): The ID key of the last service of the previous page.
+        projected (bool): Whether to return records of the listed columns
+            instead of ORM instances.
+
+    Returns:
+        Tuple[List[Union[Service, ServiceRecord]], Optional[str]]: A List of registered
+        services and the cursor for the next page, or None if this is the last page.
+    """
+
+    if not projected:
+        query = db.session.query(Service).options(
+            selectinload(Service.employees).load_only(Employee.id),
+            selectinload(Service.appointments).load_only(Appointment.id))
+
+        return paginate(query, (Service.id,), limit, after)
+
+    rows, next_cursor = paginate(
+        db.session.query(*_listing_columns()), (Service.id,), limit, after)
+
+    return to_records(ServiceRecord, rows, ids_columns=2), next_cursor
+
+
+async def get_all_services_async(session: AsyncSession, limit: int = DEFAULT_PAGE_SIZE,
+                                 after: Optional[Tuple[int]] = None
+                                 ) -> Tuple[List[ServiceRecord], Optional[str]]:
+    """
+    Retrieves a page of registered services, ordered by ID, as projected records,
+    with an async session.
+
+    Args:
+        session (AsyncSession): The async session.
+        limit (int): The maximum number of services to return.
+        after (Optional[Tuple[int]]): The key of the last service of the previous page.
+
+    Returns:
+        Tuple[List[ServiceRecord], Optional[str]]: A list of registered services
+        and the cursor for the next page, or None if this is the last page.
+    """
+
+    rows, next_cursor = await paginate_async(
+        session, select(*_listing_columns()), (Service.id,), limit, after)
+
+    return to_records(ServiceRecord, rows, ids_columns=2), next_cursor
+
+
+def get_services_by_services_ids(services_ids: List[int]) -> List[CatalogEntry]:
+    """
+    Retrieves all registered services by ID's, from the catalog.
 
     Args:
         services_ids (List[int]): The services ID's to search.
 
     Returns:
-        List[Service]: A List of registered services.
+        List[CatalogEntry]: A List of registered services.
     """
 
-    return db.session.query(Service).filter(Service.id.in_(services_ids)).all()
+    by_id = _get_catalog().by_id
+
+    return [by_id[service_id] for service_id in dict.fromkeys(services_ids)
+            if service_id in by_id]
 
 
 def get_services_count() -> int:
     """
-    Retrieves the number of registered services.
+    Retrieves the number of registered services, from the catalog.
 
     Returns:
         int: The total number of services.
     """
 
-    return db.session.query(Service).count()
+    return len(_get_catalog().by_id)
 
 
-def get_service(service_id: int) -> Optional[Service]:
+def get_service(service_id: int) -> Optional[CatalogEntry]:
     """
-    Retrieves a service by its ID.
+    Retrieves a service by its ID, from the catalog.
 
     Args:
         service_id (int): The service ID.
 
     Returns:
-        Service: The service found or None.
+        CatalogEntry: The service found or None.
     """
 
-    return db.session.query(Service).filter_by(id=service_id).first()
+    return _get_catalog().by_id.get(service_id)
 
 
-def get_service_by_name(name: str) -> Optional[Service]:
+def get_service_by_name(name: str) -> Optional[CatalogEntry]:
     """
-    Retrieves a service by its name.
+    Retrieves a service by its name, from the catalog.
 
     Args:
         name (str): The service name.
 
     Returns:
-        Service: The service found or None.
+        CatalogEntry: The service found or None.
     """
 
-    return db.session.query(Service.name).filter_by(name=name).first()
+    return _get_catalog().by_name.get(name)
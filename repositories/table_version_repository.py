@@ -0,0 +1,91 @@
+"""
+Repository module for TableVersion queries.
+"""
+
+from typing import List, Optional
+from datetime import datetime, timezone
+from sqlalchemy import Row, Select, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.models.table_version import TableVersion
+from database.db_setup import db
+
+VERSIONED_TABLES = ('service', 'employee', 'customer', 'appointment')
+
+
+def get_table_version(table_name: str) -> int:
+    """
+    Retrieves the write version of a table.
+
+    Args:
+        table_name (str): The versioned table name.
+
+    Returns:
+        int: The table version, or 0 if the table was never changed.
+    """
+
+    version = db.session.query(TableVersion.version).filter_by(
+        table_name=table_name).scalar()
+
+    return version or 0
+
+
+def _versions_statement(tables_names: List[str]) -> Select:
+    """
+    Builds the select of the version and last change of several tables.
+    """
+
+    return select(
+        TableVersion.table_name, TableVersion.version, TableVersion.updated_at
+    ).where(TableVersion.table_name.in_(tables_names)).order_by(TableVersion.table_name)
+
+
+def get_table_versions(tables_names: List[str]) -> List[Row]:
+    """
+    Retrieves the write version and last change of several tables, in one query.
+
+    Args:
+        tables_names (List[str]): The versioned tables names.
+
+    Returns:
+        List[Row]: Rows of (table_name, version, updated_at), ordered by table name.
+    """
+
+    return db.session.execute(_versions_statement(tables_names)).all()
+
+
+async def get_table_versions_async(session: AsyncSession, tables_names: List[str]) -> List[Row]:
+    """
+    Retrieves the write version and last change of several tables, in one query,
+    with an async session.
+
+    Args:
+        session (AsyncSession): The async session.
+        tables_names (List[str]): The versioned tables names.
+
+    Returns:
+        List[Row]: Rows of (table_name, version, updated_at), ordered by table name.
+    """
+
+    return (await session.execute(_versions_statement(tables_names))).all()
+
+
+def bump_table_version(table_name: str) -> Optional[int]:
+    """
+    Increments the write version of a table in the current transaction.
+
+    The new version is only visible to other sessions once the caller commits.
+
+    Args:
+        table_name (str): The versioned table name.
+
+    Returns:
+        Optional[int]: The new table version, or None if the table is not versioned.
+    """
+
+    return db.session.execute(
+        update(TableVersion)
+        .where(TableVersion.table_name == table_name)
+        .values(version=TableVersion.version + 1,
+                updated_at=datetime.now(timezone.utc))
+        .returning(TableVersion.version)
+    ).scalar()
@@ -7,6 +7,10 @@ from routes.customer_routes import customer_bp
 from routes.employee_routes import employee_bp
 from routes.service_routes import service_bp
 from routes.appointment_routes import appointment_bp
+from routes.availability_routes import availability_bp
+from routes.schedule_routes import schedule_bp
+from routes.analytics_routes import analytics_bp
+from routes.metrics_routes import metrics_bp
 
 
 def register_routes(api: Api):
@@ -21,3 +25,7 @@ def register_routes(api: Api):
     api.register_blueprint(employee_bp)
     api.register_blueprint(service_bp)
     api.register_blueprint(appointment_bp)
+    api.register_blueprint(availability_bp)
+    api.register_blueprint(schedule_bp)
+    api.register_blueprint(analytics_bp)
+    api.register_blueprint(metrics_bp)
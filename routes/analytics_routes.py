@@ -0,0 +1,111 @@
+"""
+Route module for Analytics routes.
+"""
+
+from flask_smorest import Blueprint as SmorestBlueprint
+from schemas.analytics_schema import (
+    AnalyticsDaysQuerySchema,
+    AnalyticsQuerySchema,
+    DayAnalyticsViewSchema,
+    EmployeeAnalyticsViewSchema,
+    ServiceAnalyticsViewSchema,
+)
+from business.analytics_business import (
+    get_days_report, get_employees_report, get_services_report)
+from database.routing import use_read_replica
+from routes.conditional import conditional_headers
+from routes.docs.analytics_doc import (
+    GET_DAYS_ANALYTICS_SUMMARY,
+    GET_DAYS_ANALYTICS_DESCRIPTION,
+    GET_EMPLOYEES_ANALYTICS_SUMMARY,
+    GET_EMPLOYEES_ANALYTICS_DESCRIPTION,
+    GET_SERVICES_ANALYTICS_SUMMARY,
+    GET_SERVICES_ANALYTICS_DESCRIPTION,
+    analytics_responses,
+    days_analytics_responses,
+)
+
+analytics_bp = SmorestBlueprint(
+    'Analytics', __name__, description='Relatórios de Faturamento e Ocupação')
+
+
+@analytics_bp.route('/analytics/days', methods=['GET'])
+@analytics_bp.etag
+@analytics_bp.arguments(AnalyticsDaysQuerySchema, location='query')
+@analytics_bp.response(200, DayAnalyticsViewSchema(many=True))
+@analytics_bp.doc(summary=GET_DAYS_ANALYTICS_SUMMARY, description=GET_DAYS_ANALYTICS_DESCRIPTION,
+                  responses=days_analytics_responses)
+@use_read_replica
+def get_days_analytics(report_data):
+    """
+    Retrieves the bookings, revenue and chair utilization of every day of a range.
+
+    Receives the 'start' and, optionally, the 'end' and 'employee_id' query
+    arguments. The totals are read from the daily rollups, and the capacity
+    depends on the number of employees, so the ETag follows both tables.
+
+    Returns:
+        JSON response:
+        - 200 (OK): Successfully retrieved the daily totals.
+        - 304 (Not Modified): The client's cached report is current.
+        - 400 (Bad Request): Invalid day range.
+        - 404 (Not Found): Employee not found.
+        - 422 (Unprocessable Entity): Validation error.
+    """
+
+    headers = conditional_headers(analytics_bp, ['appointment', 'employee'])
+
+    return get_days_report(**report_data), headers
+
+
+@analytics_bp.route('/analytics/employees', methods=['GET'])
+@analytics_bp.etag
+@analytics_bp.arguments(AnalyticsQuerySchema, location='query')
+@analytics_bp.response(200, EmployeeAnalyticsViewSchema(many=True))
+@analytics_bp.doc(summary=GET_EMPLOYEES_ANALYTICS_SUMMARY,
+                  description=GET_EMPLOYEES_ANALYTICS_DESCRIPTION, responses=analytics_responses)
+@use_read_replica
+def get_employees_analytics(report_data):
+    """
+    Retrieves the bookings, revenue and chair utilization of every employee
+    with appointments over a range of days.
+
+    Receives the 'start' and, optionally, the 'end' query arguments.
+
+    Returns:
+        JSON response:
+        - 200 (OK): Successfully retrieved the employees totals.
+        - 304 (Not Modified): The client's cached report is current.
+        - 400 (Bad Request): Invalid day range.
+        - 422 (Unprocessable Entity): Validation error.
+    """
+
+    headers = conditional_headers(analytics_bp, ['appointment'])
+
+    return get_employees_report(**report_data), headers
+
+
+@analytics_bp.route('/analytics/services', methods=['GET'])
+@analytics_bp.etag
+@analytics_bp.arguments(AnalyticsQuerySchema, location='query')
+@analytics_bp.response(200, ServiceAnalyticsViewSchema(many=True))
+@analytics_bp.doc(summary=GET_SERVICES_ANALYTICS_SUMMARY,
+                  description=GET_SERVICES_ANALYTICS_DESCRIPTION, responses=analytics_responses)
+@use_read_replica
+def get_services_analytics(report_data):
+    """
+    Retrieves the bookings and revenue of every booked service over a range of days.
+
+    Receives the 'start' and, optionally, the 'end' query arguments.
+
+    Returns:
+        JSON response:
+        - 200 (OK): Successfully retrieved the services totals.
+        - 304 (Not Modified): The client's cached report is current.
+        - 400 (Bad Request): Invalid day range.
+        - 422 (Unprocessable Entity): Validation error.
+    """
+
+    headers = conditional_headers(analytics_bp, ['appointment'])
+
+    return get_services_report(**report_data), headers
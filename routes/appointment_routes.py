@@ -3,20 +3,41 @@ Route module for Appointment routes.
 """
 
 from flask_smorest import Blueprint as SmorestBlueprint
-from schemas.appointment_schema import AppointmentSchema, AppointmentViewSchema
-from business.appointment_business import create_appointment
-from repositories.appointment_repository import get_all_appointments
+from sqlalchemy.ext.asyncio import AsyncSession
+from schemas.bulk_schema import BulkResultSchema
+from schemas.pagination_schema import AppointmentPaginationSchema
+from schemas.appointment_schema import (
+    AppointmentBulkArgsSchema, AppointmentSchema, AppointmentViewSchema)
+from business.appointment_business import create_appointment, create_appointments
+from repositories.appointment_repository import (
+    get_all_appointments, get_all_appointments_async, iter_all_appointments)
+from database.routing import use_read_replica
+from schemas.fast_serializer import (
+    compile_schema, fast_serialization, is_fast_serialization_enabled)
+from routes.async_listing import AsyncRequest, AsyncResponse, listing_response
+from routes.conditional import conditional_headers
+from routes.pagination import pagination_headers
+from routes.streaming import ndjson_response
+from routes.docs.pagination_doc import pagination_headers_doc
+from routes.docs.bulk_doc import BULK_RESULTS_DESCRIPTION, bulk_responses
 from routes.docs.appointment_doc import (
+    BULK_APPOINTMENT_SUMMARY,
+    BULK_APPOINTMENT_DESCRIPTION,
     GET_APPOINTMENT_SUMMARY,
     GET_APPOINTMENT_DESCRIPTION,
+    EXPORT_APPOINTMENT_SUMMARY,
+    EXPORT_APPOINTMENT_DESCRIPTION,
     POST_APPOINTMENT_SUMMARY,
     POST_APPOINTMENT_DESCRIPTION,
     appointment_responses,
+    appointment_export_responses,
 )
 
 appointment_bp = SmorestBlueprint(
     'Appointment', __name__, description='Operações em Agendamentos')
 
+_serialize_appointments = compile_schema(AppointmentViewSchema(many=True))
+
 
 @appointment_bp.route('/appointment', methods=['POST'])
 @appointment_bp.arguments(AppointmentSchema)
@@ -45,18 +66,94 @@ def add_appointment(apointment_data):
     return create_appointment(**apointment_data)
 
 
+@appointment_bp.route('/appointments/bulk', methods=['POST'])
+@appointment_bp.arguments(AppointmentSchema(many=True))
+@appointment_bp.arguments(AppointmentBulkArgsSchema, location='query')
+@appointment_bp.response(200, BulkResultSchema(many=True), description=BULK_RESULTS_DESCRIPTION)
+@appointment_bp.doc(summary=BULK_APPOINTMENT_SUMMARY, description=BULK_APPOINTMENT_DESCRIPTION,
+                    responses=bulk_responses)
+def add_appointments(appointments_data, args):
+    """
+    Handles the creation of a batch of appointments.
+
+    Receives a JSON list of appointments, validated with the same rules as the
+    single appointment route, and creates every valid appointment in a single transaction.
+    With `historical=true`, the batch is imported history: past dates and dates
+    outside business hours are accepted.
+
+    Returns:
+        JSON response:
+        - 200 (OK): The result of each appointment, in the batch order.
+        - 400 (Bad Request): Invalid body JSON format.
+        - 422 (Unprocessable Entity): Empty or too large batch, or validation error.
+    """
+
+    return create_appointments(appointments_data, **args)
+
+
 @appointment_bp.route('/appointments', methods=['GET'])
-@appointment_bp.response(200, AppointmentViewSchema(many=True))
+@appointment_bp.etag
+@appointment_bp.arguments(AppointmentPaginationSchema, location='query')
+@appointment_bp.response(200, AppointmentViewSchema(many=True), headers=pagination_headers_doc)
 @appointment_bp.doc(summary=GET_APPOINTMENT_SUMMARY, description=GET_APPOINTMENT_DESCRIPTION)
-def get_appointments():
+@fast_serialization(AppointmentViewSchema(many=True))
+@use_read_replica
+def get_appointments(pagination):
     """
-    Retrieves a list of all appointments.
+    Retrieves a page of appointments, ordered by date.
 
     This endpoint returns a collection of appointments records in JSON format.
+    The cursor for the next page is returned in the X-Next-Cursor header.
+    A 304 is returned, without querying the listing, when the client's
+    ETag or Last-Modified date is still current.
 
     Responses:         
         JSON response:
         - 200 (OK): Successfully retrieved the list of appointments.
+        - 304 (Not Modified): The client's cached list is current.
+    """
+
+    headers = conditional_headers(appointment_bp, ['appointment'])
+    appointments, next_cursor = get_all_appointments(
+        **pagination, projected=is_fast_serialization_enabled())
+
+    return appointments, {**headers, **pagination_headers(next_cursor)}
+
+
+async def get_appointments_async(request: AsyncRequest, session: AsyncSession) -> AsyncResponse:
+    """
+    Async counterpart of get_appointments, served by the ASGI entry point.
+
+    It reads projected appointments with the async session and answers with the
+    same body and headers as the Flask route.
+
+    Args:
+        request (AsyncRequest): The request.
+        session (AsyncSession): The async session of the request.
+
+    Returns:
+        AsyncResponse: The page of appointments, a 304 or a 422.
+    """
+
+    return await listing_response(request, session, ['appointment'],
+                                  AppointmentPaginationSchema(),
+                                  get_all_appointments_async, _serialize_appointments)
+
+
+@appointment_bp.route('/appointments/export', methods=['GET'])
+@appointment_bp.doc(summary=EXPORT_APPOINTMENT_SUMMARY, description=EXPORT_APPOINTMENT_DESCRIPTION,
+                    responses=appointment_export_responses)
+@use_read_replica
+def export_appointments():
+    """
+    Streams every appointment as NDJSON.
+
+    Rows are fetched in chunks and written to the response as they are
+    serialized, so memory stays flat whatever the table size.
+
+    Responses:
+        NDJSON response:
+        - 200 (OK): Successfully streamed the appointments.
     """
 
-    return get_all_appointments()
+    return ndjson_response(iter_all_appointments(), AppointmentViewSchema())
@@ -0,0 +1,183 @@
+"""
+Helpers for the async listing routes of the ASGI serving mode.
+
+The async routes answer exactly as the Flask listing routes do: same query
+arguments validation, ETag, Last-Modified, 304 and pagination headers, and
+the same JSON body, produced by the compiled view schema serializers from
+projected records.
+"""
+
+import hashlib
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+from urllib.parse import parse_qs
+from marshmallow import EXCLUDE, Schema, ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from werkzeug.http import HTTP_STATUS_CODES, http_date, parse_date, parse_etags
+from monitoring.instrumentation import record_serialization
+from repositories.table_version_repository import get_table_versions_async
+from routes.conditional import etag_data, last_modified
+from routes.pagination import pagination_headers
+from schemas.fast_serializer import dumps
+
+JSON_MIMETYPE = 'application/json'
+
+Headers = List[Tuple[str, str]]
+Fetch = Callable[..., Awaitable[Tuple[List[Any], Optional[str]]]]
+
+
+class AsyncRequest(NamedTuple):
+    """
+    The parts of an ASGI HTTP request read by the async routes.
+
+    Attributes:
+        method (str): The request method.
+        path (str): The request path.
+        args (Dict[str, List[str]]): The query arguments, with every value of each argument.
+        headers (Dict[str, str]): The request headers, by lowercase name.
+    """
+
+    method: str
+    path: str
+    args: Dict[str, List[str]]
+    headers: Dict[str, str]
+
+    @classmethod
+    def from_scope(cls, scope: Dict[str, Any]) -> 'AsyncRequest':
+        """
+        Reads a request from its ASGI connection scope.
+
+        Args:
+            scope (Dict[str, Any]): The ASGI HTTP connection scope.
+
+        Returns:
+            AsyncRequest: The request.
+        """
+
+        headers: Dict[str, str] = {}
+
+        for name, value in scope['headers']:
+            name = name.decode('latin-1').lower()
+            value = value.decode('latin-1')
+            headers[name] = f'{headers[name]}, {value}' if name in headers else value
+
+        return cls(scope['method'], scope['path'],
+                   parse_qs(scope['query_string'].decode('latin-1'), keep_blank_values=True),
+                   headers)
+
+
+class AsyncResponse(NamedTuple):
+    """
+    A complete HTTP response of an async route.
+
+    Attributes:
+        status (int): The status code.
+        headers (Headers): The response headers.
+        body (bytes): The response body.
+    """
+
+    status: int
+    headers: Headers
+    body: bytes = b''
+
+
+def json_response(status: int, data: Any,
+                  headers: Sequence[Tuple[str, str]] = ()) -> AsyncResponse:
+    """
+    Builds a JSON response, encoded as Flask's default JSON provider does.
+
+    Args:
+        status (int): The status code.
+        data (Any): The serialized data.
+        headers (Sequence[Tuple[str, str]]): Headers added after the content headers.
+
+    Returns:
+        AsyncResponse: The response.
+    """
+
+    body = f'{dumps(data)}\n'.encode()
+
+    return AsyncResponse(status, [('Content-Type', JSON_MIMETYPE),
+                                  ('Content-Length', str(len(body))), *headers], body)
+
+
+def error_response(status: int, errors: Optional[Dict[str, Any]] = None) -> AsyncResponse:
+    """
+    Builds an error response with the body of the API's error handler.
+
+    Args:
+        status (int): The status code.
+        errors (Optional[Dict[str, Any]]): The error messages by location.
+
+    Returns:
+        AsyncResponse: The response.
+    """
+
+    payload: Dict[str, Any] = {'code': status, 'status': HTTP_STATUS_CODES[status]}
+
+    if errors:
+        payload['errors'] = errors
+
+    return json_response(status, payload)
+
+
+def _etag(data: Dict[str, Any]) -> str:
+    """
+    Hashes ETag data as flask-smorest does.
+    """
+
+    return hashlib.sha1(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
+async def listing_response(request: AsyncRequest, session: AsyncSession,
+                           tables_names: List[str], arguments: Schema,
+                           fetch: Fetch, serialize: Callable[[List[Any]], Any]
+                           ) -> AsyncResponse:
+    """
+    Answers a paginated listing request.
+
+    Args:
+        request (AsyncRequest): The request.
+        session (AsyncSession): The async session of the request.
+        tables_names (List[str]): The tables whose rows appear in the listing.
+        arguments (Schema): The pagination arguments schema.
+        fetch (Fetch): The async repository function returning a page and its next cursor.
+        serialize (Callable[[List[Any]], Any]): The compiled view schema serializer.
+
+    Returns:
+        AsyncResponse: The listing, a 304 if the client's copy is current,
+        or a 422 if the arguments are invalid.
+    """
+
+    try:
+        pagination = arguments.load({name: values[0] for name, values in request.args.items()},
+                                    unknown=EXCLUDE)
+    except ValidationError as error:
+        return error_response(422, {'query': error.messages})
+
+    versions = await get_table_versions_async(session, tables_names)
+    etag = _etag(etag_data(versions, request.args))
+    modified = last_modified(versions)
+
+    if 'if-none-match' in request.headers:
+        if parse_etags(request.headers['if-none-match']).contains(etag):
+            return AsyncResponse(304, [])
+    else:
+        if_modified_since = parse_date(request.headers.get('if-modified-since'))
+
+        if if_modified_since and modified <= if_modified_since:
+            return AsyncResponse(304, [])
+
+    rows, next_cursor = await fetch(session, **pagination)
+
+    started = time.perf_counter()
+    response = json_response(200, serialize(rows), [
+        ('Last-Modified', http_date(modified)),
+        ('Cache-Control', 'no-cache'),
+        *pagination_headers(next_cursor).items(),
+        ('ETag', f'"{etag}"'),
+    ])
+    record_serialization(started)
+
+    return response
@@ -0,0 +1,38 @@
+"""
+Route module for Availability routes.
+"""
+
+from flask_smorest import Blueprint as SmorestBlueprint
+from schemas.availability_schema import AvailabilityQuerySchema, AvailabilityViewSchema
+from business.availability_business import get_available_slots
+from routes.docs.availability_doc import (
+    GET_AVAILABILITY_SUMMARY,
+    GET_AVAILABILITY_DESCRIPTION,
+    availability_responses,
+)
+
+availability_bp = SmorestBlueprint(
+    'Availability', __name__, description='Consulta de Horários Disponíveis')
+
+
+@availability_bp.route('/availability', methods=['GET'])
+@availability_bp.arguments(AvailabilityQuerySchema, location='query')
+@availability_bp.response(200, AvailabilityViewSchema(many=True))
+@availability_bp.doc(summary=GET_AVAILABILITY_SUMMARY, description=GET_AVAILABILITY_DESCRIPTION,
+                     responses=availability_responses)
+def get_availability(availability_data):
+    """
+    Retrieves every bookable start time for the given services.
+
+    Receives the 'services_ids' and, optionally, the 'employee_id' query
+    arguments and returns the free start times of each employee that
+    performs all the services.
+
+    Returns:
+        JSON response:
+        - 200 (OK): Successfully retrieved the available start times.
+        - 404 (Not Found): Services or employee not found.
+        - 422 (Unprocessable Entity): Validation error.
+    """
+
+    return get_available_slots(**availability_data)
@@ -0,0 +1,84 @@
+"""
+Helpers for conditional GET requests on listing routes.
+"""
+
+from typing import Any, Dict, List
+from datetime import datetime, timezone
+from flask import request
+from flask_smorest import Blueprint as SmorestBlueprint
+from flask_smorest.exceptions import NotModified
+from sqlalchemy import Row
+from werkzeug.http import http_date
+from repositories.table_version_repository import get_table_versions
+
+
+def etag_data(versions: List[Row], args: Dict[str, List[str]]) -> Dict[str, Any]:
+    """
+    Builds the data hashed into a listing's ETag.
+
+    Args:
+        versions (List[Row]): Rows of (table_name, version, updated_at) of the listed tables.
+        args (Dict[str, List[str]]): The query arguments, with every value of each argument.
+
+    Returns:
+        Dict[str, Any]: The ETag data.
+    """
+
+    return {
+        'versions': {table_name: version for table_name, version, _ in versions},
+        'args': args
+    }
+
+
+def last_modified(versions: List[Row]) -> datetime:
+    """
+    Computes a listing's Last-Modified date, the last change of its tables.
+
+    Args:
+        versions (List[Row]): Rows of (table_name, version, updated_at) of the listed tables.
+
+    Returns:
+        datetime: The UTC date, truncated to the second as in HTTP dates.
+    """
+
+    return max(updated_at for _, _, updated_at in versions).replace(
+        tzinfo=timezone.utc, microsecond=0)
+
+
+def conditional_headers(blueprint: SmorestBlueprint, tables_names: List[str]) -> Dict[str, str]:
+    """
+    Validates the client's cached copy of a listing against the listed tables versions.
+
+    The ETag is computed from the tables write versions and the query arguments,
+    and the Last-Modified date from the tables last change, all read with a single
+    primary key query. When the client's copy is current, a 304 is raised before
+    the listing is queried or serialized.
+
+    HTTP dates are truncated to the second, so a copy dated the same second as
+    the last change may predate a later write of that second. Without an ETag,
+    a 304 is only answered when the last change is strictly older than the
+    client's If-Modified-Since: copies dated the second of the last change are
+    sent again, and the ETag, which changes on every write, is what revalidates
+    them.
+
+    Args:
+        blueprint (SmorestBlueprint): The blueprint of the route, decorated with its etag.
+        tables_names (List[str]): The tables whose rows appear in the listing.
+
+    Returns:
+        Dict[str, str]: The headers to add to the response.
+
+    Raises:
+        HTTPException: 304 if the client's cached copy is current.
+    """
+
+    versions = get_table_versions(tables_names)
+    modified = last_modified(versions)
+
+    blueprint.set_etag(etag_data(versions, request.args.to_dict(flat=False)))
+
+    if ('If-None-Match' not in request.headers and request.if_modified_since
+            and modified < request.if_modified_since):
+        raise NotModified()
+
+    return {'Last-Modified': http_date(modified), 'Cache-Control': 'no-cache'}
@@ -3,20 +3,40 @@ Route module for Customer routes.
 """
 
 from flask_smorest import Blueprint as SmorestBlueprint
+from sqlalchemy.ext.asyncio import AsyncSession
+from schemas.bulk_schema import BulkResultSchema
+from schemas.pagination_schema import PaginationSchema
 from schemas.customer_schema import CustomerSchema, CustomerViewSchema
-from business.customer_business import create_customer
-from repositories.customer_repository import get_all_customers
+from business.customer_business import create_customer, create_customers
+from repositories.customer_repository import (
+    get_all_customers, get_all_customers_async, iter_all_customers)
+from database.routing import use_read_replica
+from schemas.fast_serializer import (
+    compile_schema, fast_serialization, is_fast_serialization_enabled)
+from routes.async_listing import AsyncRequest, AsyncResponse, listing_response
+from routes.conditional import conditional_headers
+from routes.pagination import pagination_headers
+from routes.streaming import ndjson_response
+from routes.docs.pagination_doc import pagination_headers_doc
+from routes.docs.bulk_doc import BULK_RESULTS_DESCRIPTION, bulk_responses
 from routes.docs.customer_doc import (
+    BULK_CUSTOMER_SUMMARY,
+    BULK_CUSTOMER_DESCRIPTION,
     GET_CUSTOMER_SUMMARY,
     GET_CUSTOMER_DESCRIPTION,
+    EXPORT_CUSTOMER_SUMMARY,
+    EXPORT_CUSTOMER_DESCRIPTION,
     POST_CUSTOMER_SUMMARY,
     POST_CUSTOMER_DESCRIPTION,
     customer_responses,
+    customer_export_responses,
 )
 
 customer_bp = SmorestBlueprint(
     'Customer', __name__, description='Operações em Clientes')
 
+_serialize_customers = compile_schema(CustomerViewSchema(many=True))
+
 
 @customer_bp.route('/customer', methods=['POST'])
 @customer_bp.arguments(CustomerSchema)
@@ -44,18 +64,90 @@ def add_customer(customer_data):
     return create_customer(**customer_data)
 
 
+@customer_bp.route('/customers/bulk', methods=['POST'])
+@customer_bp.arguments(CustomerSchema(many=True))
+@customer_bp.response(200, BulkResultSchema(many=True), description=BULK_RESULTS_DESCRIPTION)
+@customer_bp.doc(summary=BULK_CUSTOMER_SUMMARY, description=BULK_CUSTOMER_DESCRIPTION,
+                 responses=bulk_responses)
+def add_customers(customers_data):
+    """
+    Handles the creation of a batch of customers.
+
+    Receives a JSON list of customers, validated with the same rules as the
+    single customer route, and creates every valid customer in a single transaction.
+
+    Returns:
+        JSON response:
+        - 200 (OK): The result of each customer, in the batch order.
+        - 400 (Bad Request): Invalid body JSON format.
+        - 422 (Unprocessable Entity): Empty or too large batch, or validation error.
+    """
+
+    return create_customers(customers_data)
+
+
 @customer_bp.route('/customers', methods=['GET'])
-@customer_bp.response(200, CustomerViewSchema(many=True))
+@customer_bp.etag
+@customer_bp.arguments(PaginationSchema, location='query')
+@customer_bp.response(200, CustomerViewSchema(many=True), headers=pagination_headers_doc)
 @customer_bp.doc(summary=GET_CUSTOMER_SUMMARY, description=GET_CUSTOMER_DESCRIPTION)
-def get_customers():
+@fast_serialization(CustomerViewSchema(many=True))
+@use_read_replica
+def get_customers(pagination):
     """
-    Retrieve a list of all customers.
+    Retrieve a page of customers.
 
     This endpoint returns a collection of customer records in JSON format.
+    The cursor for the next page is returned in the X-Next-Cursor header.
+    A 304 is returned, without querying the listing, when the client's
+    ETag or Last-Modified date is still current.
 
     Responses:         
         JSON response:
         - 200 (OK): Successfully retrieved the list of customers.                                                     
+        - 304 (Not Modified): The client's cached list is current.
+    """
+
+    headers = conditional_headers(customer_bp, ['customer'])
+    customers, next_cursor = get_all_customers(
+        **pagination, projected=is_fast_serialization_enabled())
+
+    return customers, {**headers, **pagination_headers(next_cursor)}
+
+
+async def get_customers_async(request: AsyncRequest, session: AsyncSession) -> AsyncResponse:
+    """
+    Async counterpart of get_customers, served by the ASGI entry point.
+
+    It reads projected customers with the async session and answers with the
+    same body and headers as the Flask route.
+
+    Args:
+        request (AsyncRequest): The request.
+        session (AsyncSession): The async session of the request.
+
+    Returns:
+        AsyncResponse: The page of customers, a 304 or a 422.
+    """
+
+    return await listing_response(request, session, ['customer'], PaginationSchema(),
+                                  get_all_customers_async, _serialize_customers)
+
+
+@customer_bp.route('/customers/export', methods=['GET'])
+@customer_bp.doc(summary=EXPORT_CUSTOMER_SUMMARY, description=EXPORT_CUSTOMER_DESCRIPTION,
+                 responses=customer_export_responses)
+@use_read_replica
+def export_customers():
+    """
+    Streams every customer as NDJSON.
+
+    Rows are fetched in chunks and written to the response as they are
+    serialized, so memory stays flat whatever the table size.
+
+    Responses:
+        NDJSON response:
+        - 200 (OK): Successfully streamed the customers.
     """
 
-    return get_all_customers()
+    return ndjson_response(iter_all_customers(), CustomerViewSchema())
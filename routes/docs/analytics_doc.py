@@ -0,0 +1,84 @@
+"""
+This module contains standard descriptions and responses for the Analytics API.
+"""
+
+from schemas.error_schema import ErrorSchema
+
+
+GET_DAYS_ANALYTICS_SUMMARY = 'Retorna os agendamentos, o faturamento e a ocupação por dia.'
+GET_DAYS_ANALYTICS_DESCRIPTION = 'Este endpoint retorna, para cada dia do período, inclusive os ' \
+    'dias sem agendamentos, a quantidade de agendamentos, o faturamento em centavos e a ' \
+    'ocupação das cadeiras: os minutos agendados sobre os minutos entre a abertura e o ' \
+    'fechamento de todos os funcionários cadastrados, ou do funcionário(a) informado.'
+GET_EMPLOYEES_ANALYTICS_SUMMARY = 'Retorna os agendamentos, o faturamento e a ocupação por ' \
+    'funcionário(a).'
+GET_EMPLOYEES_ANALYTICS_DESCRIPTION = 'Este endpoint retorna, para cada funcionário(a) com ' \
+    'agendamentos no período, a quantidade de agendamentos, o faturamento em centavos e a ' \
+    'ocupação da sua cadeira entre a abertura e o fechamento.'
+GET_SERVICES_ANALYTICS_SUMMARY = 'Retorna os agendamentos e o faturamento por serviço.'
+GET_SERVICES_ANALYTICS_DESCRIPTION = 'Este endpoint retorna, para cada serviço agendado no ' \
+    'período, a quantidade de agendamentos que o incluem e o seu faturamento em centavos.'
+_bad_request = {
+    'description':
+    'Bad Request: O período termina antes de começar ou tem mais de 366 dias.',
+    'content': {
+        'application/json': {
+            'schema': ErrorSchema,
+            'example': {
+                'code': 400,
+                'errors': {
+                    'query': {
+                        'end': ['Range must end after it starts and span at most 366 days.']
+                    }
+                },
+                'status': 'Bad Request'
+            }
+        }
+    }
+}
+_validation_error = {
+    'description':
+    'Validation Error: A requisição contém campos ausentes ou inválidos.\n\n'
+    '**Motivos Possíveis:**\n'
+    '- `start` é obrigatório, mas não foi fornecido.\n'
+    '- `start` ou `end` não estão no formato AAAA-MM-DD.\n\n',
+    'content': {
+        'application/json': {
+            'schema': ErrorSchema,
+            'example': {
+                'code': 422,
+                'errors': {
+                    'query': {
+                        'start': ['Missing data for required field.']
+                    }
+                },
+                'status': 'Unprocessable Entity'
+            }
+        }
+    }
+}
+analytics_responses = {
+    400: _bad_request,
+    422: _validation_error
+}
+days_analytics_responses = {
+    400: _bad_request,
+    404: {
+        'description': 'Not Found: O funcionário(a) informado não foi encontrado.',
+        'content': {
+            'application/json': {
+                'schema': ErrorSchema,
+                'example': {
+                    'code': 404,
+                    'errors': {
+                        'query': {
+                            'employee': ['Provided employee was not found.']
+                        }
+                    },
+                    'status': 'Not Found'
+                }
+            }
+        }
+    },
+    422: _validation_error
+}
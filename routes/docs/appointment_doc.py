@@ -3,14 +3,24 @@ This module contains standard descriptions and responses for the Appointment API
 """
 
 from schemas.error_schema import ErrorSchema
+from schemas.appointment_schema import AppointmentViewSchema
+from routes.streaming import NDJSON_MIMETYPE
 
 
 GET_APPOINTMENT_SUMMARY = 'Retorna a lista de todos os agendamentos cadatrados.'
 GET_APPOINTMENT_DESCRIPTION = 'Este endpoint retorna uma coleção de agendamentos cadastrados ' \
-    'no formato JSON.'
+    'no formato JSON, paginada por cursor.'
+EXPORT_APPOINTMENT_SUMMARY = 'Exporta todos os agendamentos cadastrados em streaming.'
+EXPORT_APPOINTMENT_DESCRIPTION = 'Este endpoint retorna todos os agendamentos cadastrados no formato ' \
+    'NDJSON (um objeto JSON por linha), enviados à medida que são lidos do banco de dados.'
 POST_APPOINTMENT_SUMMARY = 'Lida com a criação de um novo agendamento.'
 POST_APPOINTMENT_DESCRIPTION = 'Este endpoint processa o envio de um formulário (JSON) ' \
     'para criar um novo registro de agendamento.'
+BULK_APPOINTMENT_SUMMARY = 'Cadastra um lote de agendamentos.'
+BULK_APPOINTMENT_DESCRIPTION = 'Este endpoint recebe uma lista (JSON) de agendamentos e cadastra todos os ' \
+    'itens válidos em uma única transação, retornando o resultado de cada item. Cada agendamento é validado como no cadastro individual, inclusive contra os demais agendamentos do lote. ' \
+    'Com `historical=true`, o lote é tratado como histórico importado: datas passadas ou fora do ' \
+    'horário de funcionamento são aceitas, mantidas as demais validações.'
 appointment_responses = {
     400: {
         'description':
@@ -112,3 +122,13 @@ appointment_responses = {
         }
     }
 }
+appointment_export_responses = {
+    200: {
+        'description': 'OK: Agendamentos exportados com sucesso, um por linha.',
+        'content': {
+            NDJSON_MIMETYPE: {
+                'schema': AppointmentViewSchema
+            }
+        }
+    }
+}
@@ -0,0 +1,52 @@
+"""
+This module contains standard descriptions and responses for the Availability API.
+"""
+
+from schemas.error_schema import ErrorSchema
+
+
+GET_AVAILABILITY_SUMMARY = 'Retorna os horários disponíveis para agendamento.'
+GET_AVAILABILITY_DESCRIPTION = 'Este endpoint retorna, para cada funcionário(a) que executa ' \
+    'todos os serviços informados, os horários de início livres dentro do período de ' \
+    'agendamento e do horário de funcionamento.'
+availability_responses = {
+    404: {
+        'description':
+        'Not Found: Serviços e/ou funcionário(a) informados não foram encontrados.',
+        'content': {
+            'application/json': {
+                'schema': ErrorSchema,
+                'example': {
+                    'code': 404,
+                    'errors': {
+                        'query': {
+                            'service': ['Provided services were not found.'],
+                            'employee': ['Provided employee was not found.']
+                        }
+                    },
+                    'status': 'Not Found'
+                }
+            }
+        }
+    },
+    422: {
+        'description':
+        'Validation Error: A requisição contém campos ausentes ou inválidos.\n\n'
+        '**Motivos Possíveis:**\n'
+        '- `services_ids` é obrigatório, mas não foi fornecido.\n\n',
+        'content': {
+            'application/json': {
+                'schema': ErrorSchema,
+                'example': {
+                    'code': 422,
+                    'errors': {
+                        'query': {
+                            'services_ids': ['Missing data for required field.']
+                        }
+                    },
+                    'status': 'Unprocessable Entity'
+                }
+            }
+        }
+    }
+}
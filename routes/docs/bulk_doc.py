@@ -0,0 +1,48 @@
+"""
+This module contains standard responses for the batch creation API.
+"""
+
+from schemas.error_schema import ErrorSchema
+from validations.bulk_validation import MAX_BATCH_SIZE
+
+BULK_RESULTS_DESCRIPTION = 'Lote processado. Cada item traz o código 201 e o ID criado, ' \
+    'ou o código e as mensagens de erro que o cadastro individual retornaria.'
+bulk_responses = {
+    400: {
+        'description': 'Bad Request: O formato do corpo JSON é inválido.',
+        'content': {
+            'application/json': {
+                'schema': ErrorSchema,
+                'example': {
+                    'code': 400,
+                    'errors': {
+                        'json': [
+                            'Invalid JSON body.'
+                        ]
+                    },
+                    'status': 'Bad Request'
+                }
+            }
+        }
+    },
+    422: {
+        'description':
+        'Validation Error: O lote está vazio, tem mais de '
+        f'{MAX_BATCH_SIZE} itens, ou algum item tem campos ausentes ou inválidos. '
+        'Nesse caso nenhum item é cadastrado.',
+        'content': {
+            'application/json': {
+                'schema': ErrorSchema,
+                'example': {
+                    'code': 422,
+                    'errors': {
+                        'json': {
+                            'batch': [f'Batch must have between 1 and {MAX_BATCH_SIZE} items.']
+                        }
+                    },
+                    'status': 'Unprocessable Entity'
+                }
+            }
+        }
+    }
+}
@@ -3,14 +3,22 @@ This module contains standard descriptions and responses for the Customer API.
 """
 
 from schemas.error_schema import ErrorSchema
+from schemas.customer_schema import CustomerViewSchema
+from routes.streaming import NDJSON_MIMETYPE
 
 
 GET_CUSTOMER_SUMMARY = 'Retorna a lista de todos os clientes cadatrados.'
 GET_CUSTOMER_DESCRIPTION = 'Este endpoint retorna uma coleção de cadastros de clientes ' \
-    'no formato JSON.'
+    'no formato JSON, paginada por cursor.'
+EXPORT_CUSTOMER_SUMMARY = 'Exporta todos os clientes cadastrados em streaming.'
+EXPORT_CUSTOMER_DESCRIPTION = 'Este endpoint retorna todos os clientes cadastrados no formato ' \
+    'NDJSON (um objeto JSON por linha), enviados à medida que são lidos do banco de dados.'
 POST_CUSTOMER_SUMMARY = 'Lida com a criação de um novo cliente.'
 POST_CUSTOMER_DESCRIPTION = 'Este endpoint processa o envio de um formulário (JSON) ' \
     'para criar um novo registro de cliente.'
+BULK_CUSTOMER_SUMMARY = 'Cadastra um lote de clientes.'
+BULK_CUSTOMER_DESCRIPTION = 'Este endpoint recebe uma lista (JSON) de clientes e cadastra todos os ' \
+    'itens válidos em uma única transação, retornando o resultado de cada item.'
 customer_responses = {
     400: {
         'description': 'Bad Request: O formato do corpo JSON é inválido.',
@@ -72,3 +80,13 @@ customer_responses = {
         }
     }
 }
+customer_export_responses = {
+    200: {
+        'description': 'OK: Clientes exportados com sucesso, um por linha.',
+        'content': {
+            NDJSON_MIMETYPE: {
+                'schema': CustomerViewSchema
+            }
+        }
+    }
+}
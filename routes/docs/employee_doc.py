@@ -7,10 +7,13 @@ from schemas.error_schema import ErrorSchema
 
 GET_EMPLOYEE_SUMMARY = 'Retorna a lista de todos os funcionários cadatrados.'
 GET_EMPLOYEE_DESCRIPTION = 'Este endpoint retorna uma coleção de cadastros de funcionários ' \
-    'no formato JSON.'
+    'no formato JSON, paginada por cursor.'
 POST_EMPLOYEE_SUMMARY = 'Lida com a criação de um novo funcionário(a).'
 POST_EMPLOYEE_DESCRIPTION = 'Este endpoint processa o envio de um formulário (JSON) ' \
     'para criar um novo registro de funcionário(a).'
+BULK_EMPLOYEE_SUMMARY = 'Cadastra um lote de funcionários.'
+BULK_EMPLOYEE_DESCRIPTION = 'Este endpoint recebe uma lista (JSON) de funcionários e cadastra todos os ' \
+    'itens válidos em uma única transação, retornando o resultado de cada item.'
 employee_responses = {
     400: {
         'description': 'Bad Request: O formato do corpo JSON é inválido.',
@@ -0,0 +1,28 @@
+"""
+This module contains standard descriptions and responses for the Metrics API.
+"""
+
+from monitoring.metrics import PROMETHEUS_MIMETYPE
+
+
+GET_METRICS_SUMMARY = 'Retorna as métricas das requisições no formato Prometheus.'
+GET_METRICS_DESCRIPTION = 'Este endpoint retorna, por rota, o número de respostas por status ' \
+    'e os quantis do tempo total, do número de consultas SQL, do tempo em SQL e do tempo de ' \
+    'serialização das requisições, além dos contadores do cache, no formato de texto do Prometheus.'
+GET_SLOW_QUERIES_SUMMARY = 'Retorna as consultas SQL lentas agrupadas por consulta normalizada.'
+GET_SLOW_QUERIES_DESCRIPTION = 'Este endpoint retorna as consultas que excederam o limite ' \
+    '`SLOW_QUERY_THRESHOLD`, agrupadas pela impressão digital da consulta normalizada, com as ' \
+    'funções de origem, o número de execuções, os tempos e o plano de execução, ordenadas pelo ' \
+    'tempo total.'
+metrics_responses = {
+    200: {
+        'description': 'OK: Métricas retornadas com sucesso.',
+        'content': {
+            PROMETHEUS_MIMETYPE: {
+                'schema': {'type': 'string'},
+                'example': '# TYPE http_requests_total counter\n'
+                           'http_requests_total{method="GET",route="/customers",status="200"} 42\n'
+            }
+        }
+    }
+}
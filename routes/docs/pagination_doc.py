@@ -0,0 +1,12 @@
+"""
+This module contains standard descriptions for paginated listings.
+"""
+
+from routes.pagination import NEXT_CURSOR_HEADER
+
+pagination_headers_doc = {
+    NEXT_CURSOR_HEADER: {
+        'description': 'Cursor da próxima página. Ausente quando esta é a última página.',
+        'schema': {'type': 'string'}
+    }
+}
@@ -0,0 +1,69 @@
+"""
+This module contains standard descriptions and responses for the Schedule API.
+"""
+
+from schemas.error_schema import ErrorSchema
+
+
+GET_SCHEDULE_SUMMARY = 'Retorna a agenda dos funcionários em um período.'
+GET_SCHEDULE_DESCRIPTION = 'Este endpoint retorna os agendamentos de um(a) funcionário(a), ou de ' \
+    'todos, entre os dias informados, ordenados por dia, funcionário(a) e horário, com o nome ' \
+    'do cliente, os serviços e o preço total de cada agendamento.'
+schedule_responses = {
+    400: {
+        'description':
+        'Bad Request: O período termina antes de começar ou tem mais de 31 dias.',
+        'content': {
+            'application/json': {
+                'schema': ErrorSchema,
+                'example': {
+                    'code': 400,
+                    'errors': {
+                        'query': {
+                            'end': ['Range must end after it starts and span at most 31 days.']
+                        }
+                    },
+                    'status': 'Bad Request'
+                }
+            }
+        }
+    },
+    404: {
+        'description': 'Not Found: O funcionário(a) informado não foi encontrado.',
+        'content': {
+            'application/json': {
+                'schema': ErrorSchema,
+                'example': {
+                    'code': 404,
+                    'errors': {
+                        'query': {
+                            'employee': ['Provided employee was not found.']
+                        }
+                    },
+                    'status': 'Not Found'
+                }
+            }
+        }
+    },
+    422: {
+        'description':
+        'Validation Error: A requisição contém campos inválidos.\n\n'
+        '**Motivos Possíveis:**\n'
+        '- `start` é obrigatório, mas não foi fornecido.\n'
+        '- `start` ou `end` não estão no formato AAAA-MM-DD.\n\n',
+        'content': {
+            'application/json': {
+                'schema': ErrorSchema,
+                'example': {
+                    'code': 422,
+                    'errors': {
+                        'query': {
+                            'start': ['Not a valid date.']
+                        }
+                    },
+                    'status': 'Unprocessable Entity'
+                }
+            }
+        }
+    }
+}
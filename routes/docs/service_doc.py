@@ -7,10 +7,13 @@ from schemas.error_schema import ErrorSchema
 
 GET_SERVICE_SUMMARY = 'Retorna a lista de todos os serviços cadatrados.'
 GET_SERVICE_DESCRIPTION = 'Este endpoint retorna uma coleção de serviços cadastrados ' \
-    'no formato JSON.'
+    'no formato JSON, paginada por cursor.'
 POST_SERVICE_SUMMARY = 'Lida com a criação de um novo serviço.'
 POST_SERVICE_DESCRIPTION = 'Este endpoint processa o envio de um formulário (JSON) ' \
     'para criar um novo registro de serviço.'
+BULK_SERVICE_SUMMARY = 'Cadastra um lote de serviços.'
+BULK_SERVICE_DESCRIPTION = 'Este endpoint recebe uma lista (JSON) de serviços e cadastra todos os ' \
+    'itens válidos em uma única transação, retornando o resultado de cada item.'
 service_responses = {
     400: {
         'description': 'Bad Request: O formato do corpo JSON é inválido.',
@@ -52,7 +55,8 @@ service_responses = {
         '**Motivos Possíveis:**\n'
         '- `name` é obrigatório, mas não foi fornecido.\n'
         '- `price` é obrigatório, mas não foi fornecido.\n'
-        '- `price`: o valor do serviço é inválido.\n\n',
+        '- `price`: o valor do serviço é inválido.\n'
+        '- `duration`: a duração do serviço é inválida.\n\n',
         'content': {
             'application/json': {
                 'schema': ErrorSchema,
@@ -62,7 +66,8 @@ service_responses = {
                         'json': {
                             'name': ['Missing data for required field.'],
                             'price': ['Missing data for required field.',
-                                      'Invalid price.']
+                                      'Invalid price.'],
+                            'duration': ['Invalid duration.']
                         }
                     },
                     'status': 'Unprocessable Entity'
@@ -3,10 +3,23 @@ Route module for Employee routes.
 """
 
 from flask_smorest import Blueprint as SmorestBlueprint
+from sqlalchemy.ext.asyncio import AsyncSession
+from schemas.bulk_schema import BulkResultSchema
+from schemas.pagination_schema import PaginationSchema
 from schemas.employee_schema import EmployeeSchema, EmployeeViewSchema
-from business.employee_business import create_employee
-from repositories.employee_repository import get_all_employees
+from business.employee_business import create_employee, create_employees
+from repositories.employee_repository import get_all_employees, get_all_employees_async
+from database.routing import use_read_replica
+from schemas.fast_serializer import (
+    compile_schema, fast_serialization, is_fast_serialization_enabled)
+from routes.async_listing import AsyncRequest, AsyncResponse, listing_response
+from routes.conditional import conditional_headers
+from routes.pagination import pagination_headers
+from routes.docs.pagination_doc import pagination_headers_doc
+from routes.docs.bulk_doc import BULK_RESULTS_DESCRIPTION, bulk_responses
 from routes.docs.employee_doc import (
+    BULK_EMPLOYEE_SUMMARY,
+    BULK_EMPLOYEE_DESCRIPTION,
     GET_EMPLOYEE_SUMMARY,
     GET_EMPLOYEE_DESCRIPTION,
     POST_EMPLOYEE_SUMMARY,
@@ -17,6 +30,8 @@ from routes.docs.employee_doc import (
 employee_bp = SmorestBlueprint(
     'Employee', __name__, description='Operações em Funcionários')
 
+_serialize_employees = compile_schema(EmployeeViewSchema(many=True))
+
 
 @employee_bp.route('/employee', methods=['POST'])
 @employee_bp.arguments(EmployeeSchema)
@@ -45,16 +60,70 @@ def add_employee(employee_data):
     return create_employee(**employee_data)
 
 
+@employee_bp.route('/employees/bulk', methods=['POST'])
+@employee_bp.arguments(EmployeeSchema(many=True))
+@employee_bp.response(200, BulkResultSchema(many=True), description=BULK_RESULTS_DESCRIPTION)
+@employee_bp.doc(summary=BULK_EMPLOYEE_SUMMARY, description=BULK_EMPLOYEE_DESCRIPTION,
+                 responses=bulk_responses)
+def add_employees(employees_data):
+    """
+    Handles the creation of a batch of employees.
+
+    Receives a JSON list of employees, validated with the same rules as the
+    single employee route, and creates every valid employee in a single transaction.
+
+    Returns:
+        JSON response:
+        - 200 (OK): The result of each employee, in the batch order.
+        - 400 (Bad Request): Invalid body JSON format.
+        - 422 (Unprocessable Entity): Empty or too large batch, or validation error.
+    """
+
+    return create_employees(employees_data)
+
+
 @employee_bp.route('/employees', methods=['GET'])
-@employee_bp.response(200, EmployeeViewSchema(many=True))
+@employee_bp.etag
+@employee_bp.arguments(PaginationSchema, location='query')
+@employee_bp.response(200, EmployeeViewSchema(many=True), headers=pagination_headers_doc)
 @employee_bp.doc(summary=GET_EMPLOYEE_SUMMARY, description=GET_EMPLOYEE_DESCRIPTION)
-def get_employees():
+@fast_serialization(EmployeeViewSchema(many=True))
+@use_read_replica
+def get_employees(pagination):
     """
-    Retrieves a list of all employees.
+    Retrieves a page of employees.
+
+    The cursor for the next page is returned in the X-Next-Cursor header.
+    A 304 is returned, without querying the listing, when the client's
+    ETag or Last-Modified date is still current.
 
     Returns:
         JSON response:
         - 200: List of employees retrieved successfully.
+        - 304: The client's cached list is current.
+    """
+
+    headers = conditional_headers(employee_bp, ['employee'])
+    employees, next_cursor = get_all_employees(
+        **pagination, projected=is_fast_serialization_enabled())
+
+    return employees, {**headers, **pagination_headers(next_cursor)}
+
+
+async def get_employees_async(request: AsyncRequest, session: AsyncSession) -> AsyncResponse:
+    """
+    Async counterpart of get_employees, served by the ASGI entry point.
+
+    It reads projected employees with the async session and answers with the
+    same body and headers as the Flask route.
+
+    Args:
+        request (AsyncRequest): The request.
+        session (AsyncSession): The async session of the request.
+
+    Returns:
+        AsyncResponse: The page of employees, a 304 or a 422.
     """
 
-    return get_all_employees()
+    return await listing_response(request, session, ['employee'], PaginationSchema(),
+                                  get_all_employees_async, _serialize_employees)
@@ -0,0 +1,50 @@
+"""
+Route module for Metrics routes.
+"""
+
+from flask import Response
+from flask_smorest import Blueprint as SmorestBlueprint
+from monitoring.metrics import PROMETHEUS_MIMETYPE, render_metrics
+from monitoring.profiler import slow_queries
+from schemas.slow_query_schema import SlowQueryViewSchema
+from routes.docs.metrics_doc import (
+    GET_METRICS_SUMMARY,
+    GET_METRICS_DESCRIPTION,
+    GET_SLOW_QUERIES_SUMMARY,
+    GET_SLOW_QUERIES_DESCRIPTION,
+    metrics_responses,
+)
+
+metrics_bp = SmorestBlueprint(
+    'Metrics', __name__, description='Métricas de Desempenho')
+
+
+@metrics_bp.route('/metrics', methods=['GET'])
+@metrics_bp.doc(summary=GET_METRICS_SUMMARY, description=GET_METRICS_DESCRIPTION,
+                responses=metrics_responses)
+def get_metrics():
+    """
+    Exposes the request metrics and cache counters for Prometheus scraping.
+
+    Responses:
+        Text response:
+        - 200 (OK): Successfully retrieved the metrics.
+    """
+
+    return Response(render_metrics(), mimetype=PROMETHEUS_MIMETYPE)
+
+
+@metrics_bp.route('/metrics/queries', methods=['GET'])
+@metrics_bp.response(200, SlowQueryViewSchema(many=True))
+@metrics_bp.doc(summary=GET_SLOW_QUERIES_SUMMARY, description=GET_SLOW_QUERIES_DESCRIPTION)
+def get_slow_queries():
+    """
+    Retrieves the slow statements recorded by the query profiler, aggregated
+    by normalized statement.
+
+    Returns:
+        JSON response:
+        - 200 (OK): Successfully retrieved the slow statements.
+    """
+
+    return slow_queries.queries()
@@ -0,0 +1,21 @@
+"""
+Helpers for paginated listing routes.
+"""
+
+from typing import Dict, Optional
+
+NEXT_CURSOR_HEADER = 'X-Next-Cursor'
+
+
+def pagination_headers(next_cursor: Optional[str]) -> Dict[str, str]:
+    """
+    Builds the response headers of a paginated listing.
+
+    Args:
+        next_cursor (Optional[str]): The cursor for the next page, if any.
+
+    Returns:
+        Dict[str, str]: The headers to add to the response.
+    """
+
+    return {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
@@ -0,0 +1,47 @@
+"""
+Route module for Schedule routes.
+"""
+
+from flask_smorest import Blueprint as SmorestBlueprint
+from schemas.schedule_schema import ScheduleQuerySchema, ScheduleViewSchema
+from business.schedule_business import get_employees_schedule
+from database.routing import use_read_replica
+from routes.conditional import conditional_headers
+from routes.docs.schedule_doc import (
+    GET_SCHEDULE_SUMMARY,
+    GET_SCHEDULE_DESCRIPTION,
+    schedule_responses,
+)
+
+schedule_bp = SmorestBlueprint(
+    'Schedule', __name__, description='Agenda dos Funcionários')
+
+
+@schedule_bp.route('/schedule', methods=['GET'])
+@schedule_bp.etag
+@schedule_bp.arguments(ScheduleQuerySchema, location='query')
+@schedule_bp.response(200, ScheduleViewSchema(many=True))
+@schedule_bp.doc(summary=GET_SCHEDULE_SUMMARY, description=GET_SCHEDULE_DESCRIPTION,
+                 responses=schedule_responses)
+@use_read_replica
+def get_schedule(schedule_data):
+    """
+    Retrieves the appointments of one or every employee over a range of days.
+
+    Receives the 'start' and, optionally, the 'end' and 'employee_id' query
+    arguments and returns the schedule of that day range. A 304 is
+    returned, without querying the schedule, when the client's ETag or
+    Last-Modified date is still current.
+
+    Returns:
+        JSON response:
+        - 200 (OK): Successfully retrieved the schedule.
+        - 304 (Not Modified): The client's cached schedule is current.
+        - 400 (Bad Request): Invalid day range.
+        - 404 (Not Found): Employee not found.
+        - 422 (Unprocessable Entity): Validation error.
+    """
+
+    headers = conditional_headers(schedule_bp, ['appointment'])
+
+    return get_employees_schedule(**schedule_data), headers
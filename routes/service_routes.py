@@ -3,10 +3,23 @@ Route module for Service routes.
 """
 
 from flask_smorest import Blueprint as SmorestBlueprint
+from sqlalchemy.ext.asyncio import AsyncSession
+from schemas.bulk_schema import BulkResultSchema
+from schemas.pagination_schema import PaginationSchema
 from schemas.service_schema import ServiceSchema, ServiceViewSchema
-from business.service_business import create_service
-from repositories.service_repository import get_all_services
+from business.service_business import create_service, create_services
+from repositories.service_repository import get_all_services, get_all_services_async
+from database.routing import use_read_replica
+from schemas.fast_serializer import (
+    compile_schema, fast_serialization, is_fast_serialization_enabled)
+from routes.async_listing import AsyncRequest, AsyncResponse, listing_response
+from routes.conditional import conditional_headers
+from routes.pagination import pagination_headers
+from routes.docs.pagination_doc import pagination_headers_doc
+from routes.docs.bulk_doc import BULK_RESULTS_DESCRIPTION, bulk_responses
 from routes.docs.service_doc import (
+    BULK_SERVICE_SUMMARY,
+    BULK_SERVICE_DESCRIPTION,
     GET_SERVICE_SUMMARY,
     GET_SERVICE_DESCRIPTION,
     POST_SERVICE_SUMMARY,
@@ -18,6 +31,8 @@ from routes.docs.service_doc import (
 service_bp = SmorestBlueprint(
     'Service', __name__, description='Operações em Serviços')
 
+_serialize_services = compile_schema(ServiceViewSchema(many=True))
+
 
 @service_bp.route('/service', methods=['POST'])
 @service_bp.arguments(ServiceSchema)
@@ -30,7 +45,7 @@ def add_service(service_data):
 
     This endpoint processes a form submission (JSON) to create a new service record.
 
-    Receives a JSON payload with 'name' and 'price',
+    Receives a JSON payload with 'name', 'price' and optionally 'duration',
     calls the business logic to create a service,
     and returns an appropriate response.
 
@@ -45,18 +60,71 @@ def add_service(service_data):
     return create_service(**service_data)
 
 
+@service_bp.route('/services/bulk', methods=['POST'])
+@service_bp.arguments(ServiceSchema(many=True))
+@service_bp.response(200, BulkResultSchema(many=True), description=BULK_RESULTS_DESCRIPTION)
+@service_bp.doc(summary=BULK_SERVICE_SUMMARY, description=BULK_SERVICE_DESCRIPTION,
+                responses=bulk_responses)
+def add_services(services_data):
+    """
+    Handles the creation of a batch of services.
+
+    Receives a JSON list of services, validated with the same rules as the
+    single service route, and creates every valid service in a single transaction.
+
+    Returns:
+        JSON response:
+        - 200 (OK): The result of each service, in the batch order.
+        - 400 (Bad Request): Invalid body JSON format.
+        - 422 (Unprocessable Entity): Empty or too large batch, or validation error.
+    """
+
+    return create_services(services_data)
+
+
 @service_bp.route('/services', methods=['GET'])
-@service_bp.response(200, ServiceViewSchema(many=True))
+@service_bp.etag
+@service_bp.arguments(PaginationSchema, location='query')
+@service_bp.response(200, ServiceViewSchema(many=True), headers=pagination_headers_doc)
 @service_bp.doc(summary=GET_SERVICE_SUMMARY, description=GET_SERVICE_DESCRIPTION)
-def get_services():
+@fast_serialization(ServiceViewSchema(many=True))
+@use_read_replica
+def get_services(pagination):
     """
-    Retrieve a list of all services.
+    Retrieve a page of services.
 
     This endpoint returns a collection of services records in JSON format.
+    The cursor for the next page is returned in the X-Next-Cursor header.
+    A 304 is returned, without querying the listing, when the client's
+    ETag or Last-Modified date is still current.
 
     Responses:         
         JSON response:
         - 200 (OK): Successfully retrieved the list of services.                                                     
+        - 304 (Not Modified): The client's cached list is current.
+    """
+
+    headers = conditional_headers(service_bp, ['service', 'employee', 'appointment'])
+    services, next_cursor = get_all_services(
+        **pagination, projected=is_fast_serialization_enabled())
+
+    return services, {**headers, **pagination_headers(next_cursor)}
+
+
+async def get_services_async(request: AsyncRequest, session: AsyncSession) -> AsyncResponse:
+    """
+    Async counterpart of get_services, served by the ASGI entry point.
+
+    It reads projected services with the async session and answers with the
+    same body and headers as the Flask route.
+
+    Args:
+        request (AsyncRequest): The request.
+        session (AsyncSession): The async session of the request.
+
+    Returns:
+        AsyncResponse: The page of services, a 304 or a 422.
     """
 
-    return get_all_services()
+    return await listing_response(request, session, ['service', 'employee', 'appointment'],
+                                  PaginationSchema(), get_all_services_async, _serialize_services)
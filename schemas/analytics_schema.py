@@ -0,0 +1,105 @@
+"""
+Schema module for analytics reports.
+"""
+
+from marshmallow import Schema, fields
+
+START_METADATA = {
+    'example': '2025-04-01'}
+START_DESCRIPTION = 'Primeiro dia do período.'
+END_METADATA = {
+    'example': '2025-04-30'}
+END_DESCRIPTION = 'Último dia do período, incluído. Se omitido, é o primeiro dia. ' \
+    '(O período pode ter no máximo 366 dias.)'
+EMPLOYEE_METADATA = {
+    'example': 1}
+EMPLOYEE_DESCRIPTION = 'ID do funcionário(a). Se omitido, soma todos os funcionários.'
+BOOKINGS_DESCRIPTION = 'Quantidade de agendamentos.'
+REVENUE_METADATA = {
+    'example': 150000}
+REVENUE_DESCRIPTION = 'Faturamento, em centavos.'
+BOOKED_MINUTES_DESCRIPTION = 'Duração total dos agendamentos, em minutos.'
+CAPACITY_MINUTES_DESCRIPTION = 'Minutos disponíveis para agendamento entre a abertura e o fechamento.'
+UTILIZATION_METADATA = {
+    'example': 0.6852}
+UTILIZATION_DESCRIPTION = 'Fração da capacidade ocupada pelos agendamentos.'
+
+
+class AnalyticsQuerySchema(Schema):
+    """
+    Schema for validating analytics report query arguments.
+
+    Attributes:
+        start (date): The first day of the range.
+        end (date): The last day of the range.
+    """
+
+    start = fields.Date(required=True, metadata=START_METADATA, description=START_DESCRIPTION)
+    end = fields.Date(metadata=END_METADATA, description=END_DESCRIPTION)
+
+
+class AnalyticsDaysQuerySchema(AnalyticsQuerySchema):
+    """
+    Schema for validating daily analytics report query arguments.
+
+    Attributes:
+        employee_id (int): The employee's ID.
+    """
+
+    employee_id = fields.Int(metadata=EMPLOYEE_METADATA, description=EMPLOYEE_DESCRIPTION)
+
+
+class UtilizationViewSchema(Schema):
+    """
+    Schema for serializing bookings, revenue and utilization totals for output.
+
+    Attributes:
+        bookings (int): The number of appointments.
+        revenue (int): The revenue in cents.
+        booked_minutes (int): The appointments duration in minutes.
+        capacity_minutes (int): The bookable minutes.
+        utilization (float): The share of the capacity booked.
+    """
+
+    bookings = fields.Int(description=BOOKINGS_DESCRIPTION)
+    revenue = fields.Int(metadata=REVENUE_METADATA, description=REVENUE_DESCRIPTION)
+    booked_minutes = fields.Int(description=BOOKED_MINUTES_DESCRIPTION)
+    capacity_minutes = fields.Int(description=CAPACITY_MINUTES_DESCRIPTION)
+    utilization = fields.Float(metadata=UTILIZATION_METADATA, description=UTILIZATION_DESCRIPTION)
+
+
+class DayAnalyticsViewSchema(UtilizationViewSchema):
+    """
+    Schema for serializing the totals of a day for output.
+
+    Attributes:
+        day (date): The day.
+    """
+
+    day = fields.Str()
+
+
+class EmployeeAnalyticsViewSchema(UtilizationViewSchema):
+    """
+    Schema for serializing the totals of an employee for output.
+
+    Attributes:
+        employee_id (int): The employee's ID.
+    """
+
+    employee_id = fields.Int(metadata=EMPLOYEE_METADATA)
+
+
+class ServiceAnalyticsViewSchema(Schema):
+    """
+    Schema for serializing the totals of a service for output.
+
+    Attributes:
+        service_id (int): The service ID.
+        bookings (int): The number of appointments including the service.
+        revenue (int): The service revenue in cents.
+    """
+
+    service_id = fields.Int()
+    bookings = fields.Int(description=BOOKINGS_DESCRIPTION)
+    revenue = fields.Int(metadata=REVENUE_METADATA, description=REVENUE_DESCRIPTION)
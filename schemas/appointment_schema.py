@@ -18,6 +18,10 @@ EMPLOYEE_DESCRIPTION = 'ID do funcionário(a) que irá executar o serviço.'
 SERVICES_METADATA = metadata = {
     'example': [1]}
 SERVICES_DESCRIPTION = 'Lista de serviços do agendamento.'
+HISTORICAL_METADATA = {
+    'example': True}
+HISTORICAL_DESCRIPTION = 'Indica que o lote é um histórico de agendamentos importado, ' \
+    'dispensado do período de agendamento e do horário de funcionamento.'
 
 
 class AppointmentSchema(Schema):
@@ -46,6 +50,18 @@ class AppointmentSchema(Schema):
     )
 
 
+class AppointmentBulkArgsSchema(Schema):
+    """
+    Schema for validating the query arguments of appointment batches.
+
+    Attributes:
+        historical (bool): Whether the batch is imported appointments history.
+    """
+
+    historical = fields.Bool(load_default=False, metadata=HISTORICAL_METADATA,
+                             description=HISTORICAL_DESCRIPTION)
+
+
 class AppointmentViewSchema(Schema):
     """
     Schema for serializing Appointment data for output.
@@ -53,6 +69,7 @@ class AppointmentViewSchema(Schema):
     Attributes:
         id (int): The unique identifier of the appointment.
         date (datetime): The appointment's date.
+        end_date (datetime): The date when the appointment ends.
         customer_id (int): The customer's ID.
         employee_id (int): The employee's ID.
         services_ids (List[int]): List of service IDs.
@@ -60,6 +77,7 @@ class AppointmentViewSchema(Schema):
 
     id = fields.Int(dump_only=True)
     date = fields.Str(required=True)
+    end_date = fields.Str(dump_only=True)
     customer_id = fields.Int()
     employee_id = fields.Int()
     services_ids = fields.List(
@@ -0,0 +1,47 @@
+"""
+Schema module for availability searches.
+"""
+
+from marshmallow import Schema, fields, validate
+
+SERVICES_METADATA = {
+    'example': [1]}
+SERVICES_DESCRIPTION = 'Lista de serviços a serem agendados.'
+EMPLOYEE_METADATA = {
+    'example': 1}
+EMPLOYEE_DESCRIPTION = 'ID do funcionário(a). Se omitido, busca para todos os funcionários.'
+SLOTS_METADATA = {
+    'example': ['2025-04-18 14:30:00']}
+SLOTS_DESCRIPTION = 'Horários de início disponíveis para os serviços informados.'
+
+
+class AvailabilityQuerySchema(Schema):
+    """
+    Schema for validating availability search query arguments.
+
+    Attributes:
+        services_ids (List[int]): List of service IDs to be booked.
+        employee_id (int): The employee's ID.
+    """
+
+    services_ids = fields.List(
+        fields.Int(),
+        required=True,
+        metadata=SERVICES_METADATA,
+        description=SERVICES_DESCRIPTION,
+        validate=validate.Length(min=1, max=10)
+    )
+    employee_id = fields.Int(metadata=EMPLOYEE_METADATA, description=EMPLOYEE_DESCRIPTION)
+
+
+class AvailabilityViewSchema(Schema):
+    """
+    Schema for serializing an employee's availability for output.
+
+    Attributes:
+        employee_id (int): The employee's ID.
+        slots (List[str]): The bookable start times.
+    """
+
+    employee_id = fields.Int(metadata=EMPLOYEE_METADATA)
+    slots = fields.List(fields.Str(), metadata=SLOTS_METADATA, description=SLOTS_DESCRIPTION)
@@ -0,0 +1,29 @@
+"""
+Schema module for batch creation results.
+"""
+
+from marshmallow import Schema, fields
+
+INDEX_DESCRIPTION = 'Posição do item no lote enviado.'
+STATUS_DESCRIPTION = 'Código de status do item: 201 quando criado, ou o código de erro ' \
+    'que a criação individual retornaria.'
+ID_DESCRIPTION = 'ID do registro criado. Ausente quando o item foi rejeitado.'
+ERRORS_DESCRIPTION = 'Mensagens de erro do item. Ausente quando o item foi criado.'
+
+
+class BulkResultSchema(Schema):
+    """
+    Schema for serializing the result of each item of a batch.
+
+    Attributes:
+        index (int): The item index in the batch.
+        status (int): 201 if created, otherwise the single item route error code.
+        id (int): The created record ID.
+        errors (Dict[str, List[str]]): The item error messages.
+    """
+
+    index = fields.Int(required=True, description=INDEX_DESCRIPTION)
+    status = fields.Int(required=True, description=STATUS_DESCRIPTION)
+    id = fields.Int(description=ID_DESCRIPTION)
+    errors = fields.Dict(keys=fields.Str(), values=fields.List(fields.Str()),
+                         description=ERRORS_DESCRIPTION)
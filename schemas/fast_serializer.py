@@ -0,0 +1,259 @@
+"""
+Compiled serializer for the view schemas.
+
+A view schema is compiled once into a list of attribute getters and field
+converters, skipping marshmallow's per-field dispatch and the nested schema
+dump of Pluck fields. It also serializes the records of projected listings,
+whose Pluck lists hold the plucked values themselves. The result is encoded
+with orjson when it is installed, escaped to match Flask's JSON output byte
+for byte, or with the standard library otherwise.
+"""
+
+import json
+import re
+import time
+from functools import wraps
+from typing import Any, Callable, List, Optional, Tuple
+from flask import Response, current_app
+from flask.json.provider import DefaultJSONProvider
+from flask_smorest.utils import unpack_tuple_response
+from marshmallow import Schema, fields, missing
+from marshmallow.decorators import POST_DUMP, PRE_DUMP
+from monitoring.instrumentation import record_serialization
+from repositories.projections import Plucked
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# Characters escaped by the standard library with ensure_ascii, but written as is by orjson.
+_NON_ASCII = re.compile('[\x7f-\U0010ffff]')
+_MISSING = object()
+
+Converter = Callable[[Any], Any]
+
+
+def _escape_non_ascii(match: re.Match) -> str:
+    """
+    Escapes a character as the standard library does with ensure_ascii.
+
+    Args:
+        match (re.Match): The matched character.
+
+    Returns:
+        str: The \\u escape, or a surrogate pair for characters outside the BMP.
+    """
+
+    code = ord(match.group())
+
+    if code < 0x10000:
+        return f'\\u{code:04x}'
+
+    code -= 0x10000
+
+    return f'\\u{0xd800 | (code >> 10):04x}\\u{0xdc00 | (code & 0x3ff):04x}'
+
+
+def dumps(data: Any) -> str:
+    """
+    Encodes serialized data exactly as Flask's default JSON provider does
+    outside debug mode: compact, with sorted keys and ASCII only.
+
+    Args:
+        data (Any): Data made of dicts, lists, strings, integers and None.
+
+    Returns:
+        str: The JSON document.
+    """
+
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(data, option=orjson.OPT_SORT_KEYS).decode()
+        except TypeError:
+            # Integers wider than 64 bits and lone surrogates are left to the standard library.
+            pass
+        else:
+            if encoded.isascii() and '\x7f' not in encoded:
+                return encoded
+
+            return _NON_ASCII.sub(_escape_non_ascii, encoded)
+
+    return json.dumps(data, ensure_ascii=True, sort_keys=True, separators=(',', ':'))
+
+
+def _integer(value: Any) -> Optional[int]:
+    return None if value is None else int(value)
+
+
+def _string(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def _compile_field(field: fields.Field) -> Converter:
+    """
+    Builds the converter of a field, matching its marshmallow serialization.
+
+    Args:
+        field (fields.Field): The schema field.
+
+    Returns:
+        Converter: The function converting an attribute value to its serialized value.
+
+    Raises:
+        TypeError: If the field type or options are not supported.
+    """
+
+    if field.dump_default is not missing:
+        raise TypeError(f'Field {field.name} has a dump default.')
+
+    if isinstance(field, fields.Integer) and not field.as_string:
+        return _integer
+
+    if isinstance(field, fields.String):
+        return _string
+
+    if isinstance(field, fields.List):
+        inner = _compile_field(field.inner)
+
+        if isinstance(field.inner, fields.Pluck):
+            plucked = _compile_field(field.inner.schema.fields[field.inner.field_name])
+
+            def pluck_list(value: Any) -> Any:
+                if value is None:
+                    return None
+
+                if isinstance(value, Plucked):
+                    return [plucked(item) for item in value]
+
+                return [inner(item) for item in value]
+
+            return pluck_list
+
+        return lambda value: None if value is None else [inner(item) for item in value]
+
+    if isinstance(field, fields.Pluck):
+        nested_field = field.schema.fields[field.field_name]
+        attribute = nested_field.attribute or field.field_name
+        convert = _compile_field(nested_field)
+
+        def pluck(value: Any) -> Any:
+            if value is None:
+                return None
+
+            if field.many:
+                if isinstance(value, Plucked):
+                    return [convert(item) for item in value]
+
+                return [convert(getattr(item, attribute)) for item in value]
+
+            return convert(getattr(value, attribute))
+
+        return pluck
+
+    raise TypeError(f'Field {field.name} of type {type(field).__name__} is not supported.')
+
+
+def compile_schema(schema: Schema) -> Callable[[Any], Any]:
+    """
+    Compiles a view schema into a function producing the same data as `schema.dump`.
+
+    Args:
+        schema (Schema): The view schema, with many set for listings.
+
+    Returns:
+        Callable[[Any], Any]: The serializer of an object, or of a list of
+        objects if the schema has many set.
+
+    Raises:
+        TypeError: If the schema has dump hooks or unsupported fields.
+    """
+
+    if schema._hooks.get(PRE_DUMP) or schema._hooks.get(POST_DUMP):  # pylint: disable=protected-access
+        raise TypeError(f'{type(schema).__name__} has dump hooks.')
+
+    getters: List[Tuple[str, str, Converter]] = [
+        (field.data_key or name, field.attribute or name, _compile_field(field))
+        for name, field in schema.dump_fields.items()
+    ]
+
+    def serialize(obj: Any) -> dict:
+        data = {}
+
+        for key, attribute, convert in getters:
+            value = (obj.get(attribute, _MISSING) if isinstance(obj, dict)
+                     else getattr(obj, attribute, _MISSING))
+
+            if value is not _MISSING:
+                data[key] = convert(value)
+
+        return data
+
+    if schema.many:
+        return lambda objs: [serialize(obj) for obj in objs]
+
+    return serialize
+
+
+def is_fast_serialization_enabled() -> bool:
+    """
+    Checks if the compiled serializer may replace marshmallow for this response.
+
+    It is enabled by the FAST_SERIALIZATION setting, and only used while the
+    app's JSON provider is Flask's default one in compact mode, whose output
+    it reproduces. Subclasses encoding like the default provider, such as the
+    monitoring one, opt in with a true `compiled_serializer_compatible` attribute.
+
+    Returns:
+        bool: True if the compiled serializer may be used, False otherwise.
+    """
+
+    provider = current_app.json
+
+    return (current_app.config.get('FAST_SERIALIZATION', False)
+            and (type(provider) is DefaultJSONProvider  # pylint: disable=unidiomatic-typecheck
+                 or getattr(provider, 'compiled_serializer_compatible', False))
+            and provider.ensure_ascii and provider.sort_keys
+            and (provider.compact or (provider.compact is None and not current_app.debug)))
+
+
+def fast_serialization(schema: Schema) -> Callable:
+    """
+    Serializes the view's result with the compiled serializer of its response schema.
+
+    Placed below the blueprint's response decorator, it builds the JSON response
+    itself, which the response decorator then returns as is. When disabled,
+    the result is left to the response decorator and marshmallow.
+
+    Args:
+        schema (Schema): The schema of the response decorator.
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    serialize = compile_schema(schema)
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            result = func(*args, **kwargs)
+
+            if not is_fast_serialization_enabled():
+                return result
+
+            result_raw, status_code, headers = unpack_tuple_response(result)
+
+            if isinstance(result_raw, Response):
+                return result
+
+            started = time.perf_counter()
+            body = f'{dumps(serialize(result_raw))}\n'
+            record_serialization(started)
+            response = current_app.response_class(body, mimetype=current_app.json.mimetype)
+
+            return response, status_code, headers
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,56 @@
+"""
+Schema module for paginated listing arguments.
+"""
+
+from datetime import datetime
+from marshmallow import Schema, ValidationError, fields, post_load, validate
+from repositories.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, decode_cursor
+
+LIMIT_METADATA = {
+    'example': DEFAULT_PAGE_SIZE}
+LIMIT_DESCRIPTION = f'Quantidade máxima de registros retornados (entre 1 e {MAX_PAGE_SIZE}).'
+CURSOR_METADATA = {
+    'example': 'WzEwXQ=='}
+CURSOR_DESCRIPTION = 'Cursor opaco da próxima página, retornado no cabeçalho X-Next-Cursor.'
+
+
+class PaginationSchema(Schema):
+    """
+    Schema for validating keyset pagination query arguments.
+
+    Attributes:
+        limit (int): The maximum number of records to return.
+        cursor (str): The opaque cursor returned by the previous page.
+    """
+
+    CURSOR_TYPES = (int,)
+
+    limit = fields.Int(load_default=DEFAULT_PAGE_SIZE, metadata=LIMIT_METADATA,
+                       description=LIMIT_DESCRIPTION,
+                       validate=validate.Range(min=1, max=MAX_PAGE_SIZE))
+    cursor = fields.Str(metadata=CURSOR_METADATA, description=CURSOR_DESCRIPTION)
+
+    @post_load
+    def load_cursor(self, data, **_kwargs):
+        """
+        Replaces the opaque cursor with the decoded sort key.
+        """
+
+        cursor = data.pop('cursor', None)
+
+        try:
+            data['after'] = decode_cursor(
+                cursor, self.CURSOR_TYPES) if cursor else None
+        except ValueError as error:
+            raise ValidationError('Invalid cursor.', 'cursor') from error
+
+        return data
+
+
+class AppointmentPaginationSchema(PaginationSchema):
+    """
+    Schema for validating appointment pagination query arguments,
+    whose cursor is keyed by (date, id).
+    """
+
+    CURSOR_TYPES = (datetime, int)
@@ -0,0 +1,65 @@
+"""
+Schema module for employees schedules.
+"""
+
+from marshmallow import Schema, fields
+
+START_METADATA = {
+    'example': '2025-04-18'}
+START_DESCRIPTION = 'Primeiro dia do período.'
+END_METADATA = {
+    'example': '2025-04-24'}
+END_DESCRIPTION = 'Último dia do período, incluído. Se omitido, é o primeiro dia. ' \
+    '(O período pode ter no máximo 31 dias.)'
+EMPLOYEE_METADATA = {
+    'example': 1}
+EMPLOYEE_DESCRIPTION = 'ID do funcionário(a). Se omitido, retorna a agenda de todos os funcionários.'
+SERVICES_METADATA = {
+    'example': ['Corte Social', 'Barba']}
+SERVICES_DESCRIPTION = 'Nomes dos serviços do agendamento.'
+PRICE_METADATA = {
+    'example': 7500}
+PRICE_DESCRIPTION = 'Preço total dos serviços, em centavos.'
+
+
+class ScheduleQuerySchema(Schema):
+    """
+    Schema for validating schedule search query arguments.
+
+    Attributes:
+        start (date): The first day of the range.
+        end (date): The last day of the range.
+        employee_id (int): The employee's ID.
+    """
+
+    start = fields.Date(required=True, metadata=START_METADATA, description=START_DESCRIPTION)
+    end = fields.Date(metadata=END_METADATA, description=END_DESCRIPTION)
+    employee_id = fields.Int(metadata=EMPLOYEE_METADATA, description=EMPLOYEE_DESCRIPTION)
+
+
+class ScheduleViewSchema(Schema):
+    """
+    Schema for serializing a schedule entry for output.
+
+    Attributes:
+        appointment_id (int): The appointment ID.
+        employee_id (int): The employee's ID.
+        day (date): The appointment's day.
+        date (datetime): The appointment's date.
+        end_date (datetime): The date when the appointment ends.
+        customer_id (int): The customer's ID.
+        customer_name (str): The customer's name.
+        services (List[str]): The services names.
+        price (int): The services total price in cents.
+    """
+
+    appointment_id = fields.Int()
+    employee_id = fields.Int(metadata=EMPLOYEE_METADATA)
+    day = fields.Str()
+    date = fields.Str()
+    end_date = fields.Str()
+    customer_id = fields.Int()
+    customer_name = fields.Str()
+    services = fields.List(fields.Str(), metadata=SERVICES_METADATA,
+                           description=SERVICES_DESCRIPTION)
+    price = fields.Int(metadata=PRICE_METADATA, description=PRICE_DESCRIPTION)
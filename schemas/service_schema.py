@@ -10,6 +10,10 @@ NAME_DESCRIPTION = 'Nome do Serviço'
 PRICE_METADATA = metadata = {
     'example': '4500'}
 PRICE_DESCRIPTION = 'Preço do Serviço em centavos (4500 é equivalente $45,00)'
+DURATION_METADATA = {
+    'example': 30}
+DURATION_DESCRIPTION = 'Duração do Serviço em minutos (entre 5 e 240, padrão 30)'
+DEFAULT_SERVICE_DURATION = 30
 
 
 class ServiceSchema(Schema):
@@ -19,12 +23,15 @@ class ServiceSchema(Schema):
     Attributes:
         name (str): The name of the service (min 3, max 100 characters).
         price (int): The service's price in cents.
+        duration (int): The service's duration in minutes.
     """
 
     name = fields.Str(required=True, metadata=NAME_METADATA,
                       descriptiom=NAME_DESCRIPTION, validate=validate.Length(min=3, max=100))
     price = fields.Int(
         required=True, metadata=PRICE_METADATA, description=PRICE_DESCRIPTION)
+    duration = fields.Int(load_default=DEFAULT_SERVICE_DURATION,
+                          metadata=DURATION_METADATA, description=DURATION_DESCRIPTION)
 
 
 class ServiceViewSchema(Schema):
@@ -35,6 +42,7 @@ class ServiceViewSchema(Schema):
         id (int): The unique identifier of the employee.
         name (str): The name of the employee.
         email (str): The employee's email address.
+        duration (int): The service's duration in minutes.
         employees (List[int]): The list of employees that can performe the service.
         appointment (List[int]): The list of appointment containing the service.
     """
@@ -44,6 +52,7 @@ class ServiceViewSchema(Schema):
                       descriptiom=NAME_DESCRIPTION)
     price = fields.Int(
         required=True, metadata=PRICE_METADATA, description=PRICE_DESCRIPTION)
+    duration = fields.Int(metadata=DURATION_METADATA, description=DURATION_DESCRIPTION)
     employees = fields.List(
         fields.Pluck('EmployeeViewSchema', 'id'),
         required=True,
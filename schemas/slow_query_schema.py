@@ -0,0 +1,50 @@
+"""
+Schema module for the slow query profiler aggregates.
+"""
+
+from marshmallow import Schema, fields
+
+FINGERPRINT_METADATA = {
+    'example': '3f1c2a9b8d7e6f50'}
+FINGERPRINT_DESCRIPTION = 'Impressão digital (hash) da consulta normalizada.'
+STATEMENT_METADATA = {
+    'example': 'SELECT appointment.id FROM appointment WHERE appointment.employee_id = ?'}
+STATEMENT_DESCRIPTION = 'Consulta SQL normalizada, com os valores substituídos por `?`.'
+ORIGINS_METADATA = {
+    'example': {'repositories.appointment_repository.get_employee_appointment': 12}}
+ORIGINS_DESCRIPTION = 'Número de execuções lentas por função de origem.'
+COUNT_DESCRIPTION = 'Número de execuções lentas.'
+TOTAL_DURATION_DESCRIPTION = 'Tempo total das execuções lentas, em milissegundos.'
+MAX_DURATION_DESCRIPTION = 'Tempo da execução lenta mais longa, em milissegundos.'
+PARAMETERS_DESCRIPTION = 'Impressão digital (hash) dos parâmetros da última execução lenta.'
+PLAN_METADATA = {
+    'example': ['SCAN appointment']}
+PLAN_DESCRIPTION = 'Plano de execução da consulta, obtido com EXPLAIN.'
+
+
+class SlowQueryViewSchema(Schema):
+    """
+    Schema for serializing the aggregate of a slow statement for output.
+
+    Attributes:
+        fingerprint (str): The fingerprint of the normalized statement.
+        statement (str): The normalized statement.
+        origins (Dict[str, int]): The number of slow executions, by issuing function.
+        count (int): The number of slow executions.
+        total_duration (float): The total time of the slow executions, in milliseconds.
+        max_duration (float): The longest slow execution, in milliseconds.
+        parameters (str): The parameters fingerprint of the last slow execution.
+        plan (List[str]): The query plan.
+    """
+
+    fingerprint = fields.Str(metadata=FINGERPRINT_METADATA, description=FINGERPRINT_DESCRIPTION)
+    statement = fields.Str(metadata=STATEMENT_METADATA, description=STATEMENT_DESCRIPTION)
+    origins = fields.Dict(keys=fields.Str(), values=fields.Int(),
+                          metadata=ORIGINS_METADATA, description=ORIGINS_DESCRIPTION)
+    count = fields.Int(description=COUNT_DESCRIPTION)
+    total_duration = fields.Function(lambda query: round(query.total_duration * 1000, 3),
+                                     description=TOTAL_DURATION_DESCRIPTION)
+    max_duration = fields.Function(lambda query: round(query.max_duration * 1000, 3),
+                                   description=MAX_DURATION_DESCRIPTION)
+    parameters = fields.Str(description=PARAMETERS_DESCRIPTION)
+    plan = fields.List(fields.Str(), metadata=PLAN_METADATA, description=PLAN_DESCRIPTION)
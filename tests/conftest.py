@@ -0,0 +1,52 @@
+"""
+Shared fixtures of the test suite.
+
+The app is imported from app.py, as in production, with its database
+pointed at a temporary SQLite file. Every test starts from empty tables and
+empty in-process caches.
+"""
+
+import os
+import tempfile
+
+DATABASE_DIR = tempfile.mkdtemp(prefix='barber-system-tests-')
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(DATABASE_DIR, 'database.db')}"
+os.environ.pop('DATABASE_REPLICA_URL', None)
+os.environ.pop('DATABASE_PROFILE', None)
+os.environ.pop('CACHE_REDIS_URL', None)
+
+# pylint: disable=wrong-import-position
+import pytest
+from app import app as flask_app
+from database.db_setup import db
+from database.migrations import upgrade
+from repositories.cache import cache
+from repositories.service_repository import cache_services
+
+
+@pytest.fixture(name='app')
+def app_fixture():
+    """
+    Provides the Flask app, with empty tables and caches.
+    """
+
+    with flask_app.app_context():
+        db.drop_all()
+        db.create_all()
+        upgrade(db.engine)
+        cache.local.clear()
+        cache_services([], None)
+
+    yield flask_app
+
+    with flask_app.app_context():
+        db.session.remove()
+
+
+@pytest.fixture(name='client')
+def client_fixture(app):
+    """
+    Provides a test client of the Flask app.
+    """
+
+    return app.test_client()
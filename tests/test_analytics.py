@@ -0,0 +1,106 @@
+"""
+Tests of the analytics rollups, added to by bookings and rebuilt by command.
+"""
+
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import delete
+from database.db_setup import db
+from database.models import EmployeeDayRollup, ServiceDayRollup
+
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+DAY = (datetime.now() + timedelta(days=1)).date()
+
+
+@pytest.fixture(name='booked')
+def booked_fixture(client):
+    """
+    Registers two services and two employees, and books three appointments
+    for tomorrow: both services with the first employee, and each service
+    alone with the second one.
+
+    Returns the services and employees IDs.
+    """
+
+    services = [client.post('/service', json={'name': name, 'price': price,
+                                              'duration': duration}).json['id']
+                for name, price, duration in [('Corte', 3000, 30), ('Barba', 2500, 20)]]
+    employees = [client.post('/employee', json={
+        'name': f'Funcionário {index}', 'email': f'funcionario{index}@teste.com',
+        'services': services}).json['id'] for index in range(2)]
+    customers = [client.post('/customer', json={
+        'name': f'Cliente {index}', 'email': f'cliente{index}@teste.com'}).json['id']
+        for index in range(3)]
+    start = datetime.combine(DAY, datetime.min.time()).replace(hour=10)
+
+    for employee_id, customer_id, hour, services_ids in [
+            (employees[0], customers[0], 0, services),
+            (employees[1], customers[1], 0, services[:1]),
+            (employees[1], customers[2], 1, services[1:])]:
+        response = client.post('/appointment', json={
+            'date': (start + timedelta(hours=hour)).strftime(DATE_FORMAT),
+            'services_ids': services_ids, 'customer_id': customer_id,
+            'employee_id': employee_id})
+        assert response.status_code == 201
+
+    return {'services': services, 'employees': employees}
+
+
+def reports(client):
+    """
+    Retrieves tomorrow's services, employees and day totals.
+    """
+
+    query = {'start': DAY.isoformat()}
+
+    return [client.get(f'/analytics/{report}', query_string=query).json
+            for report in ('services', 'employees', 'days')]
+
+
+def assert_totals(client, booked):
+    """
+    Checks tomorrow's totals against the booked appointments.
+    """
+
+    services, employees, days = reports(client)
+
+    assert services == [
+        {'service_id': booked['services'][0], 'bookings': 2, 'revenue': 6000},
+        {'service_id': booked['services'][1], 'bookings': 2, 'revenue': 5000}]
+    assert [(employee['employee_id'], employee['bookings'], employee['revenue'],
+             employee['booked_minutes']) for employee in employees] == [
+        (booked['employees'][0], 1, 5500, 50), (booked['employees'][1], 2, 5500, 50)]
+    assert [(day['day'], day['bookings'], day['revenue'], day['booked_minutes'])
+            for day in days] == [(DAY.isoformat(), 3, 11000, 100)]
+
+
+def test_bookings_add_to_the_rollups(client, booked):
+    """
+    Every booking adds to its day, employee and services totals.
+    """
+
+    assert_totals(client, booked)
+
+
+def test_rebuild_recomputes_the_rollups(app, client, booked):
+    """
+    The rebuild command recomputes the same totals from the appointments.
+    """
+
+    pytest.importorskip('numpy')
+    expected = reports(client)
+
+    with app.app_context():
+        db.session.execute(delete(EmployeeDayRollup))
+        db.session.execute(delete(ServiceDayRollup))
+        db.session.commit()
+
+    assert reports(client)[0] == []
+
+    with app.app_context():
+        result = app.test_cli_runner().invoke(args=['analytics', 'rebuild'])
+
+    assert result.exit_code == 0, result.output
+    assert 'from 3 appointments' in result.output
+    assert reports(client) == expected
+    assert_totals(client, booked)
@@ -0,0 +1,106 @@
+"""
+Tests of the detection of overlapping appointments.
+"""
+
+from datetime import datetime, timedelta
+import pytest
+
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+TOMORROW = datetime.combine(datetime.now().date() + timedelta(days=1),
+                            datetime.min.time())
+
+
+@pytest.fixture(name='shop')
+def shop_fixture(client):
+    """
+    Registers a 30 and a 45 minutes service, two employees performing them and
+    two customers.
+    """
+
+    services = client.post('/services/bulk', json=[
+        {'name': 'Corte', 'price': 3000, 'duration': 30},
+        {'name': 'Barba', 'price': 3000, 'duration': 45}])
+    services_ids = [result['id'] for result in services.json]
+    employees = client.post('/employees/bulk', json=[
+        {'name': f'Funcionário {index}', 'email': f'funcionario{index}@teste.com',
+         'services': services_ids} for index in range(2)])
+    customers = client.post('/customers/bulk', json=[
+        {'name': f'Cliente {index}', 'email': f'cliente{index}@teste.com'}
+        for index in range(2)])
+
+    return {'services_ids': services_ids,
+            'employees_ids': [result['id'] for result in employees.json],
+            'customers_ids': [result['id'] for result in customers.json]}
+
+
+def book(client, shop, minutes, employee=0, customer=0, services=1):
+    """
+    Books the first services at 14:00 tomorrow plus the given minutes.
+    """
+
+    date = TOMORROW.replace(hour=14) + timedelta(minutes=minutes)
+
+    return client.post('/appointment', json={
+        'date': date.strftime(DATE_FORMAT),
+        'employee_id': shop['employees_ids'][employee],
+        'customer_id': shop['customers_ids'][customer],
+        'services_ids': shop['services_ids'][:services]})
+
+
+def test_appointment_ends_after_its_services_durations(client, shop):
+    """
+    The end date is the start plus the sum of the services durations.
+    """
+
+    response = book(client, shop, 0, services=2)
+
+    assert response.status_code == 201
+    assert response.json['end_date'] == str(TOMORROW.replace(hour=15, minute=15))
+
+
+@pytest.mark.parametrize('minutes, employee, customer', [
+    (5, 0, 1), (-25, 0, 1), (0, 1, 0), (29, 1, 0)])
+def test_overlapping_bookings_conflict(client, shop, minutes, employee, customer):
+    """
+    A booking overlapping an appointment of its employee or customer is rejected.
+    """
+
+    assert book(client, shop, 0).status_code == 201
+
+    response = book(client, shop, minutes, employee, customer)
+
+    assert response.status_code == 409
+    assert response.json['errors']['json'] == {'date': ['Selecetd date is unavailable.']}
+
+
+@pytest.mark.parametrize('minutes', [30, -30])
+def test_adjacent_bookings_do_not_conflict(client, shop, minutes):
+    """
+    A booking starting when another ends, or ending when it starts, is accepted.
+    """
+
+    assert book(client, shop, 0).status_code == 201
+
+    assert book(client, shop, minutes, customer=1).status_code == 201
+
+
+def test_other_employees_and_customers_are_available(client, shop):
+    """
+    An employee and a customer with no appointment at that time can be booked.
+    """
+
+    assert book(client, shop, 0).status_code == 201
+
+    assert book(client, shop, 5, employee=1, customer=1).status_code == 201
+
+
+@pytest.mark.parametrize('duration, status', [(4, 422), (5, 201), (240, 201), (241, 422)])
+def test_service_duration_range(client, duration, status):
+    """
+    Services last between 5 and 240 minutes.
+    """
+
+    response = client.post('/service', json={
+        'name': 'Corte', 'price': 3000, 'duration': duration})
+
+    assert response.status_code == status
@@ -0,0 +1,110 @@
+"""
+Tests of the validation of a single booking.
+"""
+
+from datetime import datetime, timedelta
+import pytest
+from database.db_setup import db
+from database.models.service_appointment import service_appointment
+from tests.test_query_count import count_queries
+
+SERVICES = 10
+
+
+@pytest.fixture(name='shop')
+def shop_fixture(client):
+    """
+    Registers ten services, an employee performing them and three customers.
+    """
+
+    services = client.post('/services/bulk', json=[
+        {'name': f'Serviço {index}', 'price': 3000, 'duration': 5}
+        for index in range(SERVICES)])
+    services_ids = [result['id'] for result in services.json]
+    employee = client.post('/employee', json={
+        'name': 'Funcionário', 'email': 'funcionario@teste.com',
+        'services': services_ids})
+    customers = client.post('/customers/bulk', json=[
+        {'name': f'Cliente {index}', 'email': f'cliente{index}@teste.com'}
+        for index in range(3)])
+    assert employee.status_code == 201
+
+    return {'services_ids': services_ids, 'employee_id': employee.json['id'],
+            'customers_ids': [result['id'] for result in customers.json]}
+
+
+def booking(shop, hour, customer=0, **fields):
+    """
+    Builds the body of a booking of tomorrow at the given hour.
+    """
+
+    date = datetime.combine(datetime.now().date() + timedelta(days=1),
+                            datetime.min.time()).replace(hour=hour)
+
+    return {'date': date.strftime('%Y-%m-%d %H:%M:%S'),
+            'customer_id': shop['customers_ids'][customer],
+            'employee_id': shop['employee_id'],
+            'services_ids': shop['services_ids'][:1], **fields}
+
+
+def linked_services(app, appointment_id):
+    """
+    Lists the ID's of the services linked to an appointment.
+    """
+
+    with app.app_context():
+        return sorted(db.session.scalars(
+            db.select(service_appointment.c.service_id).where(
+                service_appointment.c.appointment_id == appointment_id)))
+
+
+def test_booking_queries_do_not_grow_with_its_services(app, client, shop):
+    """
+    A booking of ten services runs as many queries as a booking of one, once
+    the employee lookup and the service catalog are cached.
+    """
+
+    assert client.post('/appointment', json=booking(shop, 9)).status_code == 201
+
+    with count_queries(app) as statements:
+        response = client.post('/appointment', json=booking(shop, 10, customer=1))
+    single = len(statements)
+    assert response.status_code == 201
+
+    with count_queries(app) as statements:
+        response = client.post('/appointment', json=booking(
+            shop, 12, customer=2, services_ids=shop['services_ids']))
+    assert response.status_code == 201
+
+    assert len(statements) == single
+    assert linked_services(app, response.json['id']) == shop['services_ids']
+
+
+@pytest.mark.parametrize('fields, field', [
+    ({'services_ids': [999]}, 'service'),
+    ({'employee_id': 999}, 'employee'),
+    ({'customer_id': 999}, 'customer'),
+    ({'services_ids': [999], 'employee_id': 999, 'customer_id': 999}, 'service'),
+])
+def test_booking_unknown_references_are_not_found(client, shop, fields, field):
+    """
+    Unknown references are answered with a 404, services checked first.
+    """
+
+    response = client.post('/appointment', json=booking(shop, 10, **fields))
+
+    assert response.status_code == 404
+    assert list(response.json['errors']['json']) == [field]
+
+
+def test_booking_duplicated_services_are_linked_once(app, client, shop):
+    """
+    A service repeated in a booking is linked to the appointment once.
+    """
+
+    services_ids = shop['services_ids'][:1] * 2
+    response = client.post('/appointment',
+                           json=booking(shop, 10, services_ids=services_ids))
+
+    assert response.status_code == 201
+    assert linked_services(app, response.json['id']) == shop['services_ids'][:1]
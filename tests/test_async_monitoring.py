@@ -0,0 +1,59 @@
+"""
+Tests of the metrics and of the slow query profiler of the async routes.
+"""
+
+import asyncio
+import pytest
+from monitoring.metrics import registry
+from monitoring.profiler import slow_queries
+
+pytest.importorskip('aiosqlite')
+asgi = pytest.importorskip('asgi')
+
+
+def get(application, path: str) -> int:
+    """
+    Sends a GET request to the ASGI application and returns its status code.
+    """
+
+    messages = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message):
+        messages.append(message)
+
+    async def request():
+        await application({'type': 'http', 'method': 'GET', 'path': path,
+                           'query_string': b'', 'headers': []}, receive, send)
+        await application.database.dispose()
+
+    asyncio.run(request())
+
+    return messages[0]['status']
+
+
+def test_async_listing_is_recorded_and_profiled(app, client, monkeypatch):
+    """
+    An async listing is recorded in the metrics registry with its statements
+    and serialization, and its slow statements are attributed to its route.
+    """
+
+    client.post('/customer', json={'name': 'Fulano', 'email': 'fulano@teste.com'})
+    monkeypatch.setattr(app.extensions['query_profiler'], 'threshold', 0)
+    registry.clear()
+    slow_queries.clear()
+
+    assert get(asgi.AsyncApplication(asgi.ASYNC_ROUTES), '/customers') == 200
+
+    metrics = registry.routes()[('GET', '/customers')]
+    assert registry.responses() == {('GET', '/customers', 200): 1}
+    assert metrics.sql_statements.count == 1 and metrics.sql_statements.total == 2
+    assert metrics.serialization_duration.total > 0
+
+    # The table versions and the customers page.
+    queries = slow_queries.queries()
+    assert len(queries) == 2
+    assert all(dict(query.origins) == {'GET /customers': 1} for query in queries)
+    assert all(query.plan for query in queries)
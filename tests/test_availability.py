@@ -0,0 +1,31 @@
+"""
+Tests of the availability search.
+"""
+
+
+def test_unknown_service_is_reported_under_query(client):
+    """
+    An unknown service is a 404 keyed under the query arguments.
+    """
+
+    response = client.get('/availability', query_string={'services_ids': 1})
+
+    assert response.status_code == 404
+    assert response.json['errors'] == {
+        'query': {'service': ['Provided services were not found.']}}
+
+
+def test_unknown_employee_is_reported_under_query(client):
+    """
+    An unknown employee is a 404 keyed under the query arguments.
+    """
+
+    response = client.post('/service', json={'name': 'Corte', 'price': 3000})
+    assert response.status_code == 201
+
+    response = client.get('/availability', query_string={
+        'services_ids': response.json['id'], 'employee_id': 1})
+
+    assert response.status_code == 404
+    assert response.json['errors'] == {
+        'query': {'employee': ['Provided employee was not found.']}}
@@ -0,0 +1,111 @@
+"""
+Tests of the benchmark commands, on a small generated database.
+"""
+
+import json
+import pytest
+from sqlalchemy import func, inspect
+from commands.benchmark_command import HOT_INDEXES
+from database.db_setup import db
+from database.models import Appointment
+
+pytest.importorskip('numpy')
+
+SCALE = ['--customers', '100', '--employees', '4', '--services', '6',
+         '--services-per-employee', '3', '--appointments', '200']
+
+
+def invoke(app, *args):
+    """
+    Runs a benchmark command and returns its result.
+    """
+
+    with app.app_context():
+        return app.test_cli_runner().invoke(args=['benchmark', *args])
+
+
+def results(p99_ms: float) -> str:
+    """
+    Builds the results file of a run, with a single scenario.
+    """
+
+    return json.dumps({'commit': None, 'scenarios': {'GET /customers': {
+        'p50_ms': 1.0, 'p99_ms': p99_ms, 'throughput': 100.0}}})
+
+
+def test_seed_and_run(app, tmp_path):
+    """
+    A seeded database is measured, and the results are saved with its row counts.
+    """
+
+    result = invoke(app, 'seed', *SCALE)
+    assert result.exit_code == 0, result.output
+    assert 'Seeded 100 customers, 6 services, 4 employees and 200 appointments' in \
+        result.output
+
+    output = tmp_path / 'results.json'
+    result = invoke(app, 'run', '--requests', '5', '--warmup', '1',
+                    '--output', str(output),
+                    '--scenario', 'GET /customers', '--scenario', 'POST /appointment')
+    assert result.exit_code == 0, result.output
+
+    saved = json.loads(output.read_text(encoding='utf-8'))
+    assert saved['target'] == 'test-client'
+    assert saved['rows'] == {'customer': 100, 'service': 6, 'employee': 4,
+                             'appointment': 200}
+    assert list(saved['scenarios']) == ['GET /customers', 'POST /appointment']
+    assert all(measured['requests'] == 5 and measured['errors'] == 0
+               for measured in saved['scenarios'].values())
+
+    # The warm-up and measured bookings were created.
+    with app.app_context():
+        assert db.session.query(func.count(Appointment.id)).scalar() == 206
+
+
+def test_run_requires_a_seeded_database(app, tmp_path):
+    """
+    The booking scenario cannot run on an empty database.
+    """
+
+    result = invoke(app, 'run', '--requests', '1', '--output', str(tmp_path / 'r.json'),
+                    '--scenario', 'POST /appointment')
+
+    assert result.exit_code == 2
+    assert not (tmp_path / 'r.json').exists()
+
+
+@pytest.mark.parametrize('max_regression, exit_code', [(None, 0), ('50', 0), ('10', 1)])
+def test_compare(app, tmp_path, max_regression, exit_code):
+    """
+    A p99 latency growing by 20% fails the comparison only past the allowed regression.
+    """
+
+    baseline, current = tmp_path / 'baseline.json', tmp_path / 'current.json'
+    baseline.write_text(results(10.0), encoding='utf-8')
+    current.write_text(results(12.0), encoding='utf-8')
+    options = [] if max_regression is None else ['--max-regression', max_regression]
+
+    result = invoke(app, 'compare', str(baseline), str(current), *options)
+
+    assert result.exit_code == exit_code
+    assert 'p99 10.00 -> 12.00 ms (+20.0%)' in result.output
+
+
+def test_indexes_are_restored(app):
+    """
+    The hot lookups are measured without their indexes, which are created again.
+    """
+
+    assert invoke(app, 'seed', *SCALE).exit_code == 0
+
+    result = invoke(app, 'indexes', '--repeat', '1')
+
+    assert result.exit_code == 0, result.output
+    assert 'overlap check (employee or customer)' in result.output
+
+    with app.app_context():
+        inspector = inspect(db.engine)
+        names = {index['name'] for table in {index.table.name for index in HOT_INDEXES}
+                 for index in inspector.get_indexes(table)}
+
+    assert {index.name for index in HOT_INDEXES} <= names
@@ -0,0 +1,137 @@
+"""
+Stress tests of concurrent overlapping bookings.
+
+The PostgreSQL test runs against the server at TEST_POSTGRESQL_URL, in a
+database it empties, and is skipped when the variable is not set.
+"""
+
+import os
+import threading
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.exc import IntegrityError
+from database.db_setup import db
+from database.models import Appointment, Customer, Employee
+
+THREADS = 16
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+TEST_POSTGRESQL_URL = os.getenv('TEST_POSTGRESQL_URL')
+
+
+def run_concurrently(target, arguments) -> None:
+    """
+    Runs target once per argument, in threads released together.
+    """
+
+    barrier = threading.Barrier(len(arguments))
+
+    def run(argument) -> None:
+        barrier.wait()
+        target(argument)
+
+    threads = [threading.Thread(target=run, args=(argument,)) for argument in arguments]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def register(client, people: str, count: int, **fields):
+    """
+    Registers count customers or employees and returns their ID's.
+    """
+
+    name = {'customers': 'Cliente', 'employees': 'Funcionário'}[people]
+    response = client.post(f'/{people}/bulk', json=[
+        {'name': f'{name} {index}', 'email': f'{people}{index}@teste.com', **fields}
+        for index in range(count)])
+    assert response.status_code == 200
+
+    return [result['id'] for result in response.json]
+
+
+@pytest.mark.parametrize('shared', ['employee', 'customer'])
+@pytest.mark.parametrize('minutes_apart', [0, 1])
+def test_concurrent_overlapping_bookings_have_one_winner(app, client, shared,
+                                                         minutes_apart):
+    """
+    Sixteen concurrent 30 minutes bookings of the same employee, or of the
+    same customer, starting together or a minute apart, so that all of them
+    overlap, create one appointment.
+    """
+
+    service = client.post('/service', json={
+        'name': 'Corte', 'price': 3000, 'duration': 30})
+    assert service.status_code == 201
+    services_ids = [service.json['id']]
+    employees = register(client, 'employees', 1 if shared == 'employee' else THREADS,
+                         services=services_ids)
+    customers = register(client, 'customers', 1 if shared == 'customer' else THREADS)
+
+    start = datetime.combine(datetime.now().date() + timedelta(days=1),
+                             datetime.min.time()).replace(hour=10)
+    statuses = []
+
+    def book(index: int) -> None:
+        date = start + timedelta(minutes=index * minutes_apart)
+        response = app.test_client().post('/appointment', json={
+            'date': date.strftime(DATE_FORMAT), 'services_ids': services_ids,
+            'customer_id': customers[index % len(customers)],
+            'employee_id': employees[index % len(employees)]})
+        statuses.append(response.status_code)
+
+    run_concurrently(book, list(range(THREADS)))
+
+    assert sorted(statuses) == [201] + [409] * (THREADS - 1)
+
+    response = client.get('/appointments')
+    assert len(response.json) == 1
+
+
+@pytest.mark.skipif(TEST_POSTGRESQL_URL is None,
+                    reason='TEST_POSTGRESQL_URL is not set.')
+def test_postgresql_rejects_concurrent_overlapping_appointments():
+    """
+    On PostgreSQL, concurrent transactions inserting overlapping appointments
+    of the same employee starting at different times, which the availability
+    check cannot see, leave a single appointment.
+    """
+
+    engine = create_engine(TEST_POSTGRESQL_URL)
+    db.metadata.drop_all(engine)
+    db.metadata.create_all(engine)
+    start = datetime(2025, 4, 18, 10, 0)
+    committed = []
+
+    try:
+        with engine.begin() as connection:
+            employee_id = connection.execute(
+                insert(Employee).returning(Employee.id),
+                {'name': 'Funcionário', 'email': 'funcionario@teste.com'}).scalar()
+            customers_ids = connection.execute(
+                insert(Customer).returning(Customer.id),
+                [{'name': f'Cliente {index}', 'email': f'cliente{index}@teste.com'}
+                 for index in range(THREADS)]).scalars().all()
+
+        def book(index: int) -> None:
+            date = start + timedelta(minutes=index)
+            try:
+                with engine.begin() as connection:
+                    connection.execute(insert(Appointment), {
+                        'date': date, 'end_date': date + timedelta(minutes=30),
+                        'employee_id': employee_id,
+                        'customer_id': customers_ids[index]})
+                committed.append(index)
+            except IntegrityError:
+                pass
+
+        run_concurrently(book, list(range(THREADS)))
+
+        with engine.connect() as connection:
+            appointments = connection.execute(select(Appointment.id)).all()
+    finally:
+        db.metadata.drop_all(engine)
+        engine.dispose()
+
+    assert len(committed) == len(appointments) == 1
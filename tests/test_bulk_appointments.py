@@ -0,0 +1,73 @@
+"""
+Tests of the appointment batches.
+"""
+
+import pytest
+
+PAST_DATE = '2024-03-01 20:00:00'
+
+
+@pytest.fixture(name='shop')
+def shop_fixture(client):
+    """
+    Registers a service, an employee performing it and two customers.
+    """
+
+    service = client.post('/service', json={
+        'name': 'Corte', 'price': 3000, 'duration': 30})
+    employee = client.post('/employee', json={
+        'name': 'Funcionário', 'email': 'funcionario@teste.com',
+        'services': [service.json['id']]})
+    customers = client.post('/customers/bulk', json=[
+        {'name': f'Cliente {index}', 'email': f'cliente{index}@teste.com'}
+        for index in range(2)])
+
+    return {'service_id': service.json['id'], 'employee_id': employee.json['id'],
+            'customers_ids': [result['id'] for result in customers.json]}
+
+
+def appointment(shop, date, customer=0, employee_id=None):
+    """
+    Builds a batch item booking the shop's service.
+    """
+
+    return {'date': date, 'customer_id': shop['customers_ids'][customer],
+            'employee_id': employee_id or shop['employee_id'],
+            'services_ids': [shop['service_id']]}
+
+
+def test_bookings_reject_past_dates(client, shop):
+    """
+    A regular batch rejects past dates.
+    """
+
+    response = client.post('/appointments/bulk', json=[appointment(shop, PAST_DATE)])
+
+    assert response.status_code == 200
+    assert response.json == [{'index': 0, 'status': 400, 'errors': {
+        'date': ['Date is outside of allowed range.']}}]
+
+
+def test_historical_batch_accepts_past_dates_and_keeps_other_rules(client, shop):
+    """
+    A historical batch accepts past dates out of business hours, and still
+    rejects overlaps, within the batch and with booked appointments, and
+    unknown references.
+    """
+
+    batch = [
+        appointment(shop, PAST_DATE),
+        appointment(shop, '2024-03-01 20:15:00', customer=1),
+        appointment(shop, '2024-03-01 21:00:00', employee_id=shop['employee_id'] + 1),
+        appointment(shop, '2024-03-01 21:00:00'),
+    ]
+    response = client.post('/appointments/bulk', query_string={'historical': 'true'},
+                           json=batch)
+
+    assert response.status_code == 200
+    assert [result['status'] for result in response.json] == [201, 409, 404, 201]
+
+    response = client.post('/appointments/bulk', query_string={'historical': 'true'},
+                           json=[appointment(shop, PAST_DATE, customer=1)])
+
+    assert response.json[0]['status'] == 409
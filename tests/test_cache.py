@@ -0,0 +1,127 @@
+"""
+Tests of the two-tier cache of repository lookups, with fakeredis as the shared tier.
+"""
+
+import pytest
+from database.config import CACHE_MAX_ENTRIES, CACHE_TTL
+from repositories.cache import LRUCache, RedisCache, TieredCache
+from repositories.customer_repository import customer_exists, search_customer_email
+from repositories.table_version_repository import get_table_version
+
+fakeredis = pytest.importorskip('fakeredis')
+
+
+def tiered_cache(server) -> TieredCache:
+    """
+    Builds the cache of one app process, sharing the given Redis server.
+    """
+
+    return TieredCache(LRUCache(CACHE_MAX_ENTRIES, CACHE_TTL),
+                       RedisCache(fakeredis.FakeRedis(server=server), CACHE_TTL))
+
+
+@pytest.fixture(name='server')
+def server_fixture():
+    """
+    Provides a fake Redis server.
+    """
+
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture(name='customer_id')
+def customer_id_fixture(client):
+    """
+    Registers a customer and provides its ID.
+    """
+
+    response = client.post('/customer', json={
+        'name': 'Fulano', 'email': 'fulano@teste.com'})
+    assert response.status_code == 201
+
+    return response.json['id']
+
+
+def test_local_hit(app, monkeypatch, server, customer_id):
+    """
+    A repeated lookup is served by the local tier.
+    """
+
+    cache = tiered_cache(server)
+    monkeypatch.setattr('repositories.cache.cache', cache)
+
+    with app.app_context():
+        assert customer_exists(customer_id)
+        assert customer_exists(customer_id)
+
+    assert cache.stats() == {'local_hits': 1, 'shared_hits': 0, 'misses': 1,
+                             'shared_errors': 0}
+
+
+def test_shared_hit_is_promoted_to_the_local_tier(app, monkeypatch, server,
+                                                  customer_id):
+    """
+    A lookup cached by another process is read from Redis, then locally.
+    """
+
+    monkeypatch.setattr('repositories.cache.cache', tiered_cache(server))
+
+    with app.app_context():
+        assert search_customer_email('fulano@teste.com') == 'fulano@teste.com'
+
+    # Another process, sharing the Redis server, with an empty local tier.
+    cache = tiered_cache(server)
+    monkeypatch.setattr('repositories.cache.cache', cache)
+
+    with app.app_context():
+        assert search_customer_email('fulano@teste.com') == 'fulano@teste.com'
+        assert search_customer_email('fulano@teste.com') == 'fulano@teste.com'
+
+    assert cache.stats() == {'local_hits': 1, 'shared_hits': 1, 'misses': 0,
+                             'shared_errors': 0}
+
+
+def test_writes_invalidate_both_tiers(app, client, monkeypatch, server):
+    """
+    Creating a customer evicts its keys from both tiers and bumps its table version.
+    """
+
+    cache = tiered_cache(server)
+    monkeypatch.setattr('repositories.cache.cache', cache)
+    key = 'customer_exists:[1]'
+    # A stale entry for the ID the next customer gets, as left by a customer deleted
+    # outside the app, whose ID SQLite reuses.
+    cache.set(key, True)
+
+    with app.app_context():
+        version = get_table_version('customer')
+
+    response = client.post('/customer', json={
+        'name': 'Fulano', 'email': 'fulano@teste.com'})
+
+    assert response.status_code == 201 and response.json['id'] == 1
+
+    with app.app_context():
+        assert get_table_version('customer') == version + 1
+
+    assert cache.local.get(key) is None
+    assert cache.shared.get(key) is None
+
+
+def test_unavailable_shared_tier_falls_back_to_the_database(app, monkeypatch, server,
+                                                            customer_id):
+    """
+    Without Redis, lookups fall back to the local tier and the database.
+    """
+
+    server.connected = False
+    cache = tiered_cache(server)
+    monkeypatch.setattr('repositories.cache.cache', cache)
+
+    with app.app_context():
+        assert customer_exists(customer_id)
+        assert customer_exists(customer_id)
+        assert not customer_exists(customer_id + 1)
+
+    assert cache.stats() == {'local_hits': 1, 'shared_hits': 0, 'misses': 2,
+                             'shared_errors': 3}
@@ -0,0 +1,97 @@
+"""
+Tests of the conditional GET requests of the listing routes.
+"""
+
+from datetime import timedelta
+from werkzeug.http import http_date, parse_date
+
+
+def add_customer(client, index: int) -> None:
+    """
+    Registers a customer.
+    """
+
+    response = client.post('/customer', json={
+        'name': f'Cliente {index}', 'email': f'cliente{index}@teste.com'})
+    assert response.status_code == 201
+
+
+def test_etag_round_trip(client):
+    """
+    A listing is answered with a 304 while its ETag is current, and sent
+    again, with a new ETag, once its table is written.
+    """
+
+    add_customer(client, 0)
+    response = client.get('/customers')
+    etag = response.headers['ETag']
+
+    assert response.status_code == 200
+    assert response.headers['Cache-Control'] == 'no-cache'
+
+    response = client.get('/customers', headers={'If-None-Match': etag})
+
+    assert response.status_code == 304
+    assert not response.data
+
+    add_customer(client, 1)
+    response = client.get('/customers', headers={'If-None-Match': etag})
+
+    assert response.status_code == 200
+    assert len(response.json) == 2
+    assert response.headers['ETag'] != etag
+    assert client.get('/customers', headers={
+        'If-None-Match': response.headers['ETag']}).status_code == 304
+
+
+def test_etag_depends_on_the_query_arguments(client):
+    """
+    Pages of the same listing have different ETags.
+    """
+
+    add_customer(client, 0)
+    etag = client.get('/customers').headers['ETag']
+
+    response = client.get('/customers', query_string={'limit': 1},
+                          headers={'If-None-Match': etag})
+
+    assert response.status_code == 200
+
+
+def test_if_modified_since_needs_a_later_second(client):
+    """
+    A copy dated the second of the last change is sent again, since a later
+    write of that second would have the same date, while a copy dated after
+    it is answered with a 304.
+    """
+
+    add_customer(client, 0)
+    last_modified = parse_date(client.get('/customers').headers['Last-Modified'])
+
+    response = client.get('/customers',
+                          headers={'If-Modified-Since': http_date(last_modified)})
+
+    assert response.status_code == 200
+
+    later = http_date(last_modified + timedelta(seconds=1))
+    response = client.get('/customers', headers={'If-Modified-Since': later})
+
+    assert response.status_code == 304
+
+
+def test_if_none_match_takes_precedence_over_if_modified_since(client):
+    """
+    A stale ETag is sent again even when If-Modified-Since is later than the
+    last change.
+    """
+
+    add_customer(client, 0)
+    response = client.get('/customers')
+    later = http_date(parse_date(response.headers['Last-Modified']) + timedelta(hours=1))
+    etag = response.headers['ETag']
+    add_customer(client, 1)
+
+    response = client.get('/customers', headers={
+        'If-None-Match': etag, 'If-Modified-Since': later})
+
+    assert response.status_code == 200
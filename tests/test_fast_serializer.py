@@ -0,0 +1,100 @@
+"""
+Tests of the compiled serializer, against marshmallow and Flask's JSON output.
+"""
+
+import json
+import pytest
+from database.db_setup import db
+from database.models import Appointment, Customer, Employee, Service
+from schemas.appointment_schema import AppointmentViewSchema
+from schemas.customer_schema import CustomerViewSchema
+from schemas.employee_schema import EmployeeViewSchema
+from schemas.fast_serializer import compile_schema, dumps
+from schemas.service_schema import ServiceViewSchema
+from tests.test_query_count import seed
+
+LISTINGS = ['/customers', '/employees', '/services', '/appointments']
+EXPORTS = ['/customers/export', '/appointments/export']
+VIEW_SCHEMAS = [(Customer, CustomerViewSchema), (Employee, EmployeeViewSchema),
+                (Service, ServiceViewSchema), (Appointment, AppointmentViewSchema)]
+
+
+@pytest.fixture(name='seeded')
+def seeded_fixture(app):
+    """
+    Registers a few rows of every table, with non-ASCII names.
+    """
+
+    with app.app_context():
+        seed(3)
+        db.session.add(Customer('Zoë 💈', 'zoe@teste.com', appointments=[]))
+        db.session.commit()
+
+    return app
+
+
+def get_with_fast_serialization(app, path: str, enabled: bool) -> bytes:
+    """
+    Fetches a route's body with the compiled serializer enabled or disabled.
+    """
+
+    app.config['FAST_SERIALIZATION'] = enabled
+
+    try:
+        response = app.test_client().get(path, query_string={'limit': 50})
+    finally:
+        app.config['FAST_SERIALIZATION'] = True
+
+    assert response.status_code == 200
+
+    return response.data
+
+
+@pytest.mark.parametrize('path', LISTINGS + EXPORTS)
+def test_routes_bodies_match_marshmallow(seeded, path):
+    """
+    Listings and exports are byte for byte the same with both serializers.
+    """
+
+    fast = get_with_fast_serialization(seeded, path, True)
+
+    assert fast == get_with_fast_serialization(seeded, path, False)
+
+
+def test_non_ascii_characters_are_escaped(seeded):
+    """
+    Non-ASCII names are escaped, with surrogate pairs outside the BMP, as Flask does.
+    """
+
+    body = get_with_fast_serialization(seeded, '/customers', True)
+
+    assert b'"Zo\\u00eb \\ud83d\\udc88"' in body
+
+
+@pytest.mark.parametrize('model, schema_class', VIEW_SCHEMAS)
+def test_compiled_schema_matches_dump(seeded, model, schema_class):
+    """
+    A compiled view schema produces the same data as its marshmallow dump.
+    """
+
+    schema = schema_class(many=True)
+
+    with seeded.app_context():
+        rows = db.session.query(model).all()
+
+        assert rows
+        assert compile_schema(schema)(rows) == schema.dump(rows)
+
+
+@pytest.mark.parametrize('data', [
+    {'name': 'Zoë', 'emoji': '💈', 'delete': '\x7f', 'quote': '"\\\n'},
+    [2 ** 64, -2 ** 63, None, [], {}],
+    {'b': 1, 'a': {'d': 2, 'c': 3}},
+])
+def test_dumps_matches_the_standard_library(data):
+    """
+    dumps encodes like Flask's compact, sorted, ASCII-only output.
+    """
+
+    assert dumps(data) == json.dumps(data, ensure_ascii=True, sort_keys=True,
+                                     separators=(',', ':'))
@@ -0,0 +1,69 @@
+"""
+Tests of the benchmark data generator.
+"""
+
+from datetime import date
+import pytest
+from sqlalchemy import select
+from database.db_setup import db
+from database.generator import Scale, generate_data
+from database.models import Appointment, Customer, Employee, Service
+from database.models.service_appointment import service_appointment
+from database.models.service_employee import service_employee
+
+pytest.importorskip('numpy')
+
+SCALE = Scale(customers=100, employees=4, services=6, services_per_employee=3,
+              appointments=200)
+UNTIL = date(2025, 4, 18)
+
+
+def generate(app, seed: int):
+    """
+    Generates the rows of the given seed in empty tables, and returns every
+    generated row, by table.
+    """
+
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        generate_data(SCALE, seed, UNTIL)
+
+        return {table.name: db.session.execute(
+            select(table).order_by(*table.primary_key.columns)).all()
+            for table in (Customer.__table__, Service.__table__, Employee.__table__,
+                          Appointment.__table__, service_employee, service_appointment)}
+
+
+def test_same_seed_generates_same_rows(app):
+    """
+    A seed and a scale always generate the same rows.
+    """
+
+    rows = generate(app, 7)
+
+    assert {table: len(table_rows) for table, table_rows in rows.items()
+            if table != 'service_appointment'} == {
+        'customer': 100, 'service': 6, 'employee': 4, 'service_employee': 12,
+        'appointment': 200}
+    assert generate(app, 7) == rows
+    assert generate(app, 8)['appointment'] != rows['appointment']
+
+
+def test_generated_appointments_do_not_overlap(app):
+    """
+    The generated appointments are past, and no employee or customer has two
+    overlapping appointments.
+    """
+
+    appointments = generate(app, 7)['appointment']
+
+    assert all(appointment.end_date.date() < UNTIL for appointment in appointments)
+
+    for column in ('employee_id', 'customer_id'):
+        booked = {}
+
+        for appointment in sorted(appointments, key=lambda row: row.date):
+            owner = getattr(appointment, column)
+            assert booked.get(owner) is None or booked[owner] <= appointment.date
+            booked[owner] = appointment.end_date
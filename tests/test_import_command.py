@@ -0,0 +1,95 @@
+"""
+Tests of the import-data command.
+"""
+
+import json
+from datetime import datetime, timedelta
+import pytest
+from repositories.appointment_repository import get_appointments_intervals
+from validations.appointment_validation import AppointmentValidation
+
+CSV_HEADER = 'date,customer_id,employee_id,services_ids\n'
+
+
+@pytest.fixture(name='ids')
+def ids_fixture(client):
+    """
+    Registers a service, an employee performing it and a customer, and provides
+    their 'customer_id,employee_id,services_ids' CSV columns.
+    """
+
+    service = client.post('/service', json={
+        'name': 'Corte', 'price': 3000, 'duration': 30})
+    employee = client.post('/employee', json={
+        'name': 'Funcionário', 'email': 'funcionario@teste.com',
+        'services': [service.json['id']]})
+    customer = client.post('/customer', json={
+        'name': 'Cliente', 'email': 'cliente@teste.com'})
+
+    return f"{customer.json['id']},{employee.json['id']},{service.json['id']}"
+
+
+def import_appointments(app, tmp_path, dates, ids, *options):
+    """
+    Imports a CSV file of appointments at the given dates and returns the
+    command result and the rejected records.
+    """
+
+    path = tmp_path / 'agendamentos.csv'
+    path.write_text(CSV_HEADER + ''.join(f'{date},{ids}\n' for date in dates),
+                    encoding='utf-8')
+    rejects = tmp_path / 'rejeitados.ndjson'
+
+    with app.app_context():
+        result = app.test_cli_runner().invoke(args=[
+            'import-data', 'appointments', str(path), '--rejects', str(rejects),
+            *options])
+
+    assert result.exit_code == 0, result.output
+
+    return result, [json.loads(line)
+                    for line in rejects.read_text(encoding='utf-8').splitlines()]
+
+
+def test_import_accepts_past_appointments(app, tmp_path, ids):
+    """
+    Past dates out of business hours are imported, while overlaps are rejected.
+    """
+
+    result, rejected = import_appointments(app, tmp_path, [
+        '2024-03-01 10:00:00', '2024-03-01 19:30:00', '2024-03-01 10:15:00'], ids)
+
+    assert '3 records: 2 created, 1 rejected' in result.output
+    assert rejected == [{'record': 3, 'status': 409,
+                         'errors': {'date': ['Selecetd date is unavailable.']}}]
+
+
+def test_unsorted_multi_year_import_reads_bounded_windows(app, tmp_path, ids,
+                                                          monkeypatch):
+    """
+    An unsorted history spanning years is checked against the booked
+    appointments of short windows around its dates, not of the years in
+    between, and its overlaps are still found, within a chunk and across chunks.
+    """
+
+    start = datetime(2021, 1, 4, 10, 0)
+    dates = [start + timedelta(days=(index * 397) % 1200) for index in range(60)]
+    # Overlaps an earlier record of the same chunk, then a record of the first chunk.
+    dates += [dates[55] + timedelta(minutes=10), dates[3] + timedelta(minutes=20)]
+    spans = []
+
+    def spy(date, end_date, *args):
+        spans.append(end_date - date)
+        return get_appointments_intervals(date, end_date, *args)
+
+    monkeypatch.setattr(
+        'validations.appointment_validation.get_appointments_intervals', spy)
+
+    result, rejected = import_appointments(
+        app, tmp_path, [date.strftime('%Y-%m-%d %H:%M:%S') for date in dates], ids,
+        '--chunk-size', '50')
+
+    assert '62 records: 60 created, 2 rejected' in result.output
+    assert [record['record'] for record in rejected] == [61, 62]
+    assert spans
+    assert max(spans) <= AppointmentValidation.BATCH_WINDOW + timedelta(minutes=30)
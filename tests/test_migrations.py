@@ -0,0 +1,109 @@
+"""
+Tests of the upgrade of existing databases.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from sqlalchemy import delete, insert, inspect, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.schema import CreateTable
+from database.db_setup import db
+from database.migrations import _find_overlaps, upgrade
+from database.models import Appointment, Customer, Employee
+
+EMPLOYEE_INDEX = 'ix_appointment_employee_id_date'
+
+
+def _indexes() -> set:
+    """
+    Lists the indexes of the appointment table.
+    """
+
+    return {index['name'] for index in inspect(db.engine).get_indexes('appointment')}
+
+
+def test_upgrade_skips_unique_index_over_duplicated_bookings(app, caplog):
+    """
+    A unique index is skipped, and the repeated keys logged, until the
+    duplicated bookings are removed.
+    """
+
+    date = datetime(2025, 4, 18, 9, 0)
+
+    with app.app_context():
+        with db.engine.begin() as connection:
+            connection.execute(text(f'DROP INDEX {EMPLOYEE_INDEX}'))
+            connection.execute(insert(Employee), [
+                {'name': 'Funcionário', 'email': 'funcionario@teste.com'}])
+            connection.execute(insert(Customer), [
+                {'name': f'Cliente {index}', 'email': f'cliente{index}@teste.com'}
+                for index in range(2)])
+            employee_id = connection.execute(db.select(Employee.id)).scalar()
+            customers_ids = connection.execute(db.select(Customer.id)).scalars().all()
+            connection.execute(insert(Appointment), [
+                {'date': date, 'end_date': date, 'employee_id': employee_id,
+                 'customer_id': customer_id} for customer_id in customers_ids])
+
+        with caplog.at_level(logging.ERROR, logger='database.migrations'):
+            upgrade(db.engine)
+
+        assert EMPLOYEE_INDEX not in _indexes()
+        assert EMPLOYEE_INDEX in caplog.text
+        assert f'{employee_id}, {date}, 2' in caplog.text
+
+        with db.engine.begin() as connection:
+            connection.execute(delete(Appointment).where(
+                Appointment.customer_id == customers_ids[1]))
+
+        upgrade(db.engine)
+
+        assert EMPLOYEE_INDEX in _indexes()
+
+
+def test_exclusion_constraints_are_created_on_postgresql_only():
+    """
+    The appointment table has an exclusion constraint per employee and per
+    customer on PostgreSQL, and none on SQLite.
+    """
+
+    table = Appointment.__table__
+    postgresql_ddl = str(CreateTable(table).compile(dialect=postgresql.dialect()))
+
+    for column_name in ('employee_id', 'customer_id'):
+        constraint = (f'CONSTRAINT ex_appointment_{column_name}_period EXCLUDE USING '
+                      f'gist ({column_name} WITH =, tsrange(date, end_date) WITH &&)')
+        assert constraint in postgresql_ddl
+
+    assert 'EXCLUDE' not in str(CreateTable(table).compile(dialect=sqlite.dialect()))
+
+
+def test_find_overlaps_reports_overlapping_pairs(app):
+    """
+    Overlapping appointments of the same employee are reported in pairs, while
+    adjacent ones and other employees appointments are not.
+    """
+
+    start = datetime(2025, 4, 18, 9, 0)
+
+    with app.app_context():
+        with db.engine.begin() as connection:
+            connection.execute(insert(Employee), [
+                {'name': f'Funcionário {index}',
+                 'email': f'funcionario{index}@teste.com'} for index in range(2)])
+            connection.execute(insert(Customer), [
+                {'name': f'Cliente {index}', 'email': f'cliente{index}@teste.com'}
+                for index in range(4)])
+            employees_ids = connection.execute(db.select(Employee.id)).scalars().all()
+            customers_ids = connection.execute(db.select(Customer.id)).scalars().all()
+            appointments_ids = connection.execute(
+                insert(Appointment).returning(Appointment.id,
+                                              sort_by_parameter_order=True),
+                [{'date': start + timedelta(minutes=minutes),
+                  'end_date': start + timedelta(minutes=minutes + 30),
+                  'employee_id': employees_ids[employee], 'customer_id': customer_id}
+                 for (minutes, employee), customer_id in zip(
+                     [(0, 0), (10, 0), (40, 0), (0, 1)], customers_ids)]).scalars().all()
+
+            assert _find_overlaps(connection, 'employee_id') == [
+                (employees_ids[0], appointments_ids[0], appointments_ids[1])]
+            assert not _find_overlaps(connection, 'customer_id')
@@ -0,0 +1,114 @@
+"""
+Tests of the request instrumentation, and of its interplay with the compiled serializer.
+"""
+
+import pytest
+import routes.customer_routes
+import routes.streaming
+import schemas.fast_serializer
+from monitoring.instrumentation import InstrumentedJSONProvider
+from monitoring.metrics import registry
+from schemas.fast_serializer import is_fast_serialization_enabled
+
+
+@pytest.fixture(name='spy')
+def spy_fixture(monkeypatch):
+    """
+    Records the calls of the wrapped module attributes.
+    """
+
+    calls = []
+
+    def spy(module, name):
+        original = getattr(module, name)
+
+        def wrapper(*args, **kwargs):
+            calls.append((name, kwargs))
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(module, name, wrapper)
+
+    spy.calls = calls
+
+    return spy
+
+
+def test_fast_serialization_is_enabled_with_monitoring(app):
+    """
+    The instrumented JSON provider keeps the compiled serializer enabled.
+    """
+
+    assert app.config['MONITORING'] and app.config['FAST_SERIALIZATION']
+    assert isinstance(app.json, InstrumentedJSONProvider)
+
+    with app.test_request_context():
+        assert is_fast_serialization_enabled()
+
+
+def test_listing_uses_projected_query_and_compiled_serializer(client, spy):
+    """
+    A listing reads projected rows and encodes them with the compiled serializer.
+    """
+
+    client.post('/customer', json={'name': 'Fulano', 'email': 'fulano@teste.com'})
+    spy(routes.customer_routes, 'get_all_customers')
+    spy(schemas.fast_serializer, 'dumps')
+
+    response = client.get('/customers')
+
+    assert response.status_code == 200
+    assert response.json == [{'id': 1, 'name': 'Fulano', 'email': 'fulano@teste.com'}]
+    assert spy.calls == [
+        ('get_all_customers', {'limit': 50, 'after': None, 'projected': True}),
+        ('dumps', {})]
+
+
+def test_export_uses_compiled_serializer(client, spy):
+    """
+    An export encodes its rows with the compiled serializer.
+    """
+
+    client.post('/customer', json={'name': 'Fulano', 'email': 'fulano@teste.com'})
+    spy(routes.streaming, 'dumps')
+
+    response = client.get('/customers/export')
+
+    assert response.status_code == 200
+    assert response.get_data(as_text=True) == \
+        '{"email":"fulano@teste.com","id":1,"name":"Fulano"}\n'
+    assert [name for name, _ in spy.calls] == ['dumps']
+
+
+def test_requests_are_recorded(client):
+    """
+    Requests are exposed by the metrics route under their route rule.
+    """
+
+    client.get('/customers')
+
+    response = client.get('/metrics')
+
+    assert response.status_code == 200
+    assert 'route="/customers"' in response.get_data(as_text=True)
+
+
+def test_export_is_recorded_once_streamed(client):
+    """
+    An export is recorded when its stream is closed, with the statements and
+    the serialization of every exported row.
+    """
+
+    client.post('/customer', json={'name': 'Fulano', 'email': 'fulano@teste.com'})
+    registry.clear()
+
+    response = client.get('/customers/export')
+
+    assert registry.routes() == {}
+
+    response.get_data()
+    response.close()
+
+    metrics = registry.routes()[('GET', '/customers/export')]
+    assert registry.responses() == {('GET', '/customers/export', 200): 1}
+    assert metrics.sql_statements.total > 0
+    assert metrics.serialization_duration.total > 0
@@ -0,0 +1,119 @@
+"""
+Tests of the keyset pagination of the listing routes.
+"""
+
+import base64
+import json
+from datetime import datetime, timezone
+import pytest
+from repositories.pagination import DEFAULT_PAGE_SIZE, decode_cursor, encode_cursor
+
+INVALID_IDS = [[2 ** 63], [-2 ** 63 - 1], [2 ** 64], [True], ['1'], [1, 2]]
+INVALID_DATES = [datetime(2025, 4, 18, 9, 30, tzinfo=timezone.utc).isoformat(),
+                 '2025-04-18T09:30:00-03:00', 'yesterday']
+
+
+def _cursor(payload):
+    """
+    Encodes an arbitrary payload as a cursor.
+    """
+
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def _add_customers(client, count: int) -> None:
+    """
+    Registers the given number of customers.
+    """
+
+    response = client.post('/customers/bulk', json=[
+        {'name': f'Cliente {index}', 'email': f'cliente{index}@teste.com'}
+        for index in range(count)])
+
+    assert response.status_code == 200
+
+
+def test_cursor_round_trip():
+    """
+    A (date, id) key is decoded back from its cursor.
+    """
+
+    key = (datetime(2025, 4, 18, 9, 30), 42)
+
+    assert decode_cursor(encode_cursor(key), (datetime, int)) == key
+
+
+@pytest.mark.parametrize('payload', INVALID_IDS)
+def test_decode_cursor_rejects_invalid_ids(payload):
+    """
+    Ids out of the signed 64-bit range, or not integers, are rejected.
+    """
+
+    with pytest.raises(ValueError):
+        decode_cursor(_cursor(payload), (int,))
+
+
+@pytest.mark.parametrize('date', INVALID_DATES)
+def test_decode_cursor_rejects_invalid_dates(date):
+    """
+    Timezone-aware and malformed dates are rejected.
+    """
+
+    with pytest.raises(ValueError):
+        decode_cursor(_cursor([date, 1]), (datetime, int))
+
+
+def test_listing_without_limit_returns_the_default_page(client):
+    """
+    Without a limit, a listing returns its first DEFAULT_PAGE_SIZE rows and a cursor.
+    """
+
+    _add_customers(client, DEFAULT_PAGE_SIZE + 1)
+
+    response = client.get('/customers')
+
+    assert len(response.json) == DEFAULT_PAGE_SIZE
+    assert 'X-Next-Cursor' in response.headers
+
+
+def test_listing_pages_follow_the_cursor(client):
+    """
+    Following X-Next-Cursor lists every row once, in ID order.
+    """
+
+    _add_customers(client, 5)
+    ids, cursor = [], None
+
+    while True:
+        query = {'limit': 2, **({'cursor': cursor} if cursor else {})}
+        response = client.get('/customers', query_string=query)
+        assert response.status_code == 200
+        ids += [customer['id'] for customer in response.json]
+        cursor = response.headers.get('X-Next-Cursor')
+        if cursor is None:
+            break
+
+    assert ids == sorted(ids) and len(ids) == 5
+
+
+@pytest.mark.parametrize('cursor', ['WzE4NDQ2NzQ0MDczNzA5NTUxNjE2XQ==', 'not a cursor'])
+def test_listing_rejects_invalid_cursor(client, cursor):
+    """
+    An overflowing or malformed cursor is answered with a 422.
+    """
+
+    response = client.get('/customers', query_string={'cursor': cursor})
+
+    assert response.status_code == 422
+    assert 'cursor' in response.json['errors']['query']
+
+
+def test_appointments_listing_rejects_timezone_aware_cursor(client):
+    """
+    A timezone-aware appointment cursor is answered with a 422.
+    """
+
+    cursor = _cursor(['2025-04-18T09:30:00+00:00', 1])
+    response = client.get('/appointments', query_string={'cursor': cursor})
+
+    assert response.status_code == 422
@@ -0,0 +1,56 @@
+"""
+Tests of the slow query profiler.
+"""
+
+import pytest
+from monitoring.profiler import normalize_sql, slow_queries
+
+
+@pytest.fixture(name='profiled')
+def profiled_fixture(app, monkeypatch):
+    """
+    Profiles every statement, by lowering the slow query threshold to zero.
+    """
+
+    monkeypatch.setattr(app.extensions['query_profiler'], 'threshold', 0)
+    slow_queries.clear()
+
+    yield
+
+    slow_queries.clear()
+
+
+def test_normalize_sql():
+    """
+    Literals, placeholders, IN lists and inserted rows are replaced by a `?`.
+    """
+
+    assert normalize_sql(
+        "SELECT id FROM customer\n  WHERE name = 'O''Brien' AND id IN (?, ?, ?) "
+        'LIMIT 50') == 'SELECT id FROM customer WHERE name = ? AND id IN (?) LIMIT ?'
+    assert normalize_sql('INSERT INTO customer (name) VALUES (%(name)s), (%(name)s)') == \
+        'INSERT INTO customer (name) VALUES (?)'
+
+
+def test_slow_statement_is_captured_with_its_plan(client, profiled):
+    """
+    A statement slower than the threshold is aggregated by normalized
+    statement, attributed to its repository function and explained.
+    """
+
+    client.post('/customer', json={'name': 'Fulano', 'email': 'fulano@teste.com'})
+    slow_queries.clear()
+
+    client.get('/customers?limit=10')
+    client.get('/customers?limit=20')
+    response = client.get('/metrics/queries')
+
+    assert response.status_code == 200
+    listing = [query for query in response.json
+               if query['statement'].startswith('SELECT customer.id')]
+    assert len(listing) == 1
+    assert listing[0]['count'] == 2
+    assert listing[0]['origins'] == {
+        'repositories.customer_repository.get_all_customers': 2}
+    assert listing[0]['statement'].endswith('LIMIT ? OFFSET ?')
+    assert listing[0]['plan'] and listing[0]['plan'][0].startswith(('SCAN', 'SEARCH'))
@@ -0,0 +1,77 @@
+"""
+Tests of the column-projected listing queries.
+"""
+
+from datetime import datetime
+import pytest
+from sqlalchemy.dialects import postgresql, sqlite
+from database.models import service_employee
+from repositories.appointment_repository import get_all_appointments
+from repositories.customer_repository import get_all_customers
+from repositories.employee_repository import get_all_employees
+from repositories.pagination import decode_cursor
+from repositories.projections import Plucked, group_ids, parse_ids
+from repositories.service_repository import get_all_services
+from schemas.appointment_schema import AppointmentViewSchema
+from schemas.customer_schema import CustomerViewSchema
+from schemas.employee_schema import EmployeeViewSchema
+from schemas.fast_serializer import compile_schema
+from schemas.service_schema import ServiceViewSchema
+from tests.test_query_count import seed
+
+LISTINGS = [(get_all_customers, CustomerViewSchema, (int,)),
+            (get_all_employees, EmployeeViewSchema, (int,)),
+            (get_all_services, ServiceViewSchema, (int,)),
+            (get_all_appointments, AppointmentViewSchema, (datetime, int))]
+
+
+@pytest.mark.parametrize('get_all, schema_class, key_types', LISTINGS)
+def test_projected_pages_match_full_rows(app, get_all, schema_class, key_types):
+    """
+    Every page of a projected listing serializes like the page of ORM
+    instances, and points to the same next page.
+    """
+
+    schema = schema_class(many=True)
+    serialize = compile_schema(schema)
+
+    with app.app_context():
+        seed(5)
+        after, pages = None, 0
+
+        while True:
+            rows, next_cursor = get_all(2, after)
+            records, projected_cursor = get_all(2, after, projected=True)
+
+            assert serialize(records) == schema.dump(rows)
+            assert projected_cursor == next_cursor
+            pages += 1
+
+            if next_cursor is None:
+                break
+
+            after = decode_cursor(next_cursor, key_types)
+
+        assert pages == 3
+
+
+def test_parse_ids():
+    """
+    Aggregated ID's are parsed in ascending order, and missing ones as an empty list.
+    """
+
+    assert parse_ids('3,1,2') == Plucked([1, 2, 3])
+    assert parse_ids(None) == parse_ids('') == Plucked()
+
+
+def test_group_ids_compiles_per_dialect():
+    """
+    ID's are aggregated with group_concat on SQLite and string_agg on PostgreSQL.
+    """
+
+    aggregate = group_ids(service_employee.c.employee_id)
+
+    assert str(aggregate.compile(dialect=sqlite.dialect())) == (
+        'group_concat(service_employee.employee_id)')
+    assert str(aggregate.compile(dialect=postgresql.dialect())) == (
+        "string_agg(CAST(service_employee.employee_id AS TEXT), ',')")
@@ -0,0 +1,98 @@
+"""
+Tests of the number of queries run by the listing routes.
+
+A page must cost the same number of queries whatever the number of rows and
+relationships listed, so relationships are never lazy loaded row by row.
+"""
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import event
+from database.db_setup import db
+from database.models import Appointment, Customer, Employee, Service
+
+LISTINGS = ['/customers', '/employees', '/services', '/appointments']
+
+
+@contextmanager
+def count_queries(app):
+    """
+    Counts the statements run on the app's database engine inside the block.
+    """
+
+    statements = []
+
+    with app.app_context():
+        engine = db.engine
+
+    def before_cursor_execute(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def seed(size: int, offset: int = 0) -> None:
+    """
+    Registers `size` more customers, services, employees and appointments, every
+    new employee performing every new service and every appointment using two
+    services.
+    """
+
+    services = [Service(f'Serviço {index}', 1000, 30, employees=[], appointments=[])
+                for index in range(offset, offset + size)]
+    employees = [Employee(f'Funcionário {index}', f'funcionario{index}@teste.com',
+                          services=services, appointments=[])
+                 for index in range(offset, offset + size)]
+    customers = [Customer(f'Cliente {index}', f'cliente{index}@teste.com',
+                          appointments=[])
+                 for index in range(offset, offset + size)]
+    db.session.add_all([*services, *employees, *customers])
+    db.session.flush()
+
+    start = datetime(2025, 4, 18, 9, 0)
+    db.session.add_all([
+        Appointment(start + timedelta(hours=index), services[:2], employee.id,
+                    customer.id)
+        for index, (employee, customer) in enumerate(zip(employees, customers))])
+    db.session.commit()
+
+
+def listing_queries(app, client, path: str) -> int:
+    """
+    Counts the queries of one page of a listing.
+    """
+
+    with count_queries(app) as statements:
+        response = client.get(path, query_string={'limit': 50})
+
+    assert response.status_code == 200
+
+    return len(statements)
+
+
+@pytest.mark.parametrize('fast_serialization', [True, False])
+@pytest.mark.parametrize('path', LISTINGS)
+def test_listing_query_count_is_constant(app, client, path, fast_serialization):
+    """
+    A page of 32 rows runs as many queries as a page of 2 rows.
+    """
+
+    app.config['FAST_SERIALIZATION'] = fast_serialization
+
+    try:
+        with app.app_context():
+            seed(2)
+        small = listing_queries(app, client, path)
+
+        with app.app_context():
+            seed(30, offset=2)
+        large = listing_queries(app, client, path)
+    finally:
+        app.config['FAST_SERIALIZATION'] = True
+
+    assert small == large
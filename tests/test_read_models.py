@@ -0,0 +1,60 @@
+"""
+Tests of the compact read models.
+"""
+
+import random
+from datetime import datetime, timedelta
+from repositories.read_models import Schedule
+
+START = datetime(2025, 4, 18, 9, 0)
+
+
+def minutes(value: int) -> datetime:
+    """
+    Builds the date the given minutes after START.
+    """
+
+    return START + timedelta(minutes=value)
+
+
+def test_overlaps_an_earlier_long_interval():
+    """
+    A period is found overlapping a long interval that starts several
+    intervals before it.
+    """
+
+    schedule = Schedule()
+    schedule.add(minutes(0), minutes(240))
+    schedule.add(minutes(30), minutes(60))
+
+    assert schedule.overlaps(minutes(90), minutes(120))
+    assert not schedule.overlaps(minutes(240), minutes(270))
+
+
+def test_overlaps_matches_a_linear_scan():
+    """
+    overlaps agrees with a scan of every interval, on random schedules.
+    """
+
+    generator = random.Random(0)
+
+    for _ in range(200):
+        intervals = [(start, start + generator.randint(1, 180))
+                     for start in (generator.randint(0, 600) for _ in range(10))]
+        added = Schedule()
+
+        for start, end in intervals:
+            added.add(minutes(start), minutes(end))
+
+        built = Schedule.from_appointments(
+            type('Booked', (), {'date': minutes(start), 'end_date': minutes(end)})
+            for start, end in intervals)
+
+        for _ in range(20):
+            start = generator.randint(0, 800)
+            end = start + generator.randint(1, 120)
+            expected = any(other_start < end and start < other_end
+                           for other_start, other_end in intervals)
+
+            assert added.overlaps(minutes(start), minutes(end)) == expected
+            assert built.overlaps(minutes(start), minutes(end)) == expected
@@ -0,0 +1,102 @@
+"""
+Tests of the schedule read model, written with the appointments.
+"""
+
+from datetime import datetime, timedelta
+import pytest
+
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+@pytest.fixture(name='shop')
+def shop_fixture(client):
+    """
+    Registers two services, two employees performing them and a customer.
+    """
+
+    services = [client.post('/service', json={'name': name, 'price': price,
+                                              'duration': 30}).json['id']
+                for name, price in [('Corte', 3000), ('Barba', 2500)]]
+    employees = [client.post('/employee', json={
+        'name': f'Funcionário {index}', 'email': f'funcionario{index}@teste.com',
+        'services': services}).json['id'] for index in range(2)]
+    customer = client.post('/customer', json={
+        'name': 'Fulano', 'email': 'fulano@teste.com'}).json['id']
+
+    return {'services': services, 'employees': employees, 'customer': customer}
+
+
+def tomorrow(hour: int) -> datetime:
+    """
+    Provides tomorrow's date at the given hour.
+    """
+
+    return datetime.combine(datetime.now().date() + timedelta(days=1),
+                            datetime.min.time()).replace(hour=hour)
+
+
+def test_booking_writes_its_schedule_entry(client, shop):
+    """
+    A booking is listed in its employee's schedule of the day, with the
+    customer name and the services names and total price.
+    """
+
+    date = tomorrow(10)
+    response = client.post('/appointment', json={
+        'date': date.strftime(DATE_FORMAT), 'services_ids': shop['services'],
+        'customer_id': shop['customer'], 'employee_id': shop['employees'][0]})
+    assert response.status_code == 201
+
+    response = client.get('/schedule', query_string={'start': date.date().isoformat()})
+
+    assert response.status_code == 200
+    assert response.json == [{
+        'appointment_id': response.json[0]['appointment_id'],
+        'employee_id': shop['employees'][0], 'day': date.date().isoformat(),
+        'date': str(date), 'end_date': str(date + timedelta(hours=1)),
+        'customer_id': shop['customer'], 'customer_name': 'Fulano',
+        'services': ['Corte', 'Barba'], 'price': 5500}]
+
+
+def test_bulk_booking_writes_schedule_entries(client, shop):
+    """
+    Every appointment of a bulk booking is listed in its employee's schedule,
+    ordered by employee and date, and the schedule can be read for one employee.
+    """
+
+    dates = [tomorrow(14), tomorrow(9)]
+    response = client.post('/appointments/bulk', json=[
+        {'date': date.strftime(DATE_FORMAT), 'services_ids': shop['services'][:1],
+         'customer_id': shop['customer'], 'employee_id': employee_id}
+        for date, employee_id in zip(dates, reversed(shop['employees']))])
+    assert response.status_code == 200
+
+    day = dates[0].date().isoformat()
+    schedule = client.get('/schedule', query_string={'start': day}).json
+
+    assert [(entry['employee_id'], entry['date']) for entry in schedule] == [
+        (shop['employees'][0], str(dates[1])),
+        (shop['employees'][1], str(dates[0]))]
+    assert all(entry['services'] == ['Corte'] and entry['price'] == 3000
+               for entry in schedule)
+
+    response = client.get('/schedule', query_string={
+        'start': day, 'employee_id': shop['employees'][1]})
+
+    assert [entry['date'] for entry in response.json] == [str(dates[0])]
+
+
+def test_invalid_schedule_searches(client, shop):
+    """
+    Ranges ending before they start and unknown employees are rejected.
+    """
+
+    day = tomorrow(10).date()
+
+    response = client.get('/schedule', query_string={
+        'start': day.isoformat(), 'end': (day - timedelta(days=1)).isoformat()})
+    assert response.status_code == 400
+
+    response = client.get('/schedule', query_string={
+        'start': day.isoformat(), 'employee_id': shop['employees'][-1] + 1})
+    assert response.status_code == 404
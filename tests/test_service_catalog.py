@@ -0,0 +1,81 @@
+"""
+Tests of the in-process service catalog.
+"""
+
+from sqlalchemy import insert, update
+from database.db_setup import db
+from database.models import Service, TableVersion
+from repositories.service_repository import get_service, get_service_by_name
+from tests.test_query_count import count_queries
+
+
+def lookup_queries(app, name: str):
+    """
+    Looks a service up by name in a new application context, as a request
+    does, and lists the queries it ran.
+    """
+
+    with count_queries(app) as statements, app.app_context():
+        service = get_service_by_name(name)
+        assert get_service_by_name(name) == service
+
+    return service, statements
+
+
+def test_catalog_lookups_only_read_the_table_version(app, client):
+    """
+    Once loaded, the catalog is served with one table version query per
+    application context, whatever the number of lookups.
+    """
+
+    response = client.post('/service', json={'name': 'Corte', 'price': 3000})
+    assert response.status_code == 201
+
+    lookup_queries(app, 'Corte')
+    service, statements = lookup_queries(app, 'Corte')
+
+    assert service.id == response.json['id']
+    assert len(statements) == 1
+    assert 'table_version' in statements[0]
+
+
+def test_created_services_are_written_through(app, client):
+    """
+    A service created by this process is added to the catalog without
+    reloading the service table.
+    """
+
+    client.post('/service', json={'name': 'Corte', 'price': 3000})
+    lookup_queries(app, 'Corte')
+
+    response = client.post('/services/bulk', json=[
+        {'name': 'Barba', 'price': 3000}, {'name': 'Sobrancelha', 'price': 2500}])
+    service, statements = lookup_queries(app, 'Sobrancelha')
+
+    assert service.id == response.json[1]['id']
+    assert not [statement for statement in statements if 'FROM service' in statement]
+
+
+def test_services_created_by_another_process_are_loaded(app, client):
+    """
+    A service committed by another process, which bumps the table version,
+    is found on the next lookup.
+    """
+
+    client.post('/service', json={'name': 'Corte', 'price': 3000})
+    lookup_queries(app, 'Corte')
+
+    with app.app_context(), db.engine.begin() as connection:
+        connection.execute(insert(Service),
+                           {'name': 'Barba', 'price': 3000, 'duration': 45})
+        connection.execute(update(TableVersion)
+                           .where(TableVersion.table_name == 'service')
+                           .values(version=TableVersion.version + 1))
+
+    service, statements = lookup_queries(app, 'Barba')
+
+    assert service.duration == 45
+    assert [statement for statement in statements if 'FROM service' in statement]
+
+    with app.app_context():
+        assert get_service(service.id) == service
@@ -0,0 +1,59 @@
+"""
+Validation module for analytics reports.
+"""
+
+from typing import Optional
+from datetime import date
+from flask_smorest import abort
+from repositories.employee_repository import employee_exists
+
+
+class AnalyticsValidation():
+    """
+    Validation class for analytics reports.
+    """
+
+    MAX_REPORT_DAYS = 366
+
+    @staticmethod
+    def _is_range_valid(start: date, end: date) -> bool:
+        """
+        Checks if the range ends after it starts and spans at most MAX_REPORT_DAYS days.
+
+        Args:
+            start (date): The first day of the range.
+            end (date): The last day of the range.
+
+        Returns:
+            bool: True if the range is valid, False otherwise.
+        """
+
+        return 0 <= (end - start).days < AnalyticsValidation.MAX_REPORT_DAYS
+
+    @staticmethod
+    def validate_report(start: date, end: date, employee_id: Optional[int] = None) -> None:
+        """
+        Validates analytics report.
+
+        Args:
+            start (date): The first day of the range.
+            end (date): The last day of the range.
+            employee_id (Optional[int]): The employee's ID.
+
+        Raises:
+            HTTPException: If any validation fails.
+        """
+
+        if not AnalyticsValidation._is_range_valid(start, end):
+            abort(400, errors={
+                'query': {
+                    'end': ['Range must end after it starts and span at most 366 days.']
+                }
+            })
+
+        if employee_id is not None and not employee_exists(employee_id):
+            abort(404, errors={
+                'query': {
+                    'employee': ['Provided employee was not found.']
+                }
+            })
@@ -2,13 +2,18 @@
 Validation module for Appointment entities.
 """
 
-from typing import List
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime, timedelta, time
 from flask_smorest import abort
-from repositories.employee_repository import get_employee
-from repositories.customer_repository import get_customer
-from repositories.service_repository import get_service
-from repositories.appointment_repository import get_customer_appointment, get_employee_appointment
+from database.models.appointment import Appointment
+from validations.bulk_validation import BatchErrors, BulkValidation
+from validations.service_validation import MAX_SERVICE_DURATION
+from repositories.read_models import CatalogEntry, Schedule
+from repositories.service_repository import get_services_by_services_ids
+from repositories.customer_repository import customer_exists, get_customers_ids
+from repositories.employee_repository import employee_exists, get_employees_ids
+from repositories.appointment_repository import get_appointments_intervals
 
 
 class AppointmentValidation():
@@ -19,6 +24,12 @@ class AppointmentValidation():
     MAX_ADVANCE_DAYS = 7
     OPENING_TIME = time(9, 0)
     CLOSING_TIME = time(18, 0)
+    # AppointmentSchema accepts at most 10 services per appointment.
+    MAX_APPOINTMENT_DURATION = timedelta(minutes=10 * MAX_SERVICE_DURATION)
+    # Longest period whose booked appointments are read with a single query when
+    # validating a batch, which covers every new booking at once.
+    BATCH_WINDOW = timedelta(days=MAX_ADVANCE_DAYS)
+    DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
 
     @staticmethod
     def _is_date_in_valid_range(date: datetime) -> bool:
@@ -50,78 +61,68 @@ class AppointmentValidation():
         return AppointmentValidation.OPENING_TIME <= date.time() < AppointmentValidation.CLOSING_TIME
 
     @staticmethod
-    def _are_services_valid(services_ids: List[int]) -> bool:
+    def _are_services_valid(services_ids: List[int], services: List[CatalogEntry]) -> bool:
         """
         Checks if all provided services ID's exists.
 
         Args:
             services_ids (List[int]): List of service IDs.
+            services (List[CatalogEntry]): The services found for the provided IDs.
 
         Returns:
             bool: True if all servicse were found, False otherwise.
         """
 
-        return all(get_service(service_id) is not None for service_id in services_ids)
+        return {service.id for service in services} == set(services_ids)
 
     @staticmethod
-    def _is_employee_valid(employee_id: int) -> bool:
+    def _batch_windows(periods: Dict[int, Tuple[datetime, datetime]]
+                       ) -> Iterator[Tuple[datetime, datetime, List[int]]]:
         """
-        Checks if the provided employee exists.
+        Splits a batch's periods into windows of at most BATCH_WINDOW, by start date.
 
         Args:
-            employee_id (int): The employee's ID.
+            periods (Dict[int, Tuple[datetime, datetime]]): The start and end dates
+                of the batch items, by index.
 
         Returns:
-            bool: True if employee was found, False otherwise.
+            Iterator[Tuple[datetime, datetime, List[int]]]: The start and end dates
+            of each window, with the indexes of its items.
         """
 
-        return get_employee(employee_id) is not None
-
-    @staticmethod
-    def _is_customer_valid(customer_id: int) -> bool:
-        """
-        Checks if the provided customer exists.
+        indexes = sorted(periods, key=lambda index: periods[index][0])
+        window: List[int] = []
 
-        Args:
-            customer_id (int): The customer's ID.
+        for index in indexes:
+            if window and (periods[index][0] - periods[window[0]][0]
+                           > AppointmentValidation.BATCH_WINDOW):
+                yield periods[window[0]][0], max(periods[item][1] for item in window), window
+                window = []
 
-        Returns:
-            bool: True if customer was found, False otherwise.
-        """
+            window.append(index)
 
-        return get_customer(customer_id) is not None
-
-    @staticmethod
-    def _is_date_available(date: datetime, employee_id: int, customer_id: int) -> bool:
-        """
-        Checks if the given appointment time conflicts with any existing appointments
-        for the provided customer or employee.
-
-        Args:
-            date (datetime): The appointment's date.
-            employee_id (int): The employee's ID.
-            customer_id (int): The customer's ID.
-
-        Returns:
-            bool: True if the date is available, False otherwise.
-        """
-
-        return not get_customer_appointment(date, customer_id) and not get_employee_appointment(
-            date, employee_id
-        )
+        yield periods[window[0]][0], max(periods[item][1] for item in window), window
 
     @staticmethod
     def validate_appointment(date: datetime, customer_id: int,
-                             employee_id: int, services_ids: List[int]) -> None:
+                             employee_id: int, services_ids: List[int]) -> List[CatalogEntry]:
         """
         Validates appointment.
 
+        The services are resolved from the service catalog and the employee and
+        customer existence from the repository cache, so a repeated booking
+        costs no query here. The date availability is checked when the
+        appointment is inserted.
+
         Args:
             date (datetime): The appointment's date.
             customer_id (int): The customer's ID.
             employee_id (int): The employee's ID.
             services_ids (List[int]): List of service IDs.
 
+        Returns:
+            List[CatalogEntry]: The appointment's services, so they are not loaded again.
+
         Raises:
             HTTPException: If any validation fails.
         """
@@ -140,30 +141,138 @@ class AppointmentValidation():
                 }
             })
 
-        if not AppointmentValidation._is_date_available(date, employee_id, customer_id):
-            abort(409, errors={
-                'json': {
-                    'date': ['Selecetd date is unavailable.']
-                }
-            })
+        services = get_services_by_services_ids(services_ids)
 
-        if not AppointmentValidation._are_services_valid(services_ids):
+        if not AppointmentValidation._are_services_valid(services_ids, services):
             abort(404, errors={
                 'json': {
                     'service': ['Provided services were not found.']
                 }
             })
 
-        if not AppointmentValidation._is_employee_valid(employee_id):
+        if not employee_exists(employee_id):
             abort(404, errors={
                 'json': {
                     'employee': ['Provided employee was not found.']
                 }
             })
 
-        if not AppointmentValidation._is_customer_valid(customer_id):
+        if not customer_exists(customer_id):
             abort(404, errors={
                 'json': {
                     'customer': ['Provided customer was not found.']
                 }
             })
+
+        return services
+
+    @staticmethod
+    def validate_appointments_batch(appointments: List[Dict[str, Any]], historical: bool = False
+                                    ) -> Tuple[BatchErrors, Dict[int, Tuple[datetime, datetime]]]:
+        """
+        Validates a batch of appointments with the same rules as validate_appointment,
+        including the date availability.
+
+        The employees and customers existence is checked with one query each and
+        the services against the service catalog. The availability is checked
+        against the booked appointments and against the previous items of the
+        batch. The booked appointments are read with one query per window of
+        BATCH_WINDOW of the batch dates, for the employees and customers of
+        that window only, so an unsorted batch spanning years, such as an
+        imported history, does not load every appointment in between.
+
+        Historical batches, such as the appointments history of a migrated shop,
+        skip the booking window and business hours rules, which only apply to
+        new bookings. Every other rule still applies.
+
+        Args:
+            appointments (List[Dict[str, Any]]): The appointments 'date',
+                'customer_id', 'employee_id' and 'services_ids'.
+            historical (bool): Whether the appointments are imported history
+                rather than new bookings.
+
+        Returns:
+            Tuple[BatchErrors, Dict[int, Tuple[datetime, datetime]]]: The rejected
+            appointments, and the start and end dates of the accepted ones by index.
+        """
+
+        errors: BatchErrors = {}
+        periods = {}
+        employees = get_employees_ids([item['employee_id'] for item in appointments])
+        customers = get_customers_ids([item['customer_id'] for item in appointments])
+
+        # Batches usually repeat the same slots, so each distinct date is parsed once.
+        dates: Dict[str, Optional[datetime]] = {}
+
+        for index, appointment in enumerate(appointments):
+            if appointment['date'] not in dates:
+                try:
+                    dates[appointment['date']] = datetime.strptime(
+                        appointment['date'], AppointmentValidation.DATE_FORMAT)
+                except ValueError:
+                    dates[appointment['date']] = None
+
+            date = dates[appointment['date']]
+
+            if date is None:
+                BulkValidation.add_error(errors, index, 422, 'date', 'Not a valid datetime.')
+                continue
+
+            if not historical and not AppointmentValidation._is_date_in_valid_range(date):
+                BulkValidation.add_error(errors, index, 400, 'date',
+                                         'Date is outside of allowed range.')
+
+            if (not historical
+                    and not AppointmentValidation._is_time_in_business_hours_range(date)):
+                BulkValidation.add_error(errors, index, 400, 'date',
+                                         'Hour is outside of working hours.')
+
+            services = get_services_by_services_ids(appointment['services_ids'])
+
+            if not AppointmentValidation._are_services_valid(appointment['services_ids'],
+                                                             services):
+                BulkValidation.add_error(errors, index, 404, 'service',
+                                         'Provided services were not found.')
+
+            if appointment['employee_id'] not in employees:
+                BulkValidation.add_error(errors, index, 404, 'employee',
+                                         'Provided employee was not found.')
+
+            if appointment['customer_id'] not in customers:
+                BulkValidation.add_error(errors, index, 404, 'customer',
+                                         'Provided customer was not found.')
+
+            if index not in errors:
+                periods[index] = (date, Appointment.get_end_date(date, services))
+
+        if not periods:
+            return errors, periods
+
+        booked: Dict[Tuple[str, int], Schedule] = defaultdict(Schedule)
+        # Appointments crossing the edge of two windows are read by both queries.
+        intervals = set()
+
+        for date, end_date, window in AppointmentValidation._batch_windows(periods):
+            intervals.update(get_appointments_intervals(
+                date, end_date, AppointmentValidation.MAX_APPOINTMENT_DURATION,
+                [appointments[index]['employee_id'] for index in window],
+                [appointments[index]['customer_id'] for index in window]))
+
+        for employee_id, customer_id, date, end_date in intervals:
+            booked['employee', employee_id].add(date, end_date)
+            booked['customer', customer_id].add(date, end_date)
+
+        for index, (date, end_date) in list(periods.items()):
+            employee = booked['employee', appointments[index]['employee_id']]
+            customer = booked['customer', appointments[index]['customer_id']]
+
+            if employee.overlaps(date, end_date) or customer.overlaps(date, end_date):
+                BulkValidation.add_error(errors, index, 409, 'date',
+                                         'Selecetd date is unavailable.')
+                del periods[index]
+                continue
+
+            employee.add(date, end_date)
+            customer.add(date, end_date)
+
+        return errors, periods
@@ -0,0 +1,64 @@
+"""
+Validation module for availability searches.
+"""
+
+from typing import List, Optional
+from flask_smorest import abort
+from repositories.employee_repository import employee_exists
+from repositories.read_models import CatalogEntry
+from repositories.service_repository import get_services_by_services_ids
+
+
+class AvailabilityValidation():
+    """
+    Validation class for availability searches.
+    """
+
+    @staticmethod
+    def _is_employee_valid(employee_id: Optional[int]) -> bool:
+        """
+        Checks if the provided employee, if any, exists.
+
+        Args:
+            employee_id (Optional[int]): The employee's ID.
+
+        Returns:
+            bool: True if no employee was provided or if it was found, False otherwise.
+        """
+
+        return employee_id is None or employee_exists(employee_id)
+
+    @staticmethod
+    def validate_availability(services_ids: List[int],
+                              employee_id: Optional[int]) -> List[CatalogEntry]:
+        """
+        Validates availability search.
+
+        Args:
+            services_ids (List[int]): List of service IDs.
+            employee_id (Optional[int]): The employee's ID.
+
+        Returns:
+            List[CatalogEntry]: The searched services.
+
+        Raises:
+            HTTPException: If any validation fails.
+        """
+
+        services = get_services_by_services_ids(services_ids)
+
+        if {service.id for service in services} != set(services_ids):
+            abort(404, errors={
+                'query': {
+                    'service': ['Provided services were not found.']
+                }
+            })
+
+        if not AvailabilityValidation._is_employee_valid(employee_id):
+            abort(404, errors={
+                'query': {
+                    'employee': ['Provided employee was not found.']
+                }
+            })
+
+        return services
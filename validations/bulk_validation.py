@@ -0,0 +1,55 @@
+"""
+Validation module for batches of entities.
+"""
+
+from typing import Any, Dict, List, Tuple
+from flask_smorest import abort
+
+MAX_BATCH_SIZE = 10000
+
+# Maps the index of each rejected item to its status code and error messages.
+BatchErrors = Dict[int, Tuple[int, Dict[str, List[str]]]]
+
+
+class BulkValidation():
+    """
+    Validation class for batches of entities.
+    """
+
+    @staticmethod
+    def add_error(errors: BatchErrors, index: int, status: int,
+                  field: str, message: str) -> None:
+        """
+        Rejects a batch item, unless it was already rejected by an earlier check.
+
+        Only the first error of an item is kept, as the single item routes
+        stop at the first failed validation.
+
+        Args:
+            errors (BatchErrors): The batch errors found so far.
+            index (int): The item index in the batch.
+            status (int): The status code the single item route would return.
+            field (str): The invalid field.
+            message (str): The error message.
+        """
+
+        errors.setdefault(index, (status, {field: [message]}))
+
+    @staticmethod
+    def validate_batch_size(items: List[Any]) -> None:
+        """
+        Validates the number of items of a batch.
+
+        Args:
+            items (List[Any]): The batch items.
+
+        Raises:
+            HTTPException: If the batch is empty or too large.
+        """
+
+        if not 1 <= len(items) <= MAX_BATCH_SIZE:
+            abort(422, errors={
+                'json': {
+                    'batch': [f'Batch must have between 1 and {MAX_BATCH_SIZE} items.']
+                }
+            })
@@ -2,8 +2,10 @@
 Validation module for Customer entities.
 """
 
+from typing import Dict, List
 from flask_smorest import abort
-from repositories.customer_repository import search_customer_email
+from repositories.customer_repository import search_customer_email, search_customers_emails
+from validations.bulk_validation import BatchErrors, BulkValidation
 
 
 class CustomerValidation():
@@ -43,3 +45,31 @@ class CustomerValidation():
                     'email': ['Email already registered.']
                 }
             })
+
+    @staticmethod
+    def validate_customers_batch(customers: List[Dict[str, str]]) -> BatchErrors:
+        """
+        Validates a batch of customers with the same rules as validate_customer.
+
+        Emails are checked against the database with a single query, and
+        against the previous items of the batch.
+
+        Args:
+            customers (List[Dict[str, str]]): The customers 'name' and 'email'.
+
+        Returns:
+            BatchErrors: The rejected customers.
+        """
+
+        errors: BatchErrors = {}
+        registered = search_customers_emails([customer['email'] for customer in customers])
+        batch_emails = set()
+
+        for index, customer in enumerate(customers):
+            if customer['email'] in registered or customer['email'] in batch_emails:
+                BulkValidation.add_error(errors, index, 409, 'email',
+                                         'Email already registered.')
+
+            batch_emails.add(customer['email'])
+
+        return errors
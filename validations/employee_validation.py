@@ -2,11 +2,12 @@
 Validation module for Employee entities.
 """
 
-from typing import List
+from typing import Any, Dict, List
 from flask_smorest import abort
 from database.models.service import Service
 from repositories.service_repository import get_services_count, get_service
-from repositories.employee_repository import search_employee_email
+from repositories.employee_repository import search_employee_email, search_employees_emails
+from validations.bulk_validation import BatchErrors, BulkValidation
 
 
 class EmployeeValidation():
@@ -87,3 +88,41 @@ class EmployeeValidation():
                     'service': ['Service not found.']
                 }
             })
+
+    @staticmethod
+    def validate_employees_batch(employees: List[Dict[str, Any]]) -> BatchErrors:
+        """
+        Validates a batch of employees with the same rules as validate_employee.
+
+        Emails are checked against the database with a single query, and
+        against the previous items of the batch. Services are checked against
+        the service catalog.
+
+        Args:
+            employees (List[Dict[str, Any]]): The employees 'name', 'email' and 'services' ID's.
+
+        Returns:
+            BatchErrors: The rejected employees.
+        """
+
+        errors: BatchErrors = {}
+        registered = search_employees_emails([employee['email'] for employee in employees])
+        services_is_empty = EmployeeValidation._services_is_empty()
+        batch_emails = set()
+
+        for index, employee in enumerate(employees):
+            if employee['email'] in registered or employee['email'] in batch_emails:
+                BulkValidation.add_error(errors, index, 409, 'email',
+                                         'Email already registered.')
+
+            if services_is_empty:
+                BulkValidation.add_error(
+                    errors, index, 422, 'service',
+                    'A service must be registered before registering an employee.')
+
+            if not EmployeeValidation._are_services_valid(employee['services']):
+                BulkValidation.add_error(errors, index, 404, 'service', 'Service not found.')
+
+            batch_emails.add(employee['email'])
+
+        return errors
@@ -2,11 +2,15 @@
 Validation module for Service entities.
 """
 
+from typing import Any, Dict, List
 from flask_smorest import abort
 from repositories.service_repository import get_service_by_name
+from validations.bulk_validation import BatchErrors, BulkValidation
 
 MAX_SERVICE_PRICE = 10000
 MIN_SERVICE_PRICE = 2500
+MAX_SERVICE_DURATION = 240
+MIN_SERVICE_DURATION = 5
 
 
 class ServiceValidation():
@@ -28,6 +32,20 @@ class ServiceValidation():
 
         return MIN_SERVICE_PRICE <= price <= MAX_SERVICE_PRICE
 
+    @staticmethod
+    def _is_duration_in_valid_range(duration: int) -> bool:
+        """
+        Checks if the given duration is inside the specified duration range.
+
+        Args:
+            duration (int): The duration to check, in minutes.
+
+        Returns:
+            bool: True if the duration is in valid duration range, False otherwise.
+        """
+
+        return MIN_SERVICE_DURATION <= duration <= MAX_SERVICE_DURATION
+
     @staticmethod
     def _is_service_already_registered(name: str) -> bool:
         """
@@ -43,13 +61,14 @@ class ServiceValidation():
         return get_service_by_name(name) is not None
 
     @staticmethod
-    def validate_service(name: str, price: int) -> None:
+    def validate_service(name: str, price: int, duration: int) -> None:
         """
         Validates service.
 
         Args:
             name (str): The service's name.
             price (int): The service's price in cents.
+            duration (int): The service's duration in minutes.
 
         Raises:
             HTTPException: If any validation fails.
@@ -68,3 +87,44 @@ class ServiceValidation():
                     'price': ['Invalid price.']
                 }
             })
+
+        if not ServiceValidation._is_duration_in_valid_range(duration):
+            abort(422, errors={
+                'json': {
+                    'duration': ['Invalid duration.']
+                }
+            })
+
+    @staticmethod
+    def validate_services_batch(services: List[Dict[str, Any]]) -> BatchErrors:
+        """
+        Validates a batch of services with the same rules as validate_service.
+
+        Names are checked against the service catalog, and against the
+        previous items of the batch.
+
+        Args:
+            services (List[Dict[str, Any]]): The services 'name', 'price' and 'duration'.
+
+        Returns:
+            BatchErrors: The rejected services.
+        """
+
+        errors: BatchErrors = {}
+        batch_names = set()
+
+        for index, service in enumerate(services):
+            if (service['name'] in batch_names
+                    or ServiceValidation._is_service_already_registered(service['name'])):
+                BulkValidation.add_error(errors, index, 409, 'name',
+                                         'Service already registered.')
+
+            if not ServiceValidation._is_price_in_valid_range(service['price']):
+                BulkValidation.add_error(errors, index, 422, 'price', 'Invalid price.')
+
+            if not ServiceValidation._is_duration_in_valid_range(service['duration']):
+                BulkValidation.add_error(errors, index, 422, 'duration', 'Invalid duration.')
+
+            batch_names.add(service['name'])
+
+        return errors